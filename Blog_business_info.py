@@ -0,0 +1,97 @@
+"""
+블로그 변환 프로그램 v7.6 업체 정보
+- BusinessInfo 데이터 구조와 약칭 생성기
+- 변환 프로그램(GUI)과 일괄 재검증 도구가 함께 사용 (표준 라이브러리만 사용)
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+# ===== 업체 정보 =====
+@dataclass
+class BusinessInfo:
+    """업체 정보"""
+    name: str = ""
+    short_name: str = ""  # 제목용 약칭 (v7.5 신규)
+    seo_keywords: List[str] = field(default_factory=list)
+    address: str = ""
+    hours: str = ""
+    phone: str = ""
+    features: List[str] = field(default_factory=list)
+    menu_items: List[Dict[str, str]] = field(default_factory=list)  # 전체 메뉴 리스트 [{"name": "메뉴명", "price": "가격"}]
+    ordered_items: List[Dict[str, str]] = field(default_factory=list)  # 실제 식사한 메뉴 리스트 [{"name": "메뉴명", "price": "가격"}]
+    atmosphere: str = ""
+    target_customer: str = ""  # 타겟 고객층
+    parking_info: str = ""  # 주차 정보
+    reviews_count: Dict[str, int] = field(default_factory=dict)  # 리뷰 수 {"visitor": 0, "blog": 0}
+    certifications: List[str] = field(default_factory=list)  # 인증 정보 (안심식당 등)
+    accessibility: List[str] = field(default_factory=list)  # 접근성 정보 (휠체어 접근 등)
+    
+    def get_location_name(self) -> str:
+        """주소에서 지역명 추출"""
+        # 예: "경기 고양시 일산동구" → "일산"
+        if "일산" in self.address:
+            return "일산"
+        elif "강남" in self.address:
+            return "강남"
+        elif "목포" in self.address:
+            return "목포"
+        else:
+            # 첫 번째 구/시 이름 사용
+            parts = self.address.split()
+            if len(parts) >= 2:
+                return parts[1].replace("시", "").replace("구", "")
+        return ""
+
+
+# ===== 약칭 생성기 (v7.5 신규) =====
+def generate_short_name(full_name: str) -> str:
+    """업체명에서 제목용 약칭 자동 생성"""
+    
+    # 1. 지점명 제거
+    branch_patterns = ['점', '호점', '역점', '점포', '매장', '지점', 'DT점']
+    for pattern in branch_patterns:
+        if pattern in full_name:
+            # 마지막 패턴 이전까지만 사용
+            parts = full_name.split(pattern)
+            if len(parts) > 1:
+                full_name = parts[0].strip()
+    
+    # 2. 프랜차이즈 패턴 처리
+    franchise_patterns = {
+        '스타벅스': '스타벅스',
+        '맥도날드': '맥도날드',
+        '버거킹': '버거킹',
+        '이디야': '이디야',
+        '투썸플레이스': '투썸',
+        '파리바게뜨': '파바',
+        '뚜레쥬르': '뚜레쥬르'
+    }
+    
+    for franchise, short in franchise_patterns.items():
+        if franchise in full_name:
+            return short
+    
+    # 3. 메뉴명이 포함된 경우 처리
+    # "예향한정식 목포보리굴비" → "예향한정식"
+    words = full_name.split()
+    if len(words) > 2:
+        # 첫 2단어만 사용
+        candidate = ' '.join(words[:2])
+        
+        # 메뉴 관련 단어가 있으면 첫 단어만
+        menu_keywords = ['굴비', '갈비', '삼겹살', '치킨', '피자', '커피', '베이커리', 
+                        '국수', '칼국수', '냉면', '곰탕', '설렁탕', '해물', '회']
+        for keyword in menu_keywords:
+            if keyword in candidate:
+                return words[0]
+        
+        return candidate
+    
+    # 4. 길이 체크
+    if len(full_name) > 10:
+        # 10자 넘으면 첫 단어만
+        return full_name.split()[0]
+    
+    return full_name
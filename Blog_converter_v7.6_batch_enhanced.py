@@ -22,6 +22,10 @@ from tkinter import font as tkfont
 import threading
 from queue import Queue
 import traceback
+from itertools import islice
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 
 # 드래그앤드롭 라이브러리 (선택사항)
 try:
@@ -48,6 +52,11 @@ StyleAnalysis = blog_converter_v76.StyleAnalysis
 BusinessInfo = blog_converter_v76.BusinessInfo
 BlogConverter = blog_converter_v76.BlogConverter
 generate_short_name = blog_converter_v76.generate_short_name  # v7.6의 약칭 생성 함수
+make_feature_seed = blog_converter_v76.make_feature_seed  # 항목별 특징 선택 시드
+
+# 공용 프리셋 저장소 (단일 변환 프로그램과 같은 관리자 사용)
+from Blog_preset_store import BusinessInfoManager as SharedBusinessInfoManager
+from Gui_update_channel import UIUpdateChannel
 
 
 # ===== 고급 배치 처리 설정 =====
@@ -66,142 +75,244 @@ class EnhancedBatchConfig:
 
 
 # ===== 고급 배치 작업 항목 =====
-@dataclass
 class EnhancedBatchItem:
-    """고급 배치 처리 작업 항목"""
-    index: int
-    original_file: str
-    seo_keyword: str
-    business_name: str = ""
-    preset_file: str = ""  # v7.6 신규: 업체별 프리셋 파일 경로
-    status: str = "pending"
-    result: Optional[str] = None
-    error: Optional[str] = None
-    retry_count: int = 0
-    processing_time: float = 0.0
-    generated_file_path: Optional[str] = None  # 생성된 파일 경로 추가
+    """
+    고급 배치 처리 작업 항목 (__slots__ 기반 경량 구조)
+    - 상태는 정수 코드로 저장하고 status 속성으로 문자열 제공
+    - 변환 결과 본문은 저장 즉시 파일로만 보관하고, 메모리에는 파일 경로/오프셋/길이만 유지
+    """
+    STATUS_NAMES = ("pending", "processing", "success", "failed", "skipped")  # skipped: 원본 파일 없음
+    STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+    
+    __slots__ = (
+        'index', 'original_file', 'seo_keyword', 'business_name', 'preset_file',
+        'status_code', 'error', 'retry_count', 'processing_time',
+        'generated_file_path',  # 생성된 파일 경로
+        'result_offset', 'result_length',  # 생성 파일 안의 결과 본문 위치 (바이트)
+        'feature_seed',  # 특징 선택 시드 (항목 재현용)
+        'selected_features',  # 실제 사용된 특징
+    )
+    
+    def __init__(self, index: int, original_file: str, seo_keyword: str,
+                 business_name: str = "", preset_file: str = "", status: str = "pending",
+                 error: Optional[str] = None, retry_count: int = 0, processing_time: float = 0.0,
+                 generated_file_path: Optional[str] = None, feature_seed: Optional[int] = None,
+                 selected_features: Optional[List[str]] = None):
+        self.index = index
+        self.original_file = original_file
+        self.seo_keyword = seo_keyword
+        # 업체명/프리셋 경로는 수많은 행이 같은 값을 가지므로 문자열 하나를 공유
+        self.business_name = sys.intern(business_name)
+        self.preset_file = sys.intern(preset_file)  # v7.6 신규: 업체별 프리셋 파일 경로
+        self.status_code = self.STATUS_CODES[status]
+        self.error = error
+        self.retry_count = retry_count
+        self.processing_time = processing_time
+        self.generated_file_path = generated_file_path
+        self.result_offset: Optional[int] = None
+        self.result_length: Optional[int] = None
+        self.feature_seed = feature_seed
+        self.selected_features = tuple(selected_features or ())
+    
+    def __repr__(self) -> str:
+        return (f"EnhancedBatchItem(index={self.index}, seo_keyword={self.seo_keyword!r}, "
+                f"preset_file={self.preset_file!r}, status={self.status!r})")
+    
+    @property
+    def status(self) -> str:
+        return self.STATUS_NAMES[self.status_code]
+    
+    @status.setter
+    def status(self, value: str):
+        self.status_code = self.STATUS_CODES[value]
+    
+    @property
+    def result(self) -> Optional[str]:
+        """변환 결과 본문 (필요할 때 생성 파일에서 읽음)"""
+        if self.generated_file_path is None or self.result_offset is None:
+            return None
+        
+        with open(self.generated_file_path, 'rb') as f:
+            f.seek(self.result_offset)
+            data = f.read(self.result_length)
+        # 텍스트 모드로 저장되어 Windows에서는 줄바꿈이 \r\n
+        return data.decode('utf-8').replace('\r\n', '\n')
+    
+    def save_result(self, text: str, filepath: str):
+        """결과 본문을 파일에 저장하고 메모리에는 위치만 기록"""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(text)
+            length = f.tell()
+        
+        self.generated_file_path = filepath
+        self.result_offset = 0
+        self.result_length = length
 
 
-# ===== 업체 정보 관리자 =====
-class BusinessInfoManager:
-    """업체 정보 저장/불러오기 관리"""
+# ===== 목록 표시용 행 =====
+class BatchRow:
+    """
+    목록 표시용 CSV 행 (모든 행에 하나씩, 표시 컬럼과 상태 코드만 보관)
+    - 처리 데이터(시드/결과 위치 등)는 EnhancedBatchItem이 처리 중에만 가짐
+    """
+    __slots__ = ('index', 'original_file', 'seo_keyword', 'preset_file', 'status_code')
     
-    def __init__(self, preset_dir: str):
-        self.preset_dir = preset_dir
-        os.makedirs(preset_dir, exist_ok=True)
+    def __init__(self, index: int, original_file: str, seo_keyword: str, preset_file: str = ""):
+        self.index = index
+        self.original_file = original_file
+        self.seo_keyword = seo_keyword
+        self.preset_file = sys.intern(preset_file)
+        self.status_code = 0
     
-    def save_preset(self, business_info: BusinessInfo, filename: str = None) -> str:
-        """업체 정보를 JSON으로 저장"""
-        if not filename:
-            filename = f"{business_info.name}.json"
-        
-        filepath = os.path.join(self.preset_dir, filename)
-        
-        # BusinessInfo를 딕셔너리로 변환
-        data = {
-            'name': business_info.name,
-            'short_name': business_info.short_name,  # v7.5 추가
-            'address': business_info.address,
-            'hours': business_info.hours,
-            'phone': business_info.phone,
-            'features': business_info.features,
-            'menu_items': business_info.menu_items,
-            'ordered_items': business_info.ordered_items,
-            'atmosphere': business_info.atmosphere,
-            'target_customer': business_info.target_customer,
-            'parking_info': business_info.parking_info
-        }
+    @property
+    def status(self) -> str:
+        return EnhancedBatchItem.STATUS_NAMES[self.status_code]
+    
+    @status.setter
+    def status(self, value: str):
+        self.status_code = EnhancedBatchItem.STATUS_CODES[value]
+
+
+# ===== CSV 사전 스캔 결과 =====
+@dataclass
+class CSVScanResult:
+    """CSV 사전 스캔 결과 (항목 객체를 만들지 않고 행 수/프리셋 사용 현황만 집계)"""
+    SAMPLE_ROWS = 5  # 프리셋별로 기록할 행 번호 수 (오류 메시지용)
+    
+    row_count: int = 0
+    preset_rows: Dict[str, List[int]] = field(default_factory=dict)  # 프리셋 → 사용 행 (최대 SAMPLE_ROWS개)
+    preset_counts: Dict[str, int] = field(default_factory=dict)  # 프리셋 → 사용 행 수
+    has_default_rows: bool = False  # 프리셋 미지정 행 존재 여부
+    
+    def add(self, index: int, preset_file: str):
+        """행 하나 집계"""
+        self.row_count += 1
+        if not preset_file:
+            self.has_default_rows = True
+            return
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
-        return filepath
-    
-    def load_preset(self, filename: str) -> BusinessInfo:
-        """JSON에서 업체 정보 불러오기"""
-        filepath = os.path.join(self.preset_dir, filename)
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # BusinessInfo 객체로 변환
-        business_info = BusinessInfo()
-        business_info.name = data.get('name', '')
-        business_info.short_name = data.get('short_name', '')  # v7.5 추가
-        business_info.address = data.get('address', '')
-        business_info.hours = data.get('hours', '')
-        business_info.phone = data.get('phone', '')
-        business_info.features = data.get('features', [])
-        business_info.menu_items = data.get('menu_items', [])
-        business_info.ordered_items = data.get('ordered_items', [])
-        business_info.atmosphere = data.get('atmosphere', '')
-        business_info.target_customer = data.get('target_customer', '')
-        business_info.parking_info = data.get('parking_info', '')
-        
-        # 약칭이 없으면 자동 생성 (v7.5)
-        if not business_info.short_name and business_info.name:
-            business_info.short_name = generate_short_name(business_info.name)
-        
-        return business_info
-    
-    def list_presets(self) -> List[str]:
-        """저장된 프리셋 목록 반환"""
-        files = []
-        for filename in os.listdir(self.preset_dir):
-            if filename.endswith('.json'):
-                files.append(filename)
-        return sorted(files)
+        rows = self.preset_rows.setdefault(preset_file, [])
+        if len(rows) < self.SAMPLE_ROWS:
+            rows.append(index)
+        self.preset_counts[preset_file] = self.preset_counts.get(preset_file, 0) + 1
+    
+    @classmethod
+    def from_items(cls, items: List['EnhancedBatchItem']) -> 'CSVScanResult':
+        """이미 읽은 항목 목록으로 집계"""
+        result = cls()
+        for item in items:
+            result.add(item.index, item.preset_file)
+        return result
+
+
+# ===== 업체 정보 관리자 =====
+class BusinessInfoManager(SharedBusinessInfoManager):
+    """업체 정보 저장/불러오기 관리 (공용 프리셋 저장소 사용)"""
+    
+    def __init__(self, preset_dir: str):
+        super().__init__(preset_dir, BusinessInfo, generate_short_name)
 
 
 # ===== CSV 파서 =====
 class CSVParser:
-    """CSV 파일 파싱"""
+    """CSV 파일 파싱 (스트리밍)"""
+    
+    BATCH_SIZE = 256  # 파일 존재 확인을 묶어서 처리하는 행 수
+    EXISTS_WORKERS = 8  # 파일 존재 확인 쓰레드 수
     
     @staticmethod
-    def parse_enhanced_csv(filepath: str) -> List[EnhancedBatchItem]:
-        """v7.6: CSV 파싱 (파일경로, 키워드, 프리셋파일)"""
-        items = []
-        
-        try:
-            # BOM 처리
-            with open(filepath, 'rb') as f:
-                raw = f.read()
-                if raw.startswith(b'\xef\xbb\xbf'):
-                    raw = raw[3:]
-                content = raw.decode('utf-8')
-            
-            # CSV 파싱
-            reader = csv.DictReader(content.splitlines())
+    def _iter_rows(filepath: str, start_index: int = 0):
+        """(행 번호, 원본파일경로, 키워드, 프리셋파일) 순차 반환 - 필수 필드가 없는 행 제외"""
+        # utf-8-sig: BOM은 스트림 앞에서만 처리되므로 파일 전체를 읽을 필요 없음
+        with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
             
             for idx, row in enumerate(reader):
+                if idx < start_index:
+                    continue
+                
                 # 필수 필드
-                original_file = row.get('원본파일경로', '').strip()
-                seo_keyword = row.get('키워드', '').strip()
+                original_file = (row.get('원본파일경로') or '').strip()
+                seo_keyword = (row.get('키워드') or '').strip()
                 
                 if not original_file or not seo_keyword:
                     continue
                 
-                # 파일 존재 확인
-                if not os.path.exists(original_file):
-                    print(f"경고: 파일이 존재하지 않음 - {original_file}")
-                    continue
-                
                 # v7.6: 프리셋 파일 (선택적)
-                preset_file = row.get('프리셋파일', '').strip()
+                preset_file = (row.get('프리셋파일') or '').strip()
                 
-                item = EnhancedBatchItem(
-                    index=idx,
-                    original_file=original_file,
-                    seo_keyword=seo_keyword,
-                    preset_file=preset_file  # v7.6 신규
-                )
+                yield idx, original_file, seo_keyword, preset_file
+    
+    @staticmethod
+    def _build_items(rows: List[Tuple[int, str, str, str]], exists_results, on_skip=None):
+        """존재 확인 결과에 따라 항목 생성 (on_skip: 건너뛴 행 번호 알림)"""
+        for (idx, original_file, seo_keyword, preset_file), exists in zip(rows, exists_results):
+            # 파일 존재 확인
+            if not exists:
+                print(f"경고: 파일이 존재하지 않음 - {original_file}")
+                if on_skip:
+                    on_skip(idx)
+                continue
+            
+            yield EnhancedBatchItem(
+                index=idx,
+                original_file=original_file,
+                seo_keyword=seo_keyword,
+                preset_file=preset_file  # v7.6 신규
+            )
+    
+    @classmethod
+    def iter_enhanced_csv(cls, filepath: str, start_index: int = 0, on_skip=None):
+        """
+        v7.6: CSV 스트리밍 파싱 (파일경로, 키워드, 프리셋파일)
+        - 파일 핸들에서 한 행씩 읽어 항목을 순서대로 반환 (메모리 사용량 일정)
+        - 파일 존재 확인은 BATCH_SIZE 단위로 쓰레드 풀에서 실행하고,
+          앞 묶음의 항목을 넘기는 동안 다음 묶음 확인을 미리 진행
+        - 원본 파일이 없어 건너뛴 행은 on_skip(행 번호)으로 알림
+        """
+        try:
+            rows = cls._iter_rows(filepath, start_index)
+            
+            with ThreadPoolExecutor(max_workers=cls.EXISTS_WORKERS) as executor:
+                pending = None
+                while True:
+                    batch = list(islice(rows, cls.BATCH_SIZE))
+                    if not batch:
+                        break
+                    
+                    submitted = (batch, executor.map(os.path.exists, [row[1] for row in batch]))
+                    if pending:
+                        yield from cls._build_items(*pending, on_skip)
+                    pending = submitted
                 
-                items.append(item)
+                if pending:
+                    yield from cls._build_items(*pending, on_skip)
+        
+        except Exception as e:
+            raise Exception(f"CSV 파일 파싱 오류: {str(e)}")
+    
+    @classmethod
+    def parse_enhanced_csv(cls, filepath: str) -> List[EnhancedBatchItem]:
+        """v7.6: CSV 전체 파싱 (항목 목록 반환)"""
+        return list(cls.iter_enhanced_csv(filepath))
+    
+    @classmethod
+    def scan_enhanced_csv(cls, filepath: str, rows: Optional[List[BatchRow]] = None) -> CSVScanResult:
+        """
+        CSV 사전 스캔: 항목 생성/파일 확인 없이 행 수와 프리셋 사용 현황만 집계
+        rows를 넘기면 목록 표시용 행(BatchRow)도 함께 채움
+        """
+        result = CSVScanResult()
         
+        try:
+            for idx, original_file, seo_keyword, preset_file in cls._iter_rows(filepath):
+                result.add(idx, preset_file)
+                if rows is not None:
+                    rows.append(BatchRow(idx, original_file, seo_keyword, preset_file))
         except Exception as e:
             raise Exception(f"CSV 파일 파싱 오류: {str(e)}")
         
-        return items
+        return result
 
 
 # ===== 고급 배치 처리기 =====
@@ -213,10 +324,21 @@ class EnhancedBatchProcessor:
         self.batch_config = batch_config
         self.converter = BlogConverter(config)
         self.business_info_manager = BusinessInfoManager(batch_config.preset_dir)
-        self.items: List[EnhancedBatchItem] = []
+        self.items: List[EnhancedBatchItem] = []  # 미리 읽은 항목 (최대 CSV_PRELOAD_ROWS개, 미리보기/사전 점검용)
+        self.rows: List[BatchRow] = []  # 전체 CSV 행의 목록 표시용 상태 (행 번호 순)
+        self.row_indices = array('l')  # rows의 행 번호 (상태 갱신 시 이진 탐색)
+        self.csv_path: Optional[str] = None
+        self.csv_scan: Optional[CSVScanResult] = None
+        self.csv_streaming = False  # 미리 읽은 항목 뒤에 CSV 행이 더 있는지 (처리할 때마다 스트리밍)
+        # 원본 파일이 없어 건너뛴 행 수 (미리 읽기 / 이번 스트리밍) - 진행률 전체 수 보정용
+        self.preload_skipped = 0
+        self.stream_skipped = 0
         self.current_business_info: Optional[BusinessInfo] = None
         self.stop_flag = False
         self.pause_flag = False
+        # 진행 통계 (GUI가 전체 항목을 세지 않도록 처리 중 갱신)
+        self.success_count = 0
+        self.failed_count = 0
         
         # 로깅 설정
         self.setup_logging()
@@ -239,10 +361,71 @@ class EnhancedBatchProcessor:
         )
         self.logger = logging.getLogger(__name__)
     
+    # 미리보기/사전 점검용으로 미리 읽는 항목 수 (나머지는 처리 중 스트리밍, 메모리에 쌓지 않음)
+    CSV_PRELOAD_ROWS = 1000
+    
     def load_csv(self, csv_path: str):
-        """CSV 파일 로드"""
-        self.items = CSVParser.parse_enhanced_csv(csv_path)
-        self.logger.info(f"CSV 파일 로드 완료: {len(self.items)}개 항목")
+        """CSV 파일 로드 (행 수/프리셋/표시용 행만 스캔하고 항목은 앞부분만 미리 읽음)"""
+        self.csv_path = csv_path
+        self.rows = []
+        self.csv_scan = CSVParser.scan_enhanced_csv(csv_path, rows=self.rows)
+        self.row_indices = array('l', (row.index for row in self.rows))
+        self.preload_skipped = 0
+        self.stream_skipped = 0
+        
+        def _on_skip(index: int):
+            self.preload_skipped += 1
+            self.set_row_status(index, "skipped")
+        
+        self.items = list(islice(CSVParser.iter_enhanced_csv(csv_path, on_skip=_on_skip), self.CSV_PRELOAD_ROWS))
+        self.csv_streaming = len(self.items) >= self.CSV_PRELOAD_ROWS
+        self.logger.info(f"CSV 파일 로드 완료: {self.total_count}개 항목")
+    
+    def find_row(self, index: int) -> Optional[BatchRow]:
+        """CSV 행 번호로 표시용 행 찾기"""
+        position = bisect_left(self.row_indices, index)
+        if position < len(self.rows) and self.row_indices[position] == index:
+            return self.rows[position]
+        return None
+    
+    def set_row_status(self, index: int, status: str):
+        """표시용 행 상태 갱신 (작업 쓰레드에서 호출, 목록은 주기적으로 다시 그림)"""
+        row = self.find_row(index)
+        if row is not None:
+            row.status = status
+    
+    def _set_status(self, item: EnhancedBatchItem, status: str):
+        """항목과 표시용 행 상태를 함께 변경"""
+        item.status = status
+        self.set_row_status(item.index, status)
+    
+    @property
+    def total_count(self) -> int:
+        """전체 항목 수 (사전 스캔 행 수 - 지금까지 확인된 원본 없는 행)"""
+        if self.csv_scan:
+            return self.csv_scan.row_count - self.preload_skipped - self.stream_skipped
+        return len(self.items)
+    
+    def iter_items(self, item_callback=None):
+        """처리 대상 항목: 미리 읽은 항목 → 나머지 CSV 행을 읽는 대로 반환 (보관하지 않음)"""
+        loaded = list(self.items)
+        yield from loaded
+        
+        if not self.csv_streaming or not loaded:
+            return
+        
+        self.stream_skipped = 0
+        
+        def _on_skip(index: int):
+            self.stream_skipped += 1
+            self.set_row_status(index, "skipped")
+        
+        for item in CSVParser.iter_enhanced_csv(self.csv_path, start_index=loaded[-1].index + 1, on_skip=_on_skip):
+            if self.current_business_info:
+                item.business_name = self.current_business_info.name
+            if item_callback:
+                item_callback(item)
+            yield item
     
     def set_business_info(self, business_info: BusinessInfo):
         """업체 정보 설정"""
@@ -251,45 +434,117 @@ class EnhancedBatchProcessor:
         for item in self.items:
             item.business_name = business_info.name
     
-    def process_all(self, progress_callback=None, status_callback=None):
-        """v7.6: 전체 처리 (다중 업체 지원)"""
+    def preflight_presets(self) -> Dict[str, BusinessInfo]:
+        """
+        사전 점검: CSV에 나온 프리셋을 병렬로 모두 로드/검증
+        누락되거나 잘못된 프리셋이 하나라도 있으면 전체 목록과 함께 ValueError
+        반환: 프리셋 파일 → BusinessInfo
+        """
         if not self.items:
             raise ValueError("처리할 항목이 없습니다.")
         
-        # v7.6: 업체별 정보 캐시 (동일 프리셋 반복 로드 방지)
-        business_info_cache = {}
-        
-        # v7.6: 첫 번째 항목에서 업체 정보 확인
-        first_item = self.items[0]
-        if first_item.preset_file:
-            # CSV에 프리셋 파일이 지정된 경우
-            try:
-                default_business_info = self.business_info_manager.load_preset(first_item.preset_file)
-            except:
-                # 프리셋 로드 실패시 GUI에서 설정한 정보 사용
-                if not self.current_business_info:
-                    raise ValueError("업체 정보가 설정되지 않았습니다.")
-                default_business_info = self.current_business_info
+        # 프리셋별 사용 행 (스트리밍 중이면 CSV 전체 사전 스캔 결과 사용)
+        if self.csv_streaming and self.csv_scan:
+            usage = self.csv_scan
         else:
-            # 프리셋 파일이 없으면 GUI에서 설정한 정보 사용
-            if not self.current_business_info:
-                raise ValueError("업체 정보가 설정되지 않았습니다.")
-            default_business_info = self.current_business_info
+            usage = CSVScanResult.from_items(self.items)
+        preset_rows = usage.preset_rows
+        needs_default = usage.has_default_rows
+        
+        def _load(preset_file: str) -> BusinessInfo:
+            business_info = self.business_info_manager.load_preset(preset_file)
+            if not business_info.name:
+                raise ValueError("업체명(name)이 비어 있습니다.")
+            return business_info
+        
+        business_infos = {}
+        problems = []
+        if preset_rows:
+            workers = min(8, len(preset_rows))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_load, preset_file): preset_file for preset_file in preset_rows}
+                for future, preset_file in futures.items():
+                    try:
+                        business_infos[preset_file] = future.result()
+                    except FileNotFoundError:
+                        problems.append((preset_file, "파일 없음"))
+                    except Exception as e:
+                        problems.append((preset_file, str(e)))
+        
+        # 프리셋 없는 항목이 첫 번째 프리셋도 GUI 정보도 없이 남는 경우
+        if needs_default and not self.items[0].preset_file and not self.current_business_info:
+            problems.append(("(프리셋 미지정 항목)", "업체 정보가 설정되지 않았습니다."))
+        
+        if problems:
+            lines = []
+            for preset_file, message in problems:
+                rows = preset_rows.get(preset_file, [])
+                row_text = ', '.join(str(row + 1) for row in rows)
+                extra = usage.preset_counts.get(preset_file, 0) - len(rows)
+                if extra > 0:
+                    row_text += f" 외 {extra}개"
+                lines.append(f"- {preset_file}: {message}" + (f" (행: {row_text})" if rows else ""))
+            self.logger.error("프리셋 사전 점검 실패:\n" + '\n'.join(lines))
+            raise ValueError(f"프리셋 사전 점검 실패 ({len(problems)}건):\n" + '\n'.join(lines))
+        
+        self.logger.info(f"프리셋 사전 점검 완료: {len(business_infos)}개")
+        return business_infos
+    
+    def business_info_for(self, item: EnhancedBatchItem, business_info_cache: Dict[str, BusinessInfo]) -> BusinessInfo:
+        """항목의 업체 정보 (프리셋 지정 → 그 프리셋, 미지정 → 첫 번째 항목의 프리셋 또는 GUI 설정)"""
+        preset_file = item.preset_file or self.items[0].preset_file
+        if preset_file:
+            return business_info_cache[preset_file]
+        return self.current_business_info
+    
+    def feature_seed_for(self, item: EnhancedBatchItem, business_info_cache: Dict[str, BusinessInfo]) -> int:
+        """항목의 특징 선택 시드 (미리보기와 실제 처리가 같은 업체명으로 계산하도록 여기서만 생성)"""
+        return make_feature_seed(
+            self.business_info_for(item, business_info_cache).name, item.seo_keyword, item.index,
+            base_seed=self.config.FEATURE_SELECT_SEED
+        )
+    
+    def process_all(self, progress_callback=None, status_callback=None, item_callback=None):
+        """
+        v7.6: 전체 처리 (다중 업체 지원)
+        CSV 뒷부분은 변환하면서 스트리밍으로 읽음 (item_callback: 새로 읽은 항목 알림)
+        """
+        if not self.items:
+            raise ValueError("처리할 항목이 없습니다.")
+        
+        # 사전 점검: 모든 프리셋을 API 호출 전에 로드/검증 (문제가 있으면 여기서 중단)
+        business_info_cache = self.preflight_presets()
+        # 업체별 프롬프트 템플릿 캐시 (메뉴/규칙 문자열은 업체당 한 번만 생성)
+        prepared_prompt_cache = {}
+        
+        # v7.6: 프리셋이 없는 항목은 첫 번째 항목의 프리셋 또는 GUI에서 설정한 정보 사용
+        default_business_info = self.business_info_for(self.items[0], business_info_cache)
+        
+        # coverage 모드: 이번 실행 안에서만 특징을 고르게 분배
+        self.converter.feature_selector.reset_coverage()
         
         # 타임스탬프 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        total_items = len(self.items)
+        total_items = self.total_count
         processed = 0
-        success_count = 0
+        self.success_count = 0
+        self.failed_count = 0
         failed_items = []
+        # 업체별 요약용 항목 기록 (스트리밍 항목은 보관하지 않으므로 요약에 필요한 값만)
+        business_records: Dict[str, List[Dict]] = {}
         
         # v7.6: 업체별 결과 저장을 위한 디렉토리 맵
         output_dirs = {}
         
+        def _business_name_of(item: EnhancedBatchItem) -> str:
+            if item.preset_file and item.preset_file in business_info_cache:
+                return business_info_cache[item.preset_file].name
+            return default_business_info.name
+        
         self.logger.info(f"처리 시작: 총 {total_items}개 항목")
         
-        for item in self.items:
+        for item in self.iter_items(item_callback):
             if self.stop_flag:
                 self.logger.info("사용자에 의해 중지됨")
                 break
@@ -302,19 +557,13 @@ class EnhancedBatchProcessor:
                 with open(item.original_file, 'r', encoding='utf-8') as f:
                     original_text = f.read()
                 
-                # v7.6: 이 항목의 업체 정보 결정
-                if item.preset_file:
-                    # 캐시 확인
-                    if item.preset_file not in business_info_cache:
-                        try:
-                            business_info_cache[item.preset_file] = self.business_info_manager.load_preset(item.preset_file)
-                        except Exception as e:
-                            self.logger.warning(f"프리셋 로드 실패 ({item.preset_file}): {str(e)}")
-                            business_info_cache[item.preset_file] = default_business_info
-                    
-                    current_business_info = business_info_cache[item.preset_file]
-                else:
-                    current_business_info = default_business_info
+                # v7.6: 이 항목의 업체 정보 결정 (사전 점검에서 모두 로드됨)
+                current_business_info = self.business_info_for(item, business_info_cache)
+                
+                prompt_key = item.preset_file or ''
+                if prompt_key not in prepared_prompt_cache:
+                    prepared_prompt_cache[prompt_key] = self.converter.prompt_builder.prepare_business(current_business_info)
+                prepared_prompt = prepared_prompt_cache[prompt_key]
                 
                 # v7.6: 업체별 출력 디렉토리 생성
                 business_name = current_business_info.name
@@ -346,30 +595,33 @@ class EnhancedBatchProcessor:
                 # 이 항목의 키워드로 교체
                 temp_business_info.seo_keywords = [item.seo_keyword]
                 
+                # (업체, 키워드, 행 번호) 기반 시드: 재시도/병렬 실행에서도 같은 특징 선택
+                if item.feature_seed is None:
+                    item.feature_seed = self.feature_seed_for(item, business_info_cache)
+                
                 # 변환 시작
                 start_time = time.time()
-                item.status = "processing"
+                self._set_status(item, "processing")
                 
                 if status_callback:
                     status_callback(item.index, "processing", f"변환 중...")
                 
                 # 변환 수행
-                result = self.converter.convert(original_text, temp_business_info)
+                result = self.converter.convert(
+                    original_text, temp_business_info,
+                    prepared_prompt=prepared_prompt, feature_seed=item.feature_seed
+                )
                 
                 if result['success']:
-                    item.result = result['result']
-                    item.status = "success"
+                    item.selected_features = tuple(result.get('selected_features', ()))
+                    self._set_status(item, "success")
                     item.processing_time = time.time() - start_time
                     
-                    # v7.6: 업체별 디렉토리에 파일 저장
+                    # v7.6: 업체별 디렉토리에 파일 저장 (본문은 메모리에 남기지 않음)
                     filename = f"{business_name}_{item.seo_keyword}.txt"
                     filepath = os.path.join(output_dirs[business_name]['success'], filename)
-                    
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(item.result)
-                    
-                    item.generated_file_path = filepath
-                    success_count += 1
+                    item.save_result(result['result'], filepath)
+                    self.success_count += 1
                     
                     if status_callback:
                         status_callback(item.index, "success", f"완료 ({item.processing_time:.1f}초)")
@@ -380,7 +632,7 @@ class EnhancedBatchProcessor:
             
             except Exception as e:
                 item.error = str(e)
-                item.status = "failed"
+                self._set_status(item, "failed")
                 item.retry_count += 1
                 
                 # 재시도
@@ -390,13 +642,26 @@ class EnhancedBatchProcessor:
                     continue
                 
                 failed_items.append(item)
+                self.failed_count += 1
                 
                 if status_callback:
                     status_callback(item.index, "failed", str(e)[:50])
                 
                 self.logger.error(f"실패: {item.seo_keyword} - {str(e)}")
             
+            finally:
+                business_records.setdefault(_business_name_of(item), []).append({
+                    'index': item.index,
+                    'keyword': item.seo_keyword,
+                    'status': item.status,
+                    'file': os.path.basename(item.generated_file_path) if item.generated_file_path else None,
+                    'feature_seed': item.feature_seed,
+                    'selected_features': list(item.selected_features)
+                })
+            
             processed += 1
+            # 스트리밍 중 원본 없는 행이 확인되면 전체 수도 줄어듦
+            total_items = self.total_count
             
             if progress_callback:
                 progress_callback(processed, total_items)
@@ -405,14 +670,17 @@ class EnhancedBatchProcessor:
             if processed < total_items:
                 time.sleep(self.batch_config.api_delay)
         
+        # 마지막 항목 뒤에서 건너뛴 행까지 반영해 최종 진행률 보정
+        if self.total_count != total_items:
+            total_items = self.total_count
+            if progress_callback:
+                progress_callback(processed, total_items)
+        
         # v7.6: 업체별 실패 항목 정리
         business_failed_items = {}
         for item in failed_items:
             # 이 항목의 업체 결정
-            if item.preset_file and item.preset_file in business_info_cache:
-                business_name = business_info_cache[item.preset_file].name
-            else:
-                business_name = default_business_info.name
+            business_name = _business_name_of(item)
             
             if business_name not in business_failed_items:
                 business_failed_items[business_name] = []
@@ -427,19 +695,20 @@ class EnhancedBatchProcessor:
         all_summaries = {}
         for business_name, dirs in output_dirs.items():
             # 이 업체의 항목 수 계산
-            business_items = [item for item in self.items 
-                            if (item.preset_file and business_name == business_info_cache.get(item.preset_file, default_business_info).name)
-                            or (not item.preset_file and business_name == default_business_info.name)]
+            business_items = business_records.get(business_name, [])
             
-            business_success = len([item for item in business_items if item.status == "success"])
-            business_failed = len([item for item in business_items if item.status == "failed"])
+            business_success = len([record for record in business_items if record['status'] == "success"])
+            business_failed = len([record for record in business_items if record['status'] == "failed"])
             
             summary = {
                 'total': len(business_items),
                 'success': business_success,
                 'failed': business_failed,
                 'business_name': business_name,
-                'timestamp': timestamp
+                'timestamp': timestamp,
+                # 항목별 특징 선택 시드 (make_feature_seed로 개별 항목 재현 가능)
+                'base_seed': self.config.FEATURE_SELECT_SEED,
+                'items': business_items
             }
             
             summary_path = os.path.join(
@@ -455,12 +724,12 @@ class EnhancedBatchProcessor:
         # CSV 파일 업데이트 (생성된 파일 경로 추가)
         self._update_csv_with_paths()
         
-        self.logger.info(f"처리 완료: 성공 {success_count}/{total_items}")
+        self.logger.info(f"처리 완료: 성공 {self.success_count}/{total_items}")
         
         # v7.6: 전체 요약 반환
         return {
             'total': total_items,
-            'success': success_count,
+            'success': self.success_count,
             'failed': len(failed_items),
             'by_business': all_summaries,
             'timestamp': timestamp
@@ -500,6 +769,124 @@ class EnhancedBatchProcessor:
         self.pause_flag = False
 
 
+# ===== 가상 목록 뷰 =====
+class VirtualItemList:
+    """
+    대량 항목용 가상 목록 뷰
+    - Treeview에는 화면에 보이는 행 수만큼만 행을 두고, 스크롤 위치에 맞춰 값만 교체
+    - 항목 데이터는 source()가 돌려주는 목록(processor.rows: 전체 CSV 행의 BatchRow)을 그대로 사용 (복사본 없음)
+    - 상태 변경은 mark_dirty()로 표시만 하고 REFRESH_MS 주기로 한 번에 다시 그림 (작업 쓰레드에서 호출 가능)
+    """
+    REFRESH_MS = 100
+    COLUMNS = ('번호', '원본파일', '키워드', '프리셋', '상태')  # v7.6: 프리셋 컬럼 추가
+    STATUS_COLORS = {'success': 'green', 'failed': 'red', 'processing': 'blue', 'skipped': 'gray'}
+    
+    def __init__(self, parent, source, height: int = 15):
+        self.source = source
+        self.first = 0  # 화면 첫 행의 항목 위치
+        self.visible_rows = height
+        self._dirty = False
+        
+        self.tree = ttk.Treeview(parent, columns=self.COLUMNS, show='headings', height=height)
+        for col in self.COLUMNS:
+            self.tree.heading(col, text=col)
+            if col == '원본파일':
+                self.tree.column(col, width=200)
+            elif col == '프리셋':
+                self.tree.column(col, width=150)
+            else:
+                self.tree.column(col, width=120)
+        
+        for status, color in self.STATUS_COLORS.items():
+            self.tree.tag_configure(status, foreground=color)
+        
+        # 스크롤바는 Treeview가 아니라 항목 위치를 움직임
+        self.vsb = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
+        
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))  # Linux
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        
+        self.tree.after(self.REFRESH_MS, self._tick)
+    
+    def mark_dirty(self):
+        """다음 주기에 다시 그리도록 표시 (쓰레드 안전: 플래그만 설정)"""
+        self._dirty = True
+    
+    def refresh(self):
+        """처음 위치로 이동하여 즉시 다시 그림 (CSV 새로 로드 시)"""
+        self.first = 0
+        self.render()
+    
+    def scroll(self, rows: int):
+        self.first += rows
+        self.render()
+        return "break"
+    
+    def _tick(self):
+        if self._dirty:
+            self._dirty = False
+            self.render()
+        self.tree.after(self.REFRESH_MS, self._tick)
+    
+    def _on_configure(self, event):
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        # 헤더 한 줄 제외
+        self.visible_rows = max(1, event.height // row_height - 1)
+        self.render()
+    
+    def _on_mousewheel(self, event):
+        # Windows는 120 단위, macOS는 1 단위
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-3 * step)
+    
+    def _on_scrollbar(self, *args):
+        total = len(self.source())
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self.first += amount * (self.visible_rows if args[2] == 'pages' else 1)
+        self.render()
+    
+    @staticmethod
+    def _row_values(item: BatchRow) -> Tuple:
+        # 프리셋 파일명만 표시 (경로 제외)
+        preset_display = os.path.basename(item.preset_file) if item.preset_file else "GUI 설정"
+        return (
+            item.index + 1,
+            os.path.basename(item.original_file),
+            item.seo_keyword,
+            preset_display,
+            item.status
+        )
+    
+    def render(self):
+        """현재 스크롤 위치의 항목만 Treeview 행에 반영"""
+        items = self.source()
+        total = len(items)
+        self.first = max(0, min(self.first, total - self.visible_rows))
+        window = items[self.first:self.first + self.visible_rows]
+        
+        rows = list(self.tree.get_children())
+        while len(rows) < len(window):
+            rows.append(self.tree.insert('', 'end'))
+        for row_id in rows[len(window):]:
+            self.tree.delete(row_id)
+        
+        for row_id, item in zip(rows, window):
+            self.tree.item(row_id, values=self._row_values(item), tags=(item.status,))
+        
+        if total:
+            self.vsb.set(self.first / total, min(1.0, (self.first + len(window)) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+
 # ===== GUI 인터페이스 =====
 class EnhancedBatchGUI:
     """고급 배치 처리 GUI"""
@@ -523,11 +910,13 @@ class EnhancedBatchGUI:
         
         # GUI 컴포넌트
         self.csv_path_var = tk.StringVar()
-        self.items_tree = None
+        self.item_list = None
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar(value="대기 중")
         
         self.setup_ui()
+        # 처리 쓰레드 → GUI 업데이트 채널 (로그는 최근 3000줄만 유지)
+        self.ui = UIUpdateChannel(self.root, log_widget=self.log_text, max_log_lines=3000)
         self.load_config()
     
     def setup_ui(self):
@@ -720,25 +1109,10 @@ class EnhancedBatchGUI:
         content_frame = ttk.LabelFrame(csv_frame, text="CSV 내용", padding=10)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        # 트리뷰
-        columns = ('번호', '원본파일', '키워드', '프리셋', '상태')  # v7.6: 프리셋 컬럼 추가
-        self.items_tree = ttk.Treeview(content_frame, columns=columns, show='headings', height=15)
-        
-        for col in columns:
-            self.items_tree.heading(col, text=col)
-            if col == '원본파일':
-                self.items_tree.column(col, width=200)
-            elif col == '프리셋':
-                self.items_tree.column(col, width=150)
-            else:
-                self.items_tree.column(col, width=120)
-        
-        # 스크롤바
-        vsb = ttk.Scrollbar(content_frame, orient="vertical", command=self.items_tree.yview)
-        self.items_tree.configure(yscrollcommand=vsb.set)
-        
-        self.items_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        # 가상 목록 (보이는 행만 그림)
+        self.item_list = VirtualItemList(
+            content_frame, lambda: self.processor.rows if self.processor else [], height=15
+        )
         
         # CSV 정보
         self.csv_info_label = ttk.Label(csv_frame, text="")
@@ -761,6 +1135,10 @@ class EnhancedBatchGUI:
         ttk.Checkbutton(process_frame, text="배치 모드 (여러 업체 연속 처리)", 
                        variable=self.batch_mode_var).pack(anchor=tk.W, pady=5)
         
+        self.feature_balance_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(process_frame, text="특징 균등 분배 (덜 사용된 특징 우선, [필수] 항목은 항상 포함)", 
+                       variable=self.feature_balance_var).pack(anchor=tk.W, pady=5)
+        
         # 재시도 설정
         retry_frame = ttk.LabelFrame(options_frame, text="재시도 설정", padding=20)
         retry_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -890,52 +1268,33 @@ class EnhancedBatchGUI:
         try:
             self.csv_path_var.set(filepath)
             
-            # 프로세서 초기화
-            if not self.processor:
-                self.processor = EnhancedBatchProcessor(self.config, self.batch_config)
-            
             # CSV 로드
-            self.processor.load_csv(filepath)
+            self.get_processor().load_csv(filepath)
             
             # 트리뷰 업데이트
             self.update_tree_view()
             
             # 정보 업데이트
             self.csv_label.config(text=os.path.basename(filepath))
-            self.csv_info_label.config(text=f"총 {len(self.processor.items)}개 항목")
+            self.csv_info_label.config(text=f"총 {self.processor.total_count}개 항목")
             
             # 예상 비용 계산
             self.update_usage_estimate()
             
-            self.log_message(f"CSV 파일 로드: {len(self.processor.items)}개 항목")
+            self.log_message(f"CSV 파일 로드: {self.processor.total_count}개 항목")
             
         except Exception as e:
             messagebox.showerror("오류", f"CSV 파일 로드 실패: {str(e)}")
             self.log_message(f"CSV 로드 오류: {str(e)}")
     
     def update_tree_view(self):
-        """v7.6: 트리뷰 업데이트 (프리셋 표시)"""
-        # 기존 항목 삭제
-        for item in self.items_tree.get_children():
-            self.items_tree.delete(item)
-        
-        # 새 항목 추가
-        for batch_item in self.processor.items:
-            # 프리셋 파일명만 표시 (경로 제외)
-            preset_display = os.path.basename(batch_item.preset_file) if batch_item.preset_file else "GUI 설정"
-            
-            self.items_tree.insert('', 'end', values=(
-                batch_item.index + 1,
-                os.path.basename(batch_item.original_file),
-                batch_item.seo_keyword,
-                preset_display,
-                batch_item.status
-            ))
+        """v7.6: 항목 목록 다시 그리기 (프리셋 표시)"""
+        self.item_list.refresh()
     
     def update_usage_estimate(self):
         """API 사용량 예측"""
         if self.processor and self.processor.items:
-            item_count = len(self.processor.items)
+            item_count = self.processor.total_count
             # 예상 토큰 (변환 + 제목 생성)
             est_tokens = item_count * 3500  # 변환 3000 + 제목 500
             est_cost = est_tokens * 0.00002  # 대략적인 가격
@@ -945,9 +1304,15 @@ class EnhancedBatchGUI:
                      f"예상 비용: ${est_cost:.2f} (약 {int(est_cost * 1300):,}원)"
             )
     
+    def get_processor(self) -> EnhancedBatchProcessor:
+        """프로세서 (처음 필요할 때 생성, 프리셋 저장소 연결도 함께 재사용)"""
+        if not self.processor:
+            self.processor = EnhancedBatchProcessor(self.config, self.batch_config)
+        return self.processor
+    
     def load_preset(self):
         """프리셋 불러오기"""
-        manager = BusinessInfoManager(self.batch_config.preset_dir)
+        manager = self.get_processor().business_info_manager
         presets = manager.list_presets()
         
         if not presets:
@@ -995,7 +1360,7 @@ class EnhancedBatchGUI:
             filename += '.json'
         
         try:
-            manager = BusinessInfoManager(self.batch_config.preset_dir)
+            manager = self.get_processor().business_info_manager
             filepath = manager.save_preset(self.business_info, filename)
             messagebox.showinfo("성공", f"프리셋이 저장되었습니다:\n{filepath}")
             self.log_message(f"프리셋 저장: {filename}")
@@ -1142,6 +1507,7 @@ class EnhancedBatchGUI:
         self.batch_config.max_retries = self.retry_var.get()
         self.batch_config.api_delay = self.delay_var.get()
         self.batch_config.output_base_dir = self.output_var.get()
+        self.config.FEATURE_SELECT_MODE = "coverage" if self.feature_balance_var.get() else "random"
         
         # 프로세서 업데이트
         self.processor.config = self.config
@@ -1162,42 +1528,51 @@ class EnhancedBatchGUI:
     def run_processing(self):
         """처리 실행 (쓰레드)"""
         try:
+            # 유료 API 호출(미리보기 포함) 전에 프리셋 사전 점검
+            business_info_cache = self.processor.preflight_presets()
+            
             # 첫 번째 미리보기 (옵션)
             if self.batch_config.preview_first:
-                # 첫 번째 항목만 처리
+                # 첫 번째 항목만 처리 (실제 처리와 같은 업체 정보/시드 → 같은 결과 재현)
                 first_item = self.processor.items[0]
                 with open(first_item.original_file, 'r', encoding='utf-8') as f:
                     original_text = f.read()
                 
                 temp_business_info = BusinessInfo()
-                for key, value in self.business_info.__dict__.items():
+                for key, value in self.processor.business_info_for(first_item, business_info_cache).__dict__.items():
                     setattr(temp_business_info, key, value)
                 temp_business_info.seo_keywords = [first_item.seo_keyword]
                 
-                result = self.processor.converter.convert(original_text, temp_business_info)
+                feature_seed = self.processor.feature_seed_for(first_item, business_info_cache)
+                result = self.processor.converter.convert(
+                    original_text, temp_business_info, feature_seed=feature_seed
+                )
                 
                 if result['success']:
-                    # 미리보기 표시
-                    self.root.after(0, self.show_preview, result['result'], first_item.seo_keyword)
+                    # 미리보기 표시 (대화상자가 뜨기 전에 대기 상태로 설정)
+                    self.preview_waiting = True
+                    self.preview_cancelled = False
+                    self.ui.post(self.show_preview, result['result'], first_item.seo_keyword)
                     # 사용자 확인 대기
                     while hasattr(self, 'preview_waiting') and self.preview_waiting:
                         time.sleep(0.1)
                     
                     if hasattr(self, 'preview_cancelled') and self.preview_cancelled:
-                        self.root.after(0, self.on_processing_cancelled)
+                        self.ui.post(self.on_processing_cancelled)
                         return
             
             # 전체 처리
             summary = self.processor.process_all(
                 progress_callback=self.update_progress,
-                status_callback=self.update_item_status
+                status_callback=self.update_item_status,
+                item_callback=lambda item: self.item_list.mark_dirty()
             )
             
             # 완료
-            self.root.after(0, self.on_processing_complete, summary)
+            self.ui.post(self.on_processing_complete, summary)
             
         except Exception as e:
-            self.root.after(0, self.on_processing_error, str(e))
+            self.ui.post(self.on_processing_error, str(e))
     
     def show_preview(self, result: str, keyword: str):
         """첫 번째 결과 미리보기"""
@@ -1235,7 +1610,7 @@ class EnhancedBatchGUI:
     def update_progress(self, current: int, total: int):
         """진행률 업데이트"""
         percentage = (current / total) * 100
-        self.root.after(0, self._update_progress_ui, current, total, percentage)
+        self.ui.post_latest('progress', self._update_progress_ui, current, total, percentage)
     
     def _update_progress_ui(self, current: int, total: int, percentage: float):
         """진행률 UI 업데이트"""
@@ -1244,40 +1619,14 @@ class EnhancedBatchGUI:
         
         # 통계 업데이트
         if self.processor:
-            success_count = sum(1 for item in self.processor.items if item.status == "success")
-            failed_count = sum(1 for item in self.processor.items if item.status == "failed")
-            
             self.stats_label.config(
-                text=f"성공: {success_count} | 실패: {failed_count} | 대기: {total - current}"
+                text=f"성공: {self.processor.success_count} | 실패: {self.processor.failed_count} | 대기: {total - current}"
             )
     
     def update_item_status(self, index: int, status: str, message: str):
-        """항목 상태 업데이트"""
-        self.root.after(0, self._update_item_status_ui, index, status, message)
-    
-    def _update_item_status_ui(self, index: int, status: str, message: str):
-        """항목 상태 UI 업데이트"""
-        # 트리뷰 업데이트
-        item_id = self.items_tree.get_children()[index]
-        values = list(self.items_tree.item(item_id)['values'])
-        values[3] = status
-        self.items_tree.item(item_id, values=values)
-        
-        # 색상 변경
-        if status == "success":
-            self.items_tree.item(item_id, tags=('success',))
-        elif status == "failed":
-            self.items_tree.item(item_id, tags=('failed',))
-        elif status == "processing":
-            self.items_tree.item(item_id, tags=('processing',))
-        
-        # 로그 추가
-        self.log_message(f"[{index+1}] {status}: {message}")
-        
-        # 태그 설정
-        self.items_tree.tag_configure('success', foreground='green')
-        self.items_tree.tag_configure('failed', foreground='red')
-        self.items_tree.tag_configure('processing', foreground='blue')
+        """항목 상태 업데이트 (목록은 주기적으로 한 번에 다시 그림)"""
+        self.item_list.mark_dirty()
+        self.ui.log(f"[{index+1}] {status}: {message}")
     
     def on_processing_complete(self, summary: Dict):
         """처리 완료"""
@@ -1340,10 +1689,8 @@ class EnhancedBatchGUI:
                 self.status_var.set("처리 중...")
     
     def log_message(self, message: str):
-        """로그 메시지 추가"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        """로그 메시지 추가 (어느 쓰레드에서나 호출 가능)"""
+        self.ui.log(message)
     
     def run(self):
         """GUI 실행"""
@@ -27,6 +27,13 @@ except ImportError as e:
     print(f"필요한 라이브러리를 설치해주세요: pip install openai")
     raise e
 
+# 공용 프리셋 저장소 (업체정보/키워드셋/예시원고)
+from Blog_preset_store import (
+    BusinessInfoManager as SharedBusinessInfoManager,
+    KeywordPresetManager,
+    ExampleManager,
+)
+
 
 # ===== 설정 클래스 =====
 @dataclass
@@ -122,113 +129,11 @@ class BusinessInfo:
 
 
 # ===== 프리셋 관리자 =====
-class BusinessInfoManager:
-    """업체 정보 저장/불러오기 관리"""
-    
-    def __init__(self, preset_dir: str):
-        self.preset_dir = preset_dir
-        os.makedirs(preset_dir, exist_ok=True)
-    
-    def save_preset(self, business_info: BusinessInfo, filename: str = None) -> str:
-        """업체 정보를 JSON으로 저장"""
-        if not filename:
-            filename = f"{business_info.name}.json"
-        
-        filepath = os.path.join(self.preset_dir, filename)
-        
-        # BusinessInfo를 딕셔너리로 변환
-        data = {
-            'name': business_info.name,
-            'short_name': business_info.short_name,  # v7.5 약칭 포함
-            'seo_keywords': business_info.seo_keywords,
-            'address': business_info.address,
-            'hours': business_info.hours,
-            'phone': business_info.phone,
-            'features': business_info.features,
-            'menu_items': business_info.menu_items,
-            'ordered_items': business_info.ordered_items,
-            'atmosphere': business_info.atmosphere,
-            'target_customer': business_info.target_customer,
-            'parking_info': business_info.parking_info
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
-        return filepath
-    
-    def load_preset(self, filepath: str) -> BusinessInfo:
-        """JSON에서 업체 정보 불러오기"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        business_info = BusinessInfo()
-        for key, value in data.items():
-            if hasattr(business_info, key):
-                setattr(business_info, key, value)
-        
-        return business_info
-    
-    def list_presets(self) -> List[str]:
-        """저장된 프리셋 목록"""
-        presets = []
-        for file in os.listdir(self.preset_dir):
-            if file.endswith('.json'):
-                presets.append(file)
-        return sorted(presets)
-
-
-class KeywordPresetManager:
-    """SEO 키워드 프리셋 관리"""
+class BusinessInfoManager(SharedBusinessInfoManager):
+    """업체 정보 저장/불러오기 관리 (공용 프리셋 저장소 사용)"""
     
     def __init__(self, preset_dir: str):
-        self.preset_dir = preset_dir
-        os.makedirs(preset_dir, exist_ok=True)
-    
-    def save_preset(self, name: str, keywords: List[str]) -> str:
-        """키워드 세트를 JSON으로 저장"""
-        filepath = os.path.join(self.preset_dir, f"{name}.json")
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(keywords, f, ensure_ascii=False, indent=2)
-        
-        return filepath
-    
-    def load_preset(self, filename: str) -> List[str]:
-        """JSON에서 키워드 세트 불러오기"""
-        filepath = os.path.join(self.preset_dir, filename)
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    
-    def list_presets(self) -> List[str]:
-        """저장된 키워드 프리셋 목록"""
-        presets = []
-        for file in os.listdir(self.preset_dir):
-            if file.endswith('.json'):
-                presets.append(file)
-        return sorted(presets)
-
-
-class ExampleManager:
-    """예시 원고 관리"""
-    
-    def __init__(self, example_dir: str):
-        self.example_dir = example_dir
-        os.makedirs(example_dir, exist_ok=True)
-    
-    def list_examples(self) -> List[str]:
-        """예시 파일 목록"""
-        examples = []
-        for file in os.listdir(self.example_dir):
-            if file.endswith('.txt'):
-                examples.append(file)
-        return sorted(examples)
-    
-    def load_example(self, filename: str) -> str:
-        """예시 파일 내용 읽기"""
-        filepath = os.path.join(self.example_dir, filename)
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        super().__init__(preset_dir, BusinessInfo, generate_short_name)
 
 
 # ===== 유틸리티 함수 =====
@@ -329,15 +234,14 @@ class FeatureSelector:
         if len(features) <= self.min_count:
             return features
         
-        # 랜덤 시드 설정
-        if seed is not None:
-            random.seed(seed)
+        # 호출별 독립 난수 생성기 (전역 random 상태를 건드리지 않음, seed=None이면 매번 다른 선택)
+        rng = random.Random(seed)
         
         # 선택할 개수 결정 (min_count ~ max_count)
-        count = random.randint(self.min_count, min(self.max_count, len(features)))
+        count = rng.randint(self.min_count, min(self.max_count, len(features)))
         
         # 랜덤 선택
-        selected = random.sample(features, count)
+        selected = rng.sample(features, count)
         
         return selected
 
@@ -999,8 +903,7 @@ class BlogConverterGUI:
             if selection:
                 filename = listbox.get(selection[0])
                 try:
-                    filepath = os.path.join(self.config.BUSINESS_PRESET_DIR, filename)
-                    business_info = self.business_manager.load_preset(filepath)
+                    business_info = self.business_manager.load_preset(filename)
                     self.apply_business_info(business_info)
                     self.update_status(f"프리셋을 불러왔습니다: {filename}")
                     dialog.destroy()
@@ -0,0 +1,276 @@
+"""
+블로그 변환 결과 일괄 재검증 도구 v7.6
+- output/<업체>_<타임스탬프>/성공/*.txt 결과물을 변환 없이 현재 규칙으로 다시 검사
+- os.scandir 기반 폴더 탐색
+- 업체별 프리셋 자동 매칭 (공용 프리셋 저장소의 업체명 인덱스)
+- 프로세스 풀 병렬 검증 (글자수, SEO 키워드, 반복 문장, 마커)
+- CSV/JSON 통합 리포트 생성
+
+사용법:
+    python Blog_converter_v7.6_revalidate.py [출력폴더] [--preset-dir 업체정보] [--report 리포트.csv] [--workers 4]
+"""
+
+import os
+import re
+import csv
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+# v7.6의 검증 로직 임포트 (GUI/OpenAI 없는 공용 모듈만 사용 → 프로세스 풀 작업자가 가볍게 시작)
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Blog_business_info import BusinessInfo, generate_short_name
+from Blog_result_validator import validate_result
+from Blog_preset_store import BusinessInfoManager
+
+
+# 배치 출력 폴더명: <업체명>_<YYYYmmdd_HHMMSS>
+RUN_DIR_PATTERN = re.compile(r'^(?P<business>.+)_(?P<timestamp>\d{8}_\d{6})$')
+SUCCESS_DIR_NAME = "성공"
+
+# 리포트 컬럼
+REPORT_FIELDS = [
+    'business_name', 'run', 'file', 'keyword', 'title',
+    'char_count', 'char_valid', 'seo_total', 'seo_valid',
+    'has_repetition', 'repeated_count', 'marker_valid', 'marker_issues',
+    'preset_found', 'error'
+]
+
+
+# ===== 프리셋 인덱스 =====
+def load_preset_index(preset_dir: str, business_names: List[str]) -> Dict[str, Dict]:
+    """업체명 → 프리셋 데이터 매핑 (공용 프리셋 저장소의 업체명 인덱스 사용)"""
+    index = {}
+    if not os.path.isdir(preset_dir):
+        return index
+
+    manager = BusinessInfoManager(preset_dir, BusinessInfo, generate_short_name)
+    for business_name in business_names:
+        for filename in manager.find_by_name(business_name):
+            try:
+                index[business_name] = asdict(manager.load_preset(filename))
+                break
+            except (OSError, ValueError):
+                continue
+
+    return index
+
+
+def list_run_dirs(output_dir: str) -> List[Tuple[str, str, str]]:
+    """배치 출력 폴더 목록: (폴더명, 경로, 업체명)"""
+    runs = []
+    with os.scandir(output_dir) as run_entries:
+        for run_entry in run_entries:
+            if not run_entry.is_dir():
+                continue
+
+            match = RUN_DIR_PATTERN.match(run_entry.name)
+            if match:  # 로그 폴더 등은 제외
+                runs.append((run_entry.name, run_entry.path, match.group('business')))
+    return runs
+
+
+# ===== 결과 파일 탐색 =====
+def collect_tasks(runs: List[Tuple[str, str, str]], preset_index: Dict[str, Dict]) -> List[Dict]:
+    """배치 출력 폴더를 훑어 검증 작업 목록 생성"""
+    tasks = []
+
+    for run_name, run_path, business_name in runs:
+        success_dir = os.path.join(run_path, SUCCESS_DIR_NAME)
+        if not os.path.isdir(success_dir):
+            continue
+
+        preset = preset_index.get(business_name)
+
+        with os.scandir(success_dir) as file_entries:
+            for file_entry in file_entries:
+                if file_entry.is_file() and file_entry.name.endswith('.txt'):
+                    tasks.append({
+                        'path': file_entry.path,
+                        'business_name': business_name,
+                        'run': run_name,
+                        'preset': preset
+                    })
+
+    tasks.sort(key=lambda t: (t['run'], t['path']))
+    return tasks
+
+
+def _keyword_from_filename(filename: str, business_name: str) -> str:
+    """결과 파일명(<업체명>_<키워드>.txt)에서 키워드 추출"""
+    stem = os.path.splitext(filename)[0]
+    prefix = f"{business_name}_"
+    if stem.startswith(prefix):
+        return stem[len(prefix):]
+    return ""
+
+
+def _split_title(text: str):
+    """'제목:...' 줄 분리 (검증은 제목 추가 전 본문 기준)"""
+    if text.startswith('제목:'):
+        title_line, _, body = text.partition('\n')
+        return title_line[len('제목:'):].strip(), body.lstrip('\n')
+    return "", text
+
+
+# ===== 검증 작업 (프로세스 풀) =====
+def validate_file(task: Dict) -> Dict:
+    """결과 파일 하나를 검증하여 리포트 행 반환"""
+    filename = os.path.basename(task['path'])
+    business_name = task['business_name']
+    row = {
+        'business_name': business_name,
+        'run': task['run'],
+        'file': filename,
+        'keyword': '',
+        'title': '',
+        'preset_found': task['preset'] is not None,
+        'error': ''
+    }
+
+    try:
+        with open(task['path'], 'r', encoding='utf-8') as f:
+            text = f.read()
+
+        # 배치 처리와 동일하게 프리셋 정보 + 항목 키워드로 업체 정보 구성
+        business_info = BusinessInfo()
+        for key, value in (task['preset'] or {}).items():
+            if hasattr(business_info, key):
+                setattr(business_info, key, value)
+        business_info.name = business_name
+
+        keyword = _keyword_from_filename(filename, business_name)
+        if keyword:
+            business_info.seo_keywords = [keyword]
+        row['keyword'] = ', '.join(business_info.seo_keywords)
+
+        title, body = _split_title(text)
+        row['title'] = title
+
+        # 원본 파일은 보관되지 않으므로 글자수는 현재 설정 범위로 판정
+        validation = validate_result(body, None, business_info)
+
+        row.update({
+            'char_count': validation['char_count'],
+            'char_valid': validation['char_valid'],
+            'seo_total': validation['seo_total'],
+            'seo_valid': validation['seo_valid'],
+            'has_repetition': validation['has_repetition'],
+            'repeated_count': len(validation['repeated_sentences']),
+            'marker_valid': validation['marker_valid'],
+            'marker_issues': '; '.join(validation['marker_issues'])
+        })
+
+    except Exception as e:
+        row['error'] = str(e)
+
+    return row
+
+
+def run_validation(tasks: List[Dict], workers: Optional[int] = None) -> List[Dict]:
+    """프로세스 풀에서 전체 검증 실행 (입력 순서 유지)"""
+    if not tasks:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    # 작은 작업이 많으므로 묶어서 전달 (프로세스 간 통신 비용 절감)
+    chunksize = max(1, min(256, len(tasks) // (workers * 4) or 1))
+
+    if workers == 1:
+        return [validate_file(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_file, tasks, chunksize=chunksize))
+
+
+# ===== 리포트 =====
+def summarize(rows: List[Dict]) -> Dict:
+    """업체별/전체 요약"""
+    def _empty():
+        return {'total': 0, 'errors': 0, 'char_invalid': 0, 'seo_invalid': 0,
+                'repetition': 0, 'marker_invalid': 0}
+
+    overall = _empty()
+    by_business = {}
+
+    for row in rows:
+        for bucket in (overall, by_business.setdefault(row['business_name'], _empty())):
+            bucket['total'] += 1
+            if row['error']:
+                bucket['errors'] += 1
+                continue
+            if not row['char_valid']:
+                bucket['char_invalid'] += 1
+            if not row['seo_valid']:
+                bucket['seo_invalid'] += 1
+            if row['has_repetition']:
+                bucket['repetition'] += 1
+            if not row['marker_valid']:
+                bucket['marker_invalid'] += 1
+
+    return {'overall': overall, 'by_business': by_business}
+
+
+def write_reports(rows: List[Dict], summary: Dict, report_path: str) -> List[str]:
+    """CSV + JSON 리포트 저장"""
+    base, _ = os.path.splitext(report_path)
+    csv_path = base + '.csv'
+    json_path = base + '.json'
+
+    report_dir = os.path.dirname(os.path.abspath(csv_path))
+    os.makedirs(report_dir, exist_ok=True)
+
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({'summary': summary, 'items': rows}, f, ensure_ascii=False, indent=2)
+
+    return [csv_path, json_path]
+
+
+# ===== 메인 실행 =====
+def main():
+    parser = argparse.ArgumentParser(description="블로그 변환 결과 일괄 재검증")
+    parser.add_argument('output_dir', nargs='?', default="output", help="배치 출력 폴더 (기본값: output)")
+    parser.add_argument('--preset-dir', default="업체정보", help="업체 프리셋 폴더 (기본값: 업체정보)")
+    parser.add_argument('--report', default=None, help="리포트 경로 (.csv/.json 모두 생성)")
+    parser.add_argument('--workers', type=int, default=None, help="검증 프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.output_dir):
+        parser.error(f"출력 폴더가 없습니다: {args.output_dir}")
+
+    start_time = time.time()
+
+    runs = list_run_dirs(args.output_dir)
+    preset_index = load_preset_index(args.preset_dir, sorted({run[2] for run in runs}))
+    tasks = collect_tasks(runs, preset_index)
+    print(f"검증 대상: {len(tasks)}개 파일 (프리셋 {len(preset_index)}개)")
+
+    rows = run_validation(tasks, args.workers)
+    summary = summarize(rows)
+
+    report_path = args.report or os.path.join(
+        args.output_dir, f"검증리포트_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    )
+    paths = write_reports(rows, summary, report_path)
+
+    overall = summary['overall']
+    print(f"검증 완료 ({time.time() - start_time:.1f}초): 총 {overall['total']}개")
+    print(f"  글자수 이탈: {overall['char_invalid']} | SEO 이탈: {overall['seo_invalid']} | "
+          f"반복: {overall['repetition']} | 마커 문제: {overall['marker_invalid']} | 오류: {overall['errors']}")
+    for path in paths:
+        print(f"리포트 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ import os
 import re
 import json
 import random
+import hashlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -19,6 +20,10 @@ from tkinter import filedialog, messagebox, scrolledtext, ttk
 import threading
 import time
 
+# 업체 정보/결과 검증 (재검증 도구와 공용, 표준 라이브러리만 사용)
+from Blog_business_info import BusinessInfo, generate_short_name
+from Blog_result_validator import validate_result
+
 # 외부 라이브러리
 try:
     from openai import OpenAI
@@ -50,6 +55,7 @@ class Config:
     FEATURE_SELECT_MIN: int = 7      # 최소 선택 개수
     FEATURE_SELECT_MAX: int = 8      # 최대 선택 개수
     FEATURE_SELECT_SEED: Optional[int] = None  # 랜덤 시드 (None이면 매번 다름)
+    FEATURE_SELECT_MODE: str = "random"  # "random": 항목별 독립 선택, "coverage": 배치 내 균등 분배
     
     # 특징 개수 권장값 (GUI 표시용)
     FEATURE_RECOMMENDED_MIN: int = 15   # 권장 최소 개수
@@ -82,94 +88,6 @@ class StyleAnalysis:
         return '\n'.join(desc)
 
 
-@dataclass
-class BusinessInfo:
-    """업체 정보"""
-    name: str = ""
-    short_name: str = ""  # 제목용 약칭 (v7.5 신규)
-    seo_keywords: List[str] = field(default_factory=list)
-    address: str = ""
-    hours: str = ""
-    phone: str = ""
-    features: List[str] = field(default_factory=list)
-    menu_items: List[Dict[str, str]] = field(default_factory=list)  # 전체 메뉴 리스트 [{"name": "메뉴명", "price": "가격"}]
-    ordered_items: List[Dict[str, str]] = field(default_factory=list)  # 실제 식사한 메뉴 리스트 [{"name": "메뉴명", "price": "가격"}]
-    atmosphere: str = ""
-    target_customer: str = ""  # 타겟 고객층
-    parking_info: str = ""  # 주차 정보
-    reviews_count: Dict[str, int] = field(default_factory=dict)  # 리뷰 수 {"visitor": 0, "blog": 0}
-    certifications: List[str] = field(default_factory=list)  # 인증 정보 (안심식당 등)
-    accessibility: List[str] = field(default_factory=list)  # 접근성 정보 (휠체어 접근 등)
-    
-    def get_location_name(self) -> str:
-        """주소에서 지역명 추출"""
-        # 예: "경기 고양시 일산동구" → "일산"
-        if "일산" in self.address:
-            return "일산"
-        elif "강남" in self.address:
-            return "강남"
-        elif "목포" in self.address:
-            return "목포"
-        else:
-            # 첫 번째 구/시 이름 사용
-            parts = self.address.split()
-            if len(parts) >= 2:
-                return parts[1].replace("시", "").replace("구", "")
-        return ""
-
-
-# ===== 약칭 생성기 (v7.5 신규) =====
-def generate_short_name(full_name: str) -> str:
-    """업체명에서 제목용 약칭 자동 생성"""
-    
-    # 1. 지점명 제거
-    branch_patterns = ['점', '호점', '역점', '점포', '매장', '지점', 'DT점']
-    for pattern in branch_patterns:
-        if pattern in full_name:
-            # 마지막 패턴 이전까지만 사용
-            parts = full_name.split(pattern)
-            if len(parts) > 1:
-                full_name = parts[0].strip()
-    
-    # 2. 프랜차이즈 패턴 처리
-    franchise_patterns = {
-        '스타벅스': '스타벅스',
-        '맥도날드': '맥도날드',
-        '버거킹': '버거킹',
-        '이디야': '이디야',
-        '투썸플레이스': '투썸',
-        '파리바게뜨': '파바',
-        '뚜레쥬르': '뚜레쥬르'
-    }
-    
-    for franchise, short in franchise_patterns.items():
-        if franchise in full_name:
-            return short
-    
-    # 3. 메뉴명이 포함된 경우 처리
-    # "예향한정식 목포보리굴비" → "예향한정식"
-    words = full_name.split()
-    if len(words) > 2:
-        # 첫 2단어만 사용
-        candidate = ' '.join(words[:2])
-        
-        # 메뉴 관련 단어가 있으면 첫 단어만
-        menu_keywords = ['굴비', '갈비', '삼겹살', '치킨', '피자', '커피', '베이커리', 
-                        '국수', '칼국수', '냉면', '곰탕', '설렁탕', '해물', '회']
-        for keyword in menu_keywords:
-            if keyword in candidate:
-                return words[0]
-        
-        return candidate
-    
-    # 4. 길이 체크
-    if len(full_name) > 10:
-        # 10자 넘으면 첫 단어만
-        return full_name.split()[0]
-    
-    return full_name
-
-
 # ===== 말투 분석기 =====
 class StyleAnalyzer:
     """블로그 말투 분석"""
@@ -328,14 +246,32 @@ class StyleAnalyzer:
 class FeatureSelector:
     """특징 랜덤 선택기"""
     
-    def __init__(self, min_count: int = 7, max_count: int = 8):
+    MODE_RANDOM = "random"
+    MODE_COVERAGE = "coverage"
+    
+    def __init__(self, min_count: int = 7, max_count: int = 8, mode: str = MODE_RANDOM):
         self.min_count = min_count
         self.max_count = max_count
+        self.mode = mode
+        # coverage 모드: 업체(coverage_key)별 선택 항목 사용 횟수
+        self._usage: Dict[str, Dict[str, int]] = {}
+        self._usage_lock = threading.Lock()
+    
+    def reset_coverage(self, coverage_key: Optional[str] = None):
+        """사용 횟수 초기화 (coverage_key가 없으면 전체)"""
+        with self._usage_lock:
+            if coverage_key is None:
+                self._usage.clear()
+            else:
+                self._usage.pop(coverage_key, None)
     
-    def select_features(self, features: List[str], seed: Optional[int] = None) -> List[str]:
+    def select_features(self, features: List[str], seed: Optional[int] = None,
+                        coverage_key: Optional[str] = None) -> List[str]:
         """
         특징 리스트에서 선택
         [필수] 표시된 항목은 무조건 포함, 나머지에서 랜덤 선택
+        coverage 모드에서 coverage_key(업체명)가 주어지면 지금까지 덜 사용된 선택 항목을 우선 선택
+        (이 경우 결과는 앞선 항목들의 선택에 따라 달라지므로 재현은 기록된 selected_features로 함)
         """
         if not features:
             return []
@@ -361,12 +297,11 @@ class FeatureSelector:
         if total_features <= self.min_count:
             return required_features + optional_features
         
-        # 4. 랜덤 시드 설정
-        if seed is not None:
-            random.seed(seed)
+        # 4. 호출별 독립 난수 생성기 (전역 random 상태를 건드리지 않아 스레드 안전)
+        rng = random.Random(seed)
         
         # 5. 필수 항목 제외하고 선택할 개수 계산
-        remaining_slots = random.randint(
+        remaining_slots = rng.randint(
             max(0, self.min_count - len(required_features)),
             self.max_count - len(required_features)
         )
@@ -377,124 +312,209 @@ class FeatureSelector:
             # 선택 가능한 개수보다 슬롯이 많으면 모든 선택 항목 사용
             if remaining_slots >= len(optional_features):
                 selected_optional = optional_features
+            elif self.mode == self.MODE_COVERAGE and coverage_key is not None:
+                selected_optional = self._select_least_used(optional_features, remaining_slots, rng, coverage_key)
             else:
-                selected_optional = random.sample(optional_features, remaining_slots)
+                selected_optional = rng.sample(optional_features, remaining_slots)
         
         # 7. 필수 + 선택 조합하여 반환
         return required_features + selected_optional
+    
+    def _select_least_used(self, optional_features: List[str], count: int,
+                           rng: random.Random, coverage_key: str) -> List[str]:
+        """사용 횟수가 적은 선택 항목부터 count개 선택 (O(특징 수))"""
+        with self._usage_lock:
+            usage = self._usage.setdefault(coverage_key, {})
+            
+            # 사용 횟수별로 묶기 (균등 분배 중에는 횟수 차이가 1 이내라 묶음이 1-2개뿐)
+            buckets: Dict[int, List[str]] = {}
+            for feature in optional_features:
+                buckets.setdefault(usage.get(feature, 0), []).append(feature)
+            
+            selected = []
+            for used_count in sorted(buckets):
+                bucket = buckets[used_count]
+                needed = count - len(selected)
+                if len(bucket) <= needed:
+                    selected.extend(bucket)
+                else:
+                    # 같은 횟수끼리는 시드 기반 랜덤 선택
+                    selected.extend(rng.sample(bucket, needed))
+                if len(selected) >= count:
+                    break
+            
+            for feature in selected:
+                usage[feature] = usage.get(feature, 0) + 1
+        
+        # 프롬프트 내 특징 순서도 항목마다 다르게
+        rng.shuffle(selected)
+        return selected
+
+
+def make_feature_seed(business_name: str, keyword: str, row_index: int, base_seed: Optional[int] = None) -> int:
+    """
+    (업체, 키워드, 행 번호)로 항목별 특징 선택 시드 생성
+    hash()와 달리 프로세스/실행이 바뀌어도 같은 값이 나오므로 개별 항목을 그대로 재현할 수 있음
+    """
+    key = f"{base_seed if base_seed is not None else ''}|{business_name}|{keyword}|{row_index}"
+    digest = hashlib.sha256(key.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
 
 
 # ===== 프롬프트 빌더 =====
-class PromptBuilder:
-    """효과적인 프롬프트 생성"""
+def _format_menu_list(menu_items: List[Dict[str, str]]) -> str:
+    """메뉴 리스트를 '메뉴명 (가격), ...' 문자열로 변환"""
+    return ', '.join(
+        f"{menu['name']} ({menu['price']})" if menu.get('price') else menu['name']
+        for menu in menu_items
+    )
+
+
+class PreparedBusinessPrompt:
+    """
+    업체 단위로 미리 준비된 변환 프롬프트 템플릿
+    메뉴 문자열, 위치, 변환 규칙, 주문 메뉴 지시사항 등 업체에만 의존하는 부분은 한 번만 만들고,
+    항목마다 원본 텍스트, 말투 설명, 선택된 특징, SEO 키워드만 채워 넣는다
+    """
     
-    def __init__(self, feature_selector: Optional[FeatureSelector] = None):
-        self.feature_selector = feature_selector or FeatureSelector()
+    PROMPT_HEAD = "다음 블로그를 정확히 분석하고, 동일한 말투와 감성으로 새로운 업체를 소개해주세요.\n\n[원본 블로그]\n"
+    STYLE_HEAD = "\n\n[원본의 말투 특징]\n"
     
-    def build_conversion_prompt(self, original_text: str, style_analysis: StyleAnalysis, 
-                               business_info: BusinessInfo, feature_seed: Optional[int] = None) -> str:
-        """변환용 프롬프트 생성"""
+    RULES = """
+
+[변환 규칙]
+1. 원본과 100% 동일한 말투 유지 (종결어미, 감탄사, 구어체 표현)
+2. 원본과 동일한 감정 표현과 감성 유지
+3. 원본과 비슷한 문장 길이와 리듬 유지
+4. 원본의 특징적인 표현들을 그대로 활용
+5. 글자수: 1,350자 (±150자) - 반드시 1,200-1,500자 사이로 작성
+6. SEO 키워드를 자연스럽게 5-7회 분산
+7. 원본이 길더라도 핵심 내용을 압축하여 지정된 글자수를 준수하세요"""
+    
+    MARKER_HEAD = ("\n9. 원본의 (지도), (동영상) 마커를 비슷한 위치에 포함하세요:"
+                   "\n   **중요: 정확히 (지도), (동영상) 형식으로만 작성하고, (지도삽입) 등의 변형은 사용하지 마세요**")
+    
+    # 원본에 마커가 없는 경우
+    DEFAULT_MARKER_RULE = """
+9. 다음 위치에 (지도), (동영상) 마커를 포함하세요:
+   - (지도) 마커: 주소나 위치 정보 언급 후 또는 전체의 약 80% 지점
+   - (동영상) 마커: 메뉴나 분위기 설명 후 또는 전체의 약 60% 지점
+   **중요: 정확히 (지도), (동영상) 형식으로만 작성하고, (지도삽입) 등의 변형은 사용하지 마세요**"""
+    
+    def __init__(self, business_info: BusinessInfo, feature_selector: FeatureSelector):
+        self.feature_selector = feature_selector
+        self.business_name = business_info.name
+        self.features = list(business_info.features)
+        self.seo_keywords = list(business_info.seo_keywords)
         
         # 지역명 변환
         location = business_info.get_location_name()
         
-        # 전체 메뉴 정보 포맷팅
-        all_menu_str = ""
-        if business_info.menu_items:
-            menu_list = []
-            for menu in business_info.menu_items:  # 모든 메뉴 표시
-                if menu.get('price'):
-                    menu_list.append(f"{menu['name']} ({menu['price']})")
-                else:
-                    menu_list.append(menu['name'])
-            all_menu_str = ', '.join(menu_list)
-        
-        # 식사한 메뉴 정보 포맷팅
-        ordered_menu_str = ""
-        if business_info.ordered_items:
-            ordered_list = []
-            for menu in business_info.ordered_items:
-                if menu.get('price'):
-                    ordered_list.append(f"{menu['name']} ({menu['price']})")
-                else:
-                    ordered_list.append(menu['name'])
-            ordered_menu_str = ', '.join(ordered_list)
-        
-        # 특징 선택
-        selected_features = self.feature_selector.select_features(
-            business_info.features, 
-            seed=feature_seed
-        )
-        
-        # 글자수 계산
-        char_count = len(original_text.replace(' ', '').replace('\n', ''))
+        # 전체 메뉴 / 식사한 메뉴 정보 포맷팅
+        self.all_menu_str = _format_menu_list(business_info.menu_items)
+        ordered_menu_str = _format_menu_list(business_info.ordered_items)
         
-        prompt = f"""다음 블로그를 정확히 분석하고, 동일한 말투와 감성으로 새로운 업체를 소개해주세요.
-
-[원본 블로그]
-{original_text}
-
-[원본의 말투 특징]
-{style_analysis.to_prompt_description()}
+        # [새로운 업체 정보] 블록: 특징/SEO 키워드 줄을 기준으로 고정 구간을 나눠 둔다
+        self._info_head = f"""
 
 [새로운 업체 정보]
 업체명: {business_info.name}
 위치: {location} ({business_info.address})
-전체 메뉴: {all_menu_str if all_menu_str else selected_features[0] if selected_features else ''}
+전체 메뉴: """
+        self._info_mid = f"""
 실제 주문한 메뉴: {ordered_menu_str if ordered_menu_str else '메뉴 정보 없음'}
 운영시간: {business_info.hours}
 전화번호: {business_info.phone}
-특징: {', '.join(selected_features) if selected_features else ''}
+특징: """
+        self._info_tail = f"""
 분위기: {business_info.atmosphere}
 타겟 고객: {business_info.target_customer}
 주차 정보: {business_info.parking_info}
-SEO 키워드: {', '.join(business_info.seo_keywords[:5])}
-
-[변환 규칙]
-1. 원본과 100% 동일한 말투 유지 (종결어미, 감탄사, 구어체 표현)
-2. 원본과 동일한 감정 표현과 감성 유지
-3. 원본과 비슷한 문장 길이와 리듬 유지
-4. 원본의 특징적인 표현들을 그대로 활용
-5. 글자수: 1,350자 (±150자) - 반드시 1,200-1,500자 사이로 작성
-6. SEO 키워드를 자연스럽게 5-7회 분산
-7. 원본이 길더라도 핵심 내용을 압축하여 지정된 글자수를 준수하세요"""
+SEO 키워드: """
         
-        # 메뉴 관련 지시사항 추가
+        # 변환 규칙 + 메뉴 관련 지시사항
+        rules = self.RULES
         if business_info.ordered_items:
-            prompt += f"""
+            rules += f"""
 8. 메뉴 작성 방법:
    - 처음에 전체 메뉴를 보고 다양함에 놀란 반응 표현
    - "메뉴가 정말 다양하더라구요", "메뉴판 보니 놀랍더라구여" 등
    - 고민 끝에 실제 주문한 메뉴({ordered_menu_str})를 선택했다고 작성
    - 주문한 메뉴들에 대해서만 맛과 특징을 상세히 설명
    - 먹지 않은 메뉴는 "다음에 먹어보고 싶다" 정도로만 언급"""
+        self._rules = rules
         
-        # 마커 관련 지시사항 추가
-        if style_analysis.marker_info.get('has_map') or style_analysis.marker_info.get('has_video'):
-            prompt += "\n9. 원본의 (지도), (동영상) 마커를 비슷한 위치에 포함하세요:"
-            prompt += "\n   **중요: 정확히 (지도), (동영상) 형식으로만 작성하고, (지도삽입) 등의 변형은 사용하지 마세요**"
-            
-            if style_analysis.marker_info.get('has_map'):
-                map_positions = style_analysis.marker_info['map_positions']
-                prompt += f"\n   - (지도) 마커: 원본의 약 {int(map_positions[0]['relative_position']*100)}% 위치"
-            
-            if style_analysis.marker_info.get('has_video'):
-                video_positions = style_analysis.marker_info['video_positions']
-                prompt += f"\n   - (동영상) 마커: 원본의 약 {int(video_positions[0]['relative_position']*100)}% 위치"
-        else:
-            # 원본에 마커가 없는 경우
-            prompt += """
-9. 다음 위치에 (지도), (동영상) 마커를 포함하세요:
-   - (지도) 마커: 주소나 위치 정보 언급 후 또는 전체의 약 80% 지점
-   - (동영상) 마커: 메뉴나 분위기 설명 후 또는 전체의 약 60% 지점
-   **중요: 정확히 (지도), (동영상) 형식으로만 작성하고, (지도삽입) 등의 변형은 사용하지 마세요**"""
-        
-        prompt += f"""
+        self._closing = f"""
 
 원본의 스타일을 완벽하게 모방하여 '{business_info.name}'을 소개하는 블로그를 작성하세요.
 지역명은 '{location}'으로 통일하세요."""
+    
+    def _marker_rule(self, marker_info: Dict) -> str:
+        """마커 관련 지시사항 (원본 분석 결과에 따라 달라짐)"""
+        if not (marker_info.get('has_map') or marker_info.get('has_video')):
+            return self.DEFAULT_MARKER_RULE
+        
+        rule = self.MARKER_HEAD
+        if marker_info.get('has_map'):
+            map_positions = marker_info['map_positions']
+            rule += f"\n   - (지도) 마커: 원본의 약 {int(map_positions[0]['relative_position']*100)}% 위치"
+        
+        if marker_info.get('has_video'):
+            video_positions = marker_info['video_positions']
+            rule += f"\n   - (동영상) 마커: 원본의 약 {int(video_positions[0]['relative_position']*100)}% 위치"
+        return rule
+    
+    def select_features(self, feature_seed: Optional[int] = None) -> List[str]:
+        """이 업체의 특징 중 항목에 사용할 특징 선택 (coverage 모드에서는 업체별로 사용 횟수 집계)"""
+        return self.feature_selector.select_features(
+            self.features, seed=feature_seed, coverage_key=self.business_name
+        )
+    
+    def render(self, original_text: str, style_analysis: StyleAnalysis,
+               seo_keywords: Optional[List[str]] = None, feature_seed: Optional[int] = None,
+               selected_features: Optional[List[str]] = None) -> str:
+        """항목별 내용을 채워 최종 프롬프트 생성 (selected_features를 주면 특징 선택 생략)"""
+        if seo_keywords is None:
+            seo_keywords = self.seo_keywords
+        
+        # 특징 선택
+        if selected_features is None:
+            selected_features = self.select_features(feature_seed)
+        
+        menu_line = self.all_menu_str if self.all_menu_str else selected_features[0] if selected_features else ''
+        
+        return ''.join([
+            self.PROMPT_HEAD,
+            original_text,
+            self.STYLE_HEAD,
+            style_analysis.to_prompt_description(),
+            self._info_head,
+            menu_line,
+            self._info_mid,
+            ', '.join(selected_features),
+            self._info_tail,
+            ', '.join(seo_keywords[:5]),
+            self._rules,
+            self._marker_rule(style_analysis.marker_info),
+            self._closing
+        ])
 
-        return prompt
+
+class PromptBuilder:
+    """효과적인 프롬프트 생성"""
+    
+    def __init__(self, feature_selector: Optional[FeatureSelector] = None):
+        self.feature_selector = feature_selector or FeatureSelector()
+    
+    def prepare_business(self, business_info: BusinessInfo) -> PreparedBusinessPrompt:
+        """업체 정보로 재사용 가능한 프롬프트 템플릿 준비 (같은 업체의 배치 항목에서 공유)"""
+        return PreparedBusinessPrompt(business_info, self.feature_selector)
+    
+    def build_conversion_prompt(self, original_text: str, style_analysis: StyleAnalysis, 
+                               business_info: BusinessInfo, feature_seed: Optional[int] = None) -> str:
+        """변환용 프롬프트 생성"""
+        prepared = self.prepare_business(business_info)
+        return prepared.render(original_text, style_analysis, feature_seed=feature_seed)
     
     def build_title_prompt(self, keyword: str, business_info: BusinessInfo) -> str:
         """제목 생성용 프롬프트 생성 (v7.5 신규)"""
@@ -679,23 +699,40 @@ class BlogConverter:
         self.style_analyzer = StyleAnalyzer()
         self.feature_selector = FeatureSelector(
             min_count=config.FEATURE_SELECT_MIN,
-            max_count=config.FEATURE_SELECT_MAX
+            max_count=config.FEATURE_SELECT_MAX,
+            mode=config.FEATURE_SELECT_MODE
         )
         self.prompt_builder = PromptBuilder(self.feature_selector)
         self.api_handler = OpenAIAPIHandler(config)
         self.marker_processor = MarkerProcessor()
         self.generated_titles = set()  # 중복 방지용 (v7.5 신규)
     
-    def convert(self, original_text: str, business_info: BusinessInfo) -> Dict:
-        """블로그 변환 실행"""
+    def convert(self, original_text: str, business_info: BusinessInfo,
+                prepared_prompt: Optional[PreparedBusinessPrompt] = None,
+                feature_seed: Optional[int] = None) -> Dict:
+        """
+        블로그 변환 실행
+        prepared_prompt: 같은 업체를 반복 변환할 때 prompt_builder.prepare_business()로 미리 준비한 템플릿
+        feature_seed: 특징 선택 시드 (없으면 Config.FEATURE_SELECT_SEED, 그것도 없으면 새로 생성)
+        """
+        # 사용한 시드는 결과에 기록되어 같은 항목을 그대로 재현할 수 있음
+        if feature_seed is None:
+            feature_seed = self.config.FEATURE_SELECT_SEED
+        if feature_seed is None:
+            feature_seed = random.getrandbits(63)
+        
         try:
             # 1. 말투 분석
             style_analysis = self.style_analyzer.analyze(original_text)
             
             # 2. 프롬프트 생성
-            prompt = self.prompt_builder.build_conversion_prompt(
-                original_text, style_analysis, business_info,
-                feature_seed=self.config.FEATURE_SELECT_SEED
+            if prepared_prompt is None:
+                prepared_prompt = self.prompt_builder.prepare_business(business_info)
+            selected_features = prepared_prompt.select_features(feature_seed)
+            prompt = prepared_prompt.render(
+                original_text, style_analysis,
+                seo_keywords=business_info.seo_keywords,
+                selected_features=selected_features
             )
             
             # 3. API 호출
@@ -720,14 +757,17 @@ class BlogConverter:
                 'success': True,
                 'result': result,
                 'style_analysis': style_analysis,
-                'validation': validation
+                'validation': validation,
+                'feature_seed': feature_seed,
+                'selected_features': selected_features
             }
             
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
-                'result': ''
+                'result': '',
+                'feature_seed': feature_seed
             }
     
     def _generate_blog_title(self, keyword: str, business_info: BusinessInfo) -> str:
@@ -786,41 +826,9 @@ class BlogConverter:
         return title
     
     def _validate_result(self, result: str, original: str, business_info: BusinessInfo) -> Dict:
-        """결과 검증"""
-        validation = {}
-        
-        # 글자수
-        result_chars = len(result.replace(' ', '').replace('\n', ''))
-        original_chars = len(original.replace(' ', '').replace('\n', ''))
-        validation['char_count'] = result_chars
-        validation['char_diff'] = abs(result_chars - original_chars)
-        validation['char_valid'] = validation['char_diff'] < 200
-        
-        # SEO 키워드
-        keyword_counts = {}
-        for keyword in business_info.seo_keywords:
-            keyword_counts[keyword] = result.count(keyword)
-        
-        validation['seo_keywords'] = keyword_counts
-        validation['seo_total'] = sum(keyword_counts.values())
-        validation['seo_valid'] = 5 <= validation['seo_total'] <= 10
-        
-        # 반복 검사
-        sentences = re.split(r'[.!?]\s*', result)
-        seen = set()
-        repeated = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20:
-                if sentence in seen:
-                    repeated.append(sentence)
-                seen.add(sentence)
-        
-        validation['has_repetition'] = len(repeated) > 0
-        validation['repeated_sentences'] = repeated
-        
-        return validation
+        """결과 검증 (규칙은 일괄 재검증 도구와 공용)"""
+        return validate_result(result, original, business_info,
+                               min_chars=self.config.MIN_CHARS, max_chars=self.config.MAX_CHARS)
 
 
 # ===== GUI 인터페이스 =====
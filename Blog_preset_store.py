@@ -0,0 +1,404 @@
+"""
+블로그 변환 프로그램 공용 프리셋 저장소 (v7.6)
+- 단일 변환(v7.6_enhanced)과 대량 변환(v7.6_batch_enhanced)이 같은 프리셋 관리자를 사용
+- JSON/TXT 프리셋 파일은 그대로 두고, 파싱 결과를 SQLite 인덱스에 보관
+- 파일 mtime 기반 메모리 캐시 (바뀐 파일만 다시 파싱)
+- 업체명/약칭/지역 인덱스 조회
+- JSON 가져오기/내보내기
+"""
+
+import os
+import copy
+import json
+import sqlite3
+import threading
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _parse_json(path: str) -> Any:
+    """JSON 프리셋 파일 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _parse_text(path: str) -> str:
+    """텍스트 프리셋 파일 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# ===== 프리셋 저장소 =====
+class PresetStore:
+    """
+    프리셋 폴더 하나에 대한 SQLite 인덱스 + 메모리 캐시
+    원본은 폴더 안의 파일이고, SQLite에는 파싱된 내용과 조회용 컬럼(업체명/약칭/지역)을 저장한다.
+    폴더 mtime이 바뀌었을 때만 폴더를 다시 훑고, 파일은 (mtime, 크기)가 바뀐 것만 다시 파싱한다.
+    """
+
+    DB_FILENAME = ".preset_index.sqlite3"
+    INDEX_FIELDS = ('name', 'short_name', 'location')
+
+    def __init__(self, directory: str, kind: str, extension: str = '.json',
+                 parser: Optional[Callable[[str], Any]] = None,
+                 indexer: Optional[Callable[[Any], Tuple[str, str, str]]] = None):
+        self.directory = directory
+        self.kind = kind
+        self.extension = extension
+        self.parser = parser or _parse_json
+        self.indexer = indexer  # data → (업체명, 약칭, 지역)
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}  # 파일명 → ((mtime_ns, 크기), 데이터)
+        self._errors: Dict[str, Tuple[Tuple[int, int], str]] = {}  # 파싱 실패 파일
+        self._files: List[str] = []  # 폴더의 프리셋 파일 (파싱 실패 포함)
+        self._dir_mtime_ns: Optional[int] = None
+
+        self._conn = self._open_db()
+        self._load_db()
+
+    # --- SQLite ---
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """인덱스 DB 열기 (읽기 전용 폴더 등에서 실패하면 메모리 캐시만 사용)"""
+        try:
+            conn = sqlite3.connect(os.path.join(self.directory, self.DB_FILENAME), check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS presets (
+                    kind TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    name TEXT,
+                    short_name TEXT,
+                    location TEXT,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (kind, filename)
+                )
+            """)
+            for column in self.INDEX_FIELDS:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_presets_{column} ON presets (kind, {column})")
+            conn.commit()
+            return conn
+        except sqlite3.Error:
+            return None
+
+    def _load_db(self):
+        """이전 실행에서 저장된 인덱스를 메모리로 로드 (파일을 다시 파싱하지 않음)"""
+        if self._conn is None:
+            return
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename, mtime_ns, size, data FROM presets WHERE kind = ?", (self.kind,)
+            ).fetchall()
+            for filename, mtime_ns, size, data in rows:
+                self._entries[filename] = ((mtime_ns, size), json.loads(data))
+
+    def _db_upsert(self, filename: str, signature: Tuple[int, int], data: Any):
+        if self._conn is None:
+            return
+        name, short_name, location = self.indexer(data) if self.indexer else ('', '', '')
+        self._conn.execute(
+            "INSERT OR REPLACE INTO presets (kind, filename, mtime_ns, size, name, short_name, location, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.kind, filename, signature[0], signature[1], name, short_name, location,
+             json.dumps(data, ensure_ascii=False))
+        )
+
+    def _db_delete(self, filename: str):
+        if self._conn is None:
+            return
+        self._conn.execute("DELETE FROM presets WHERE kind = ? AND filename = ?", (self.kind, filename))
+
+    def _db_commit(self):
+        if self._conn is not None:
+            self._conn.commit()
+
+    # --- 캐시 ---
+    def _reload(self, filename: str, signature: Tuple[int, int]):
+        """파일 하나를 다시 파싱하여 캐시/인덱스 갱신"""
+        try:
+            data = self.parser(os.path.join(self.directory, filename))
+        except Exception as e:
+            self._errors[filename] = (signature, str(e))
+            self._entries.pop(filename, None)
+            self._db_delete(filename)
+            return
+
+        self._errors.pop(filename, None)
+        self._entries[filename] = (signature, data)
+        self._db_upsert(filename, signature, data)
+
+    def refresh(self, force: bool = False):
+        """변경된 파일만 다시 인덱싱 (폴더 목록 + 파일별 (mtime, 크기) 비교)"""
+        dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+        if not force and dir_mtime_ns == self._dir_mtime_ns:
+            # 파일 추가/삭제는 없음 → 제자리에서 수정된 파일만 확인 (폴더 mtime은 바뀌지 않음)
+            self._refresh_modified()
+            return
+
+        with self._lock:
+            seen = {}
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(self.extension) and entry.is_file():
+                        stat = entry.stat()
+                        seen[entry.name] = (stat.st_mtime_ns, stat.st_size)
+
+            for filename, signature in seen.items():
+                cached = self._entries.get(filename) or self._errors.get(filename)
+                if cached is None or cached[0] != signature:
+                    self._reload(filename, signature)
+
+            for filename in [name for name in self._entries if name not in seen]:
+                del self._entries[filename]
+                self._db_delete(filename)
+            for filename in [name for name in self._errors if name not in seen]:
+                del self._errors[filename]
+
+            self._db_commit()
+            self._files = sorted(seen)
+            self._dir_mtime_ns = dir_mtime_ns
+
+    def _refresh_modified(self):
+        """알려진 파일의 서명을 다시 확인해 바뀐 파일만 재인덱싱"""
+        with self._lock:
+            changed = False
+            for filename in self._files:
+                try:
+                    stat = os.stat(os.path.join(self.directory, filename))
+                except FileNotFoundError:
+                    # 목록 갱신 사이에 삭제됨 → 다음 전체 스캔에서 정리
+                    self._dir_mtime_ns = None
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                cached = self._entries.get(filename) or self._errors.get(filename)
+                if cached is None or cached[0] != signature:
+                    self._reload(filename, signature)
+                    changed = True
+            if changed:
+                self._db_commit()
+
+    # --- 조회/저장 ---
+    def list(self) -> List[str]:
+        """프리셋 파일 목록 (정렬)"""
+        self.refresh()
+        return list(self._files)
+
+    def get(self, filename: str) -> Any:
+        """프리셋 데이터 (파일이 바뀌었을 때만 다시 파싱, 호출자가 수정해도 캐시에 영향 없도록 복사본 반환)"""
+        stat = os.stat(os.path.join(self.directory, filename))
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(filename) or self._errors.get(filename)
+            if cached is None or cached[0] != signature:
+                self._reload(filename, signature)
+                self._db_commit()
+
+            if filename in self._errors:
+                raise ValueError(f"프리셋 파일 형식 오류 ({filename}): {self._errors[filename][1]}")
+            return copy.deepcopy(self._entries[filename][1])
+
+    def find(self, field: str, value: str) -> List[str]:
+        """인덱스 컬럼(name/short_name/location)으로 프리셋 파일 찾기"""
+        if field not in self.INDEX_FIELDS:
+            raise ValueError(f"지원하지 않는 조회 항목: {field}")
+        self.refresh()
+
+        with self._lock:
+            if self._conn is not None:
+                rows = self._conn.execute(
+                    f"SELECT filename FROM presets WHERE kind = ? AND {field} = ? ORDER BY filename",
+                    (self.kind, value)
+                ).fetchall()
+                return [row[0] for row in rows]
+
+            position = self.INDEX_FIELDS.index(field)
+            return sorted(
+                filename for filename, (_, data) in self._entries.items()
+                if self.indexer and self.indexer(data)[position] == value
+            )
+
+    def save(self, filename: str, data: Any) -> str:
+        """프리셋 파일 저장 + 인덱스 갱신"""
+        filepath = os.path.join(self.directory, filename)
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+        stat = os.stat(filepath)
+        with self._lock:
+            signature = (stat.st_mtime_ns, stat.st_size)
+            self._errors.pop(filename, None)
+            self._entries[filename] = (signature, copy.deepcopy(data))
+            self._db_upsert(filename, signature, data)
+            self._db_commit()
+
+        return filepath
+
+    def import_file(self, source_path: str, filename: Optional[str] = None) -> str:
+        """외부 프리셋 파일을 검증 후 저장소로 가져오기"""
+        data = self.parser(source_path)
+        self.save(filename or os.path.basename(source_path), data)
+        return filename or os.path.basename(source_path)
+
+    def export_file(self, filename: str, dest_path: str) -> str:
+        """저장소의 프리셋을 지정 경로로 내보내기"""
+        data = self.get(filename)
+        with open(dest_path, 'w', encoding='utf-8') as f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        return dest_path
+
+
+# ===== 업체 정보 관리자 =====
+class BusinessInfoManager:
+    """
+    업체 정보 저장/불러오기 관리 (단일/배치 공용)
+    business_info_cls: 각 프로그램의 BusinessInfo 데이터클래스
+    short_name_func: 약칭이 비어 있을 때 사용할 약칭 생성 함수
+    """
+
+    def __init__(self, preset_dir: str, business_info_cls: type,
+                 short_name_func: Optional[Callable[[str], str]] = None):
+        self.preset_dir = preset_dir
+        self.business_info_cls = business_info_cls
+        self.short_name_func = short_name_func
+        self.store = PresetStore(preset_dir, 'business', '.json',
+                                 parser=self._parse_preset, indexer=self._index_fields)
+        self._external_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+    @staticmethod
+    def _parse_preset(path: str) -> Dict:
+        data = _parse_json(path)
+        if not isinstance(data, dict):
+            raise ValueError("업체 정보는 JSON 객체여야 합니다.")
+        return data
+
+    def _to_business_info(self, data: Dict):
+        """딕셔너리 → BusinessInfo (알 수 없는 키는 무시)"""
+        business_info = self.business_info_cls()
+        for key, value in data.items():
+            if hasattr(business_info, key):
+                setattr(business_info, key, value)
+
+        # 약칭이 없으면 자동 생성 (v7.5)
+        if not business_info.short_name and business_info.name and self.short_name_func:
+            business_info.short_name = self.short_name_func(business_info.name)
+
+        return business_info
+
+    def _index_fields(self, data: Dict) -> Tuple[str, str, str]:
+        business_info = self._to_business_info(data)
+        return business_info.name, business_info.short_name, business_info.get_location_name()
+
+    def _resolve(self, filename: str) -> Tuple[Optional[str], str]:
+        """
+        파일명 또는 경로 해석
+        반환: (프리셋 폴더 안의 파일명 또는 None, 실제 경로)
+        """
+        candidates = [filename, os.path.join(self.preset_dir, filename)]
+        if os.path.basename(filename) != filename:
+            candidates.append(os.path.join(self.preset_dir, os.path.basename(filename)))
+
+        preset_dir = os.path.normcase(os.path.abspath(self.preset_dir))
+        for path in candidates:
+            if os.path.isfile(path):
+                if os.path.normcase(os.path.dirname(os.path.abspath(path))) == preset_dir:
+                    return os.path.basename(path), path
+                return None, path
+
+        raise FileNotFoundError(f"프리셋 파일을 찾을 수 없습니다: {filename}")
+
+    def save_preset(self, business_info, filename: str = None) -> str:
+        """업체 정보를 JSON으로 저장 (seo_keywords 포함 전체 필드)"""
+        if not filename:
+            filename = f"{business_info.name}.json"
+
+        data = {f.name: getattr(business_info, f.name) for f in fields(business_info)}
+        return self.store.save(filename, data)
+
+    def load_preset(self, filename: str):
+        """JSON에서 업체 정보 불러오기 (프리셋 폴더 기준 파일명 또는 경로 모두 허용)"""
+        store_name, path = self._resolve(filename)
+
+        if store_name is not None:
+            return self._to_business_info(self.store.get(store_name))
+
+        # 프리셋 폴더 밖의 파일 (CSV에서 직접 경로 지정): mtime 기준 캐시
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = os.path.abspath(path)
+        cached = self._external_cache.get(cache_key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, self._parse_preset(path))
+            self._external_cache[cache_key] = cached
+        return self._to_business_info(copy.deepcopy(cached[1]))
+
+    def list_presets(self) -> List[str]:
+        """저장된 프리셋 목록"""
+        return self.store.list()
+
+    def find_by_name(self, name: str) -> List[str]:
+        """업체명으로 프리셋 찾기"""
+        return self.store.find('name', name)
+
+    def find_by_short_name(self, short_name: str) -> List[str]:
+        """약칭으로 프리셋 찾기"""
+        return self.store.find('short_name', short_name)
+
+    def find_by_location(self, location: str) -> List[str]:
+        """지역명(get_location_name 기준)으로 프리셋 찾기"""
+        return self.store.find('location', location)
+
+    def import_json(self, source_path: str, filename: Optional[str] = None) -> str:
+        """외부 JSON 프리셋 가져오기"""
+        return self.store.import_file(source_path, filename)
+
+    def export_json(self, filename: str, dest_path: str) -> str:
+        """프리셋을 JSON 파일로 내보내기"""
+        return self.store.export_file(filename, dest_path)
+
+
+# ===== 키워드 프리셋 관리자 =====
+class KeywordPresetManager:
+    """SEO 키워드 프리셋 관리"""
+
+    def __init__(self, preset_dir: str):
+        self.preset_dir = preset_dir
+        self.store = PresetStore(preset_dir, 'keyword', '.json')
+
+    def save_preset(self, name: str, keywords: List[str]) -> str:
+        """키워드 세트를 JSON으로 저장"""
+        return self.store.save(f"{name}.json", keywords)
+
+    def load_preset(self, filename: str) -> List[str]:
+        """JSON에서 키워드 세트 불러오기"""
+        return self.store.get(filename)
+
+    def list_presets(self) -> List[str]:
+        """저장된 키워드 프리셋 목록"""
+        return self.store.list()
+
+
+# ===== 예시 원고 관리자 =====
+class ExampleManager:
+    """예시 원고 관리"""
+
+    def __init__(self, example_dir: str):
+        self.example_dir = example_dir
+        self.store = PresetStore(example_dir, 'example', '.txt', parser=_parse_text)
+
+    def list_examples(self) -> List[str]:
+        """예시 파일 목록"""
+        return self.store.list()
+
+    def load_example(self, filename: str) -> str:
+        """예시 파일 내용 읽기"""
+        return self.store.get(filename)
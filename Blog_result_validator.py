@@ -0,0 +1,103 @@
+"""
+블로그 변환 결과 검증 (v7.6)
+- 변환 프로그램(BlogConverter)과 일괄 재검증 도구가 같은 규칙으로 검사
+- 글자수, SEO 키워드 횟수, 반복 문장, (지도)/(동영상) 마커
+- 표준 라이브러리만 사용 (재검증 도구의 프로세스 풀 작업자가 GUI/OpenAI 없이 임포트)
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from Blog_business_info import BusinessInfo
+
+
+# 원본이 없을 때의 글자수 범위 (Config.MIN_CHARS/MAX_CHARS 기본값)
+MIN_CHARS = 1200
+MAX_CHARS = 1500
+
+# 원본 대비 허용 글자수 차이
+MAX_CHAR_DIFF = 200
+
+# SEO 키워드 등장 횟수 범위 (전체 키워드 합계)
+SEO_MIN_COUNT = 5
+SEO_MAX_COUNT = 10
+
+# 반복 검사 대상 문장 최소 길이 (짧은 감탄문 등은 제외)
+REPEAT_MIN_LENGTH = 20
+
+# 허용 마커: 정확히 (지도), (동영상) 형식만
+REQUIRED_MARKERS = ('(지도)', '(동영상)')
+# 마커 변형 탐지용 패턴: (지도), (동영상) 외의 (지도삽입) 같은 형태를 찾는다
+MARKER_VARIANT_PATTERN = re.compile(r'\((지도|동영상)[^)]*\)')
+
+
+def count_chars(text: str) -> int:
+    """공백/줄바꿈을 뺀 글자수"""
+    return len(text.replace(' ', '').replace('\n', ''))
+
+
+def find_repeated_sentences(text: str) -> List[str]:
+    """두 번 이상 나온 문장 (REPEAT_MIN_LENGTH자 초과 문장만)"""
+    seen = set()
+    repeated = []
+
+    for sentence in re.split(r'[.!?]\s*', text):
+        sentence = sentence.strip()
+        if len(sentence) > REPEAT_MIN_LENGTH:
+            if sentence in seen:
+                repeated.append(sentence)
+            seen.add(sentence)
+
+    return repeated
+
+
+def find_marker_issues(text: str) -> List[str]:
+    """마커 누락/변형 목록"""
+    issues = []
+    for marker in REQUIRED_MARKERS:
+        if marker not in text:
+            issues.append(f"{marker} 누락")
+    for match in MARKER_VARIANT_PATTERN.finditer(text):
+        if match.group(0) not in REQUIRED_MARKERS:
+            issues.append(f"마커 변형: {match.group(0)}")
+    return issues
+
+
+def validate_result(result: str, original: Optional[str], business_info: BusinessInfo,
+                    min_chars: int = MIN_CHARS, max_chars: int = MAX_CHARS) -> Dict:
+    """
+    변환 결과 검증
+    original이 None이면 원본 대비 차이 대신 min_chars~max_chars 범위로 판정
+    """
+    validation = {}
+
+    # 글자수
+    result_chars = count_chars(result)
+    validation['char_count'] = result_chars
+    if original is not None:
+        validation['char_diff'] = abs(result_chars - count_chars(original))
+        validation['char_valid'] = validation['char_diff'] < MAX_CHAR_DIFF
+    else:
+        validation['char_diff'] = None
+        validation['char_valid'] = min_chars <= result_chars <= max_chars
+
+    # SEO 키워드
+    keyword_counts = {}
+    for keyword in business_info.seo_keywords:
+        keyword_counts[keyword] = result.count(keyword)
+
+    validation['seo_keywords'] = keyword_counts
+    validation['seo_total'] = sum(keyword_counts.values())
+    validation['seo_valid'] = SEO_MIN_COUNT <= validation['seo_total'] <= SEO_MAX_COUNT
+
+    # 반복 검사
+    repeated = find_repeated_sentences(result)
+    validation['has_repetition'] = len(repeated) > 0
+    validation['repeated_sentences'] = repeated
+
+    # 마커 검사
+    marker_issues = find_marker_issues(result)
+    validation['marker_issues'] = marker_issues
+    validation['marker_valid'] = len(marker_issues) == 0
+
+    return validation
@@ -0,0 +1,130 @@
+"""
+GUI 공용 업데이트 채널
+- 작업 쓰레드는 Tk 위젯을 직접 건드리지 않고 채널에 요청만 넣음
+- 메인 쓰레드가 일정 주기(after)로 한 번에 꺼내서 반영
+- 같은 키의 상태 표시(진행률/상태줄 등)는 마지막 값만 반영 (coalescing)
+- 로그 위젯은 최대 줄 수를 유지하는 링 버퍼로 동작
+
+사용 예:
+    self.ui = UIUpdateChannel(self.root, log_widget=self.log_text)
+    self.ui.log("메시지")                                     # 어느 쓰레드에서나
+    self.ui.post_latest('status', label.config, text="...")   # 마지막 값만 반영
+    self.ui.post(messagebox.showinfo, "완료", "끝났습니다")     # 순서대로 한 번씩 실행
+"""
+
+import time
+import threading
+import traceback
+from collections import deque
+from datetime import datetime
+
+import tkinter as tk
+
+
+class RingBufferLog:
+    """최대 줄 수를 넘으면 오래된 줄부터 지우는 로그 위젯 래퍼"""
+
+    def __init__(self, text_widget, max_lines: int = 2000):
+        self.text_widget = text_widget
+        self.max_lines = max_lines
+        self.line_count = 0
+
+    def append(self, lines):
+        """여러 줄을 한 번의 insert로 추가"""
+        lines = list(lines)[-self.max_lines:]
+        if not lines:
+            return
+
+        self.text_widget.insert(tk.END, ''.join(f"{line}\n" for line in lines))
+        self.line_count += len(lines)
+
+        excess = self.line_count - self.max_lines
+        if excess > 0:
+            self.text_widget.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
+
+        self.text_widget.see(tk.END)
+
+    def clear(self):
+        self.text_widget.delete("1.0", tk.END)
+        self.line_count = 0
+
+
+class UIUpdateChannel:
+    """작업 쓰레드 → Tk 메인 쓰레드 업데이트 채널"""
+
+    def __init__(self, root, interval_ms: int = 50, log_widget=None, max_log_lines: int = 2000,
+                 max_calls_per_tick: int = 500):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.max_calls_per_tick = max_calls_per_tick
+        self.log_view = RingBufferLog(log_widget, max_log_lines) if log_widget is not None else None
+
+        # deque의 append/popleft는 쓰레드 안전
+        self._calls = deque()  # (callback, args, kwargs) - 순서대로 모두 실행
+        self._log_lines = deque(maxlen=max_log_lines)  # 아직 반영 안 된 로그 (넘치면 오래된 것부터 버림)
+        self._latest = {}  # 키 → (callback, args, kwargs) - 마지막 값만 실행
+        self._latest_lock = threading.Lock()
+        self._last_drain = 0.0
+
+        self.root.after(self.interval_ms, self._tick)
+
+    # --- 작업 쓰레드용 ---
+    def post(self, callback, *args, **kwargs):
+        """메인 쓰레드에서 실행할 작업 추가 (순서 유지, 모두 실행)"""
+        self._calls.append((callback, args, kwargs))
+
+    def post_latest(self, key, callback, *args, **kwargs):
+        """같은 키는 마지막 요청만 실행 (진행률, 상태 표시 등)"""
+        with self._latest_lock:
+            self._latest[key] = (callback, args, kwargs)
+
+    def log(self, message: str):
+        """로그 한 줄 추가 (시간은 요청 시점 기준)"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        for line in str(message).split('\n'):
+            self._log_lines.append(f"[{timestamp}] {line}")
+
+    # --- 메인 쓰레드 ---
+    def pump(self):
+        """
+        메인 쓰레드에서 긴 작업을 돌리는 동안 호출
+        주기가 지났을 때만 쌓인 요청을 반영하고 화면을 갱신
+        """
+        if (time.monotonic() - self._last_drain) * 1000 >= self.interval_ms:
+            self.drain()
+            self.root.update_idletasks()
+
+    def drain(self):
+        """쌓인 요청을 한 번에 반영"""
+        self._last_drain = time.monotonic()
+
+        with self._latest_lock:
+            latest = list(self._latest.values())
+            self._latest.clear()
+        for callback, args, kwargs in latest:
+            self._run(callback, args, kwargs)
+
+        if self._log_lines and self.log_view is not None:
+            lines = []
+            while self._log_lines:
+                lines.append(self._log_lines.popleft())
+            self.log_view.append(lines)
+
+        # 한 번에 너무 많이 실행하면 화면이 멈추므로 나머지는 다음 주기로
+        for _ in range(min(len(self._calls), self.max_calls_per_tick)):
+            callback, args, kwargs = self._calls.popleft()
+            self._run(callback, args, kwargs)
+
+    @staticmethod
+    def _run(callback, args, kwargs):
+        try:
+            callback(*args, **kwargs)
+        except Exception:
+            traceback.print_exc()
+
+    def _tick(self):
+        try:
+            self.drain()
+        finally:
+            self.root.after(self.interval_ms, self._tick)
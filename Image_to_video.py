@@ -1,12 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
-import subprocess
 import threading
 from pathlib import Path
-import time
 import json
 
+# 변환 로직은 화면 없이도 쓸 수 있도록 엔진 모듈에 있음 (명령줄 실행: Image_to_video_engine.py)
+from Image_to_video_engine import (
+    CONTACT_SHEET_SUFFIX, HAS_PIL, POSTER_SUFFIX, SEGMENT_MIN_IMAGES, SLIDE_TIMING_FILENAME, TRANSITIONS,
+    ImageFolderScanner, VideoConversionEngine,
+    describe_image_issues, detect_vfr_option, image_issue_lines, make_job_settings
+)
+from Gui_update_channel import UIUpdateChannel
+
+
+def _format_seconds(seconds):
+    """초 → 'm:ss' 표시"""
+    if seconds is None:
+        return ''
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
 class ImageToVideoConverter:
     def __init__(self, root):
         self.root = root
@@ -19,18 +33,36 @@ class ImageToVideoConverter:
         self.duration = tk.StringVar(value="1.0")
         self.fps = tk.StringVar(value="30")
         self.video_quality = tk.StringVar(value="high")
+        self.incremental = tk.BooleanVar(value=True)  # 변경된 폴더만 변환
+        self.slideshow_mode = tk.BooleanVar(value=True)  # 정지 이미지 최적화 인코딩
+        self.vfr_option = '-fps_mode'  # 가변 프레임 옵션 (ffmpeg 5.1 미만은 -vsync)
+        self.use_scaled_cache = tk.BooleanVar(value=True)  # 크기 조정 이미지 캐시 사용
+        self.pipe_input = tk.BooleanVar(value=False)  # 목록 파일 대신 stdin으로 프레임 전달
+        self.transition = tk.StringVar(value="none")  # 전환 효과
+        self.transition_duration = tk.StringVar(value="0.5")  # 크로스페이드 시간(초)
+        self.make_poster = tk.BooleanVar(value=False)  # 포스터(첫 장면) 함께 저장
+        self.make_contact_sheet = tk.BooleanVar(value=False)  # 콘택트 시트(썸네일 격자) 함께 저장
         self.is_processing = False
-        self.total_folders = 0
-        self.current_folder = 0
         self.folder_vars = {}  # 폴더별 체크박스 변수
         self.selected_folders = []  # 선택된 폴더 목록
         
+        # 병렬 변환 설정 (동시 작업 수 × 작업당 스레드 ≤ CPU 수)
+        cpu_count = os.cpu_count() or 1
+        self.threads_per_job = tk.StringVar(value="2")
+        self.parallel_jobs = tk.StringVar(value=str(max(1, cpu_count // 2)))
+        self.segment_count = tk.StringVar(value="1")  # 큰 폴더 하나를 나눠 동시에 인코딩할 구간 수
+        self.engine = None  # 변환 엔진 (변환 시작 시점의 설정으로 생성, 작업 쓰레드는 Tk 변수를 읽지 않음)
+        self.scanner = ImageFolderScanner()  # 폴더 목록/이미지 헤더 캐시
+        
         # 설정 파일 경로
         self.config_file = "converter_config.json"
         
         # GUI 구성
         self.setup_gui()
         
+        # 작업 쓰레드 → GUI 업데이트 채널 (로그는 최근 2000줄만 유지)
+        self.ui = UIUpdateChannel(self.root, log_widget=self.log_text, max_log_lines=2000)
+        
         # 이전 설정 불러오기
         self.load_config()
         
@@ -96,7 +128,8 @@ class ImageToVideoConverter:
         ttk.Label(settings_frame, text="이미지당 표시 시간(초):").grid(row=0, column=0, sticky=tk.W, pady=5)
         duration_entry = ttk.Entry(settings_frame, textvariable=self.duration, width=10)
         duration_entry.grid(row=0, column=1, sticky=tk.W, padx=5)
-        ttk.Label(settings_frame, text="(기본값: 1초)").grid(row=0, column=2, sticky=tk.W)
+        ttk.Label(settings_frame, text=f"(기본값: 1초, 폴더의 {SLIDE_TIMING_FILENAME}에 이미지별 시간 지정 가능)").grid(
+            row=0, column=2, sticky=tk.W)
         
         # FPS
         ttk.Label(settings_frame, text="FPS (프레임/초):").grid(row=1, column=0, sticky=tk.W, pady=5)
@@ -112,6 +145,57 @@ class ImageToVideoConverter:
         quality_combo.grid(row=2, column=1, sticky=tk.W, padx=5)
         ttk.Label(settings_frame, text="(기본값: high)").grid(row=2, column=2, sticky=tk.W)
         
+        # 병렬 변환
+        ttk.Label(settings_frame, text="동시 변환 폴더 수:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        ttk.Spinbox(settings_frame, from_=1, to=os.cpu_count() or 1, textvariable=self.parallel_jobs,
+                    width=8).grid(row=3, column=1, sticky=tk.W, padx=5)
+        ttk.Label(settings_frame, text=f"(CPU {os.cpu_count() or 1}개 기준으로 제한)").grid(row=3, column=2, sticky=tk.W)
+        
+        ttk.Label(settings_frame, text="작업당 스레드 수:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        ttk.Spinbox(settings_frame, from_=1, to=16, textvariable=self.threads_per_job,
+                    width=8).grid(row=4, column=1, sticky=tk.W, padx=5)
+        ttk.Label(settings_frame, text="(기본값: 2)").grid(row=4, column=2, sticky=tk.W)
+        
+        ttk.Label(settings_frame, text="큰 폴더 분할 구간 수:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        ttk.Spinbox(settings_frame, from_=1, to=os.cpu_count() or 1, textvariable=self.segment_count,
+                    width=8).grid(row=5, column=1, sticky=tk.W, padx=5)
+        ttk.Label(settings_frame, text=f"(이미지 {SEGMENT_MIN_IMAGES * 2}장 이상 폴더, 1 = 나누지 않음)").grid(
+            row=5, column=2, sticky=tk.W)
+        
+        ttk.Checkbutton(settings_frame, text="변경된 폴더만 변환 (이미지/설정이 같으면 기존 동영상 유지)",
+                        variable=self.incremental).grid(row=6, column=0, columnspan=3, sticky=tk.W, pady=5)
+        
+        ttk.Checkbutton(settings_frame, text="슬라이드쇼 최적화 (이미지당 1프레임 + 정지 화면 튜닝, 인코딩 시간/용량 감소)",
+                        variable=self.slideshow_mode).grid(row=7, column=0, columnspan=3, sticky=tk.W, pady=5)
+        
+        ttk.Checkbutton(settings_frame, text="크기 조정 이미지 캐시 사용 (같은 사진은 한 번만 축소" +
+                        (")" if HAS_PIL else ", Pillow 미설치: ffmpeg 사용)"),
+                        variable=self.use_scaled_cache).grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=5)
+        
+        ttk.Checkbutton(settings_frame, text="이미지를 FFmpeg에 직접 전달 (목록 파일 없이 파이프 입력)",
+                        variable=self.pipe_input).grid(row=9, column=0, columnspan=3, sticky=tk.W, pady=5)
+        
+        # 전환 효과 (크로스페이드/줌, 한 번의 인코딩으로 처리)
+        ttk.Label(settings_frame, text="전환 효과:").grid(row=10, column=0, sticky=tk.W, pady=5)
+        ttk.Combobox(settings_frame, textvariable=self.transition, width=10, state="readonly",
+                     values=list(TRANSITIONS)).grid(row=10, column=1, sticky=tk.W, padx=5)
+        ttk.Label(settings_frame, text="(none: 없음, fade: 크로스페이드, zoom: 천천히 확대, fade_zoom: 둘 다)").grid(
+            row=10, column=2, sticky=tk.W)
+        
+        ttk.Label(settings_frame, text="전환 시간(초):").grid(row=11, column=0, sticky=tk.W, pady=5)
+        ttk.Entry(settings_frame, textvariable=self.transition_duration, width=10).grid(
+            row=11, column=1, sticky=tk.W, padx=5)
+        ttk.Label(settings_frame, text="(기본값: 0.5초, 전환 효과 사용 시 고정 FPS로 인코딩)").grid(
+            row=11, column=2, sticky=tk.W)
+        
+        # 블로그 대표 이미지: 동영상 인코딩과 같은 디코딩 결과에서 함께 저장
+        assets_frame = ttk.Frame(settings_frame)
+        assets_frame.grid(row=12, column=0, columnspan=3, sticky=tk.W, pady=5)
+        ttk.Checkbutton(assets_frame, text=f"포스터 저장 (<폴더명>{POSTER_SUFFIX})",
+                        variable=self.make_poster).pack(side=tk.LEFT)
+        ttk.Checkbutton(assets_frame, text=f"콘택트 시트 저장 (<폴더명>{CONTACT_SHEET_SUFFIX}, 썸네일 격자)",
+                        variable=self.make_contact_sheet).pack(side=tk.LEFT, padx=(20, 0))
+        
         # 4. 진행률 섹션
         progress_frame = ttk.LabelFrame(main_frame, text="진행 상황", padding="10")
         progress_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
@@ -130,6 +214,14 @@ class ImageToVideoConverter:
         self.current_progress = ttk.Progressbar(progress_frame, length=850, mode='indeterminate')
         self.current_progress.grid(row=3, column=0, pady=5)
         
+        # 폴더별 작업 상태
+        job_columns = ('폴더', '상태', '이미지', '진행률', '인코딩 속도', '남은 시간', '소요 시간')
+        self.jobs_tree = ttk.Treeview(progress_frame, columns=job_columns, show='headings', height=5)
+        for col in job_columns:
+            self.jobs_tree.heading(col, text=col)
+            self.jobs_tree.column(col, width=250 if col == '폴더' else 100)
+        self.jobs_tree.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=5)
+        
         # 6. 버튼 섹션 (로그 섹션 위에 배치)
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=4, column=0, columnspan=2, pady=10)
@@ -156,7 +248,7 @@ class ImageToVideoConverter:
     def check_ffmpeg(self):
         """FFmpeg 설치 확인"""
         try:
-            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+            self.vfr_option = detect_vfr_option()
             self.log("✓ FFmpeg가 정상적으로 설치되어 있습니다.")
         except:
             self.log("✗ FFmpeg가 설치되어 있지 않습니다!")
@@ -184,22 +276,12 @@ class ImageToVideoConverter:
             widget.destroy()
         self.folder_vars.clear()
         
-        # 하위 폴더 스캔
+        # 하위 폴더 스캔 (폴더 수정시각이 같으면 캐시된 목록 사용)
         source = self.source_folder.get()
-        subfolders = []
         
         try:
-            for item in os.listdir(source):
-                item_path = os.path.join(source, item)
-                if os.path.isdir(item_path):
-                    # 이미지 파일 개수 확인
-                    image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.gif']
-                    image_count = sum(1 for f in os.listdir(item_path) 
-                                    if any(f.lower().endswith(ext) for ext in image_extensions))
-                    if image_count > 0:
-                        subfolders.append((item, image_count))
-            
-            subfolders.sort(key=lambda x: x[0])  # 폴더명으로 정렬
+            folder_images = self.scanner.scan_tree(source)
+            subfolders = sorted((name, len(images)) for name, images in folder_images.items())  # 폴더명으로 정렬
             
             # 체크박스 생성
             for i, (folder_name, img_count) in enumerate(subfolders):
@@ -217,6 +299,10 @@ class ImageToVideoConverter:
             self.log(f"발견된 폴더: {len(subfolders)}개")
             self.update_selection_info()
             
+            # 손상/특이 이미지는 변환 전에 백그라운드에서 미리 검사
+            if not self.is_processing:
+                threading.Thread(target=self.check_images, args=(source, folder_images), daemon=True).start()
+            
             # 캔버스 스크롤 영역 업데이트
             self.canvas.update_idletasks()
             self.canvas.config(scrollregion=self.canvas.bbox("all"))
@@ -224,6 +310,25 @@ class ImageToVideoConverter:
         except Exception as e:
             messagebox.showerror("오류", f"폴더 목록을 읽는 중 오류 발생:\n{str(e)}")
     
+    def check_images(self, source, folder_images):
+        """이미지 헤더 검사 (백그라운드 쓰레드). 문제 있는 폴더만 로그에 표시"""
+        broken_total = 0
+        for folder_name in sorted(folder_images):
+            try:
+                infos = self.scanner.probe_folder(os.path.join(source, folder_name), folder_images[folder_name])
+            except OSError:
+                continue  # 검사 중 폴더가 바뀜
+            broken, rotated, size_count = describe_image_issues(infos)
+            broken_total += len(broken)
+            for line in image_issue_lines(folder_name, broken, rotated, size_count):
+                self.log(line)
+        
+        self.log(f"이미지 검사 완료: {len(folder_images)}개 폴더, 손상 이미지 {broken_total}개")
+        try:
+            self.scanner.save()
+        except OSError:
+            pass
+    
     def on_frame_configure(self, event=None):
         """캔버스 스크롤 영역 업데이트"""
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
@@ -250,11 +355,8 @@ class ImageToVideoConverter:
         self.selected_folders = [name for name, var in self.folder_vars.items() if var.get()]
     
     def log(self, message):
-        """로그 메시지 추가"""
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """로그 메시지 추가 (어느 쓰레드에서나 호출 가능, 화면 반영은 채널 주기로)"""
+        self.ui.log(message)
     
     def save_config(self):
         """설정 저장"""
@@ -262,7 +364,18 @@ class ImageToVideoConverter:
             "source_folder": self.source_folder.get(),
             "duration": self.duration.get(),
             "fps": self.fps.get(),
-            "quality": self.video_quality.get()
+            "quality": self.video_quality.get(),
+            "parallel_jobs": self.parallel_jobs.get(),
+            "threads_per_job": self.threads_per_job.get(),
+            "segment_count": self.segment_count.get(),
+            "incremental": self.incremental.get(),
+            "slideshow": self.slideshow_mode.get(),
+            "scaled_cache": self.use_scaled_cache.get(),
+            "pipe_input": self.pipe_input.get(),
+            "transition": self.transition.get(),
+            "transition_duration": self.transition_duration.get(),
+            "poster": self.make_poster.get(),
+            "contact_sheet": self.make_contact_sheet.get()
         }
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
@@ -279,19 +392,20 @@ class ImageToVideoConverter:
                 self.duration.set(config.get("duration", "1.0"))
                 self.fps.set(config.get("fps", "30"))
                 self.video_quality.set(config.get("quality", "high"))
+                self.parallel_jobs.set(config.get("parallel_jobs", self.parallel_jobs.get()))
+                self.threads_per_job.set(config.get("threads_per_job", self.threads_per_job.get()))
+                self.segment_count.set(config.get("segment_count", self.segment_count.get()))
+                self.incremental.set(config.get("incremental", True))
+                self.slideshow_mode.set(config.get("slideshow", True))
+                self.use_scaled_cache.set(config.get("scaled_cache", True))
+                self.pipe_input.set(config.get("pipe_input", False))
+                self.transition.set(config.get("transition", "none"))
+                self.transition_duration.set(config.get("transition_duration", "0.5"))
+                self.make_poster.set(config.get("poster", False))
+                self.make_contact_sheet.set(config.get("contact_sheet", False))
         except:
             pass
     
-    def get_quality_params(self):
-        """품질에 따른 FFmpeg 파라미터 반환"""
-        quality_map = {
-            "low": "-crf 28 -preset fast",
-            "medium": "-crf 23 -preset medium",
-            "high": "-crf 18 -preset slow",
-            "very_high": "-crf 15 -preset veryslow"
-        }
-        return quality_map.get(self.video_quality.get(), "-crf 18 -preset slow")
-    
     def start_conversion(self):
         """변환 시작"""
         # 입력 확인
@@ -307,167 +421,114 @@ class ImageToVideoConverter:
         # 설정 저장
         self.save_config()
         
+        # 작업 쓰레드에서 쓸 설정 고정
+        try:
+            settings = make_job_settings(
+                self.source_folder.get(),
+                duration=self.duration.get(),
+                fps=self.fps.get(),
+                quality=self.video_quality.get(),
+                threads=self.threads_per_job.get(),
+                jobs=self.parallel_jobs.get(),
+                segments=self.segment_count.get(),
+                incremental=self.incremental.get(),
+                slideshow=self.slideshow_mode.get(),
+                scaled_cache=self.use_scaled_cache.get(),
+                pipe_input=self.pipe_input.get(),
+                transition=self.transition.get(),
+                transition_duration=self.transition_duration.get(),
+                poster=self.make_poster.get(),
+                contact_sheet=self.make_contact_sheet.get(),
+                vfr_option=self.vfr_option
+            )
+        except ValueError:
+            messagebox.showerror("오류", "표시 시간, FPS, 전환 시간, 동시 변환 수, 스레드 수, 구간 수는 숫자로 입력해주세요.")
+            return
+        
+        # 엔진 진행 상황은 UI 채널로 (같은 폴더/전체 진행률은 마지막 값만 반영)
+        self.engine = VideoConversionEngine(
+            settings, scanner=self.scanner, on_log=self.log,
+            on_job=lambda folder_name, job: self.ui.post_latest(('job', folder_name), self.show_job, folder_name),
+            on_overall=lambda *args: self.ui.post_latest('overall', self.show_overall_progress, *args)
+        )
+        
         # 버튼 상태 변경
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.is_processing = True
         
+        # 작업 목록은 작업 쓰레드 시작 전에 (작업 상태 갱신이 목록 생성보다 먼저 반영되지 않도록)
+        folders_to_process = self.selected_folders.copy()
+        self.reset_job_rows(folders_to_process)
+        
         # 별도 스레드에서 실행
-        thread = threading.Thread(target=self.process_folders)
+        thread = threading.Thread(target=self.process_folders, args=(folders_to_process,))
         thread.daemon = True
         thread.start()
     
     def stop_conversion(self):
-        """변환 중지"""
+        """변환 중지 (실행 중인 ffmpeg 프로세스 종료)"""
         self.is_processing = False
+        if self.engine:
+            self.engine.stop()
         self.log("사용자가 변환을 중지했습니다.")
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
     
-    def process_folders(self):
-        """폴더 처리 메인 함수"""
-        source = self.source_folder.get()
-        
-        # 선택된 폴더만 처리
-        folders_to_process = self.selected_folders.copy()
-        
-        self.total_folders = len(folders_to_process)
-        self.current_folder = 0
-        
-        self.log(f"\n========== 변환 작업 시작 ==========")
-        self.log(f"총 {self.total_folders}개 폴더를 처리합니다.")
-        self.log(f"선택된 폴더: {', '.join(folders_to_process[:5])}" + 
-                 (f" 외 {len(folders_to_process)-5}개" if len(folders_to_process) > 5 else ""))
-        
-        success_count = 0
-        fail_count = 0
-        
-        for folder_name in folders_to_process:
-            if not self.is_processing:
-                break
-            
-            self.current_folder += 1
-            folder_path = os.path.join(source, folder_name)
-            
-            # 진행률 업데이트
-            self.overall_label.config(text=f"전체 진행률: {self.current_folder}/{self.total_folders} 폴더")
-            self.overall_progress['value'] = (self.current_folder / self.total_folders) * 100
-            
-            # 현재 폴더 처리
-            result = self.convert_folder_to_video(folder_path, folder_name)
-            
-            if result:
-                success_count += 1
-            else:
-                fail_count += 1
+    def process_folders(self, folders_to_process):
+        """폴더 처리 메인 함수 (작업 쓰레드, 실제 변환은 엔진이 담당)"""
+        report = self.engine.run(folders_to_process)
         
         # 완료
         self.is_processing = False
+        self.ui.post(self.on_conversion_finished, report)
+    
+    def reset_job_rows(self, folder_names):
+        """작업 목록 초기화 (메인 쓰레드)"""
+        self.jobs_tree.delete(*self.jobs_tree.get_children())
+        for folder_name in folder_names:
+            self.jobs_tree.insert('', 'end', iid=folder_name, values=(folder_name, '대기', '', '', '', '', ''))
+        self.current_progress.start()
+    
+    def show_job(self, folder_name):
+        """작업 한 줄 표시 (메인 쓰레드)"""
+        job = self.engine.jobs.get(folder_name)
+        if job is None or not self.jobs_tree.exists(folder_name):
+            return
+        elapsed = f"{job['elapsed']:.1f}초" if job['elapsed'] is not None else ''
+        progress = job['progress']
+        if progress:
+            percent = f"{progress['percent']:.0f}%"
+            speed = f"{progress['fps']:.0f}fps ({progress['speed']:.1f}x)"
+            eta = _format_seconds(progress['eta'])
+        else:
+            percent = speed = eta = ''
+        self.jobs_tree.item(folder_name, values=(
+            folder_name, job['status'], job['images'] or '', percent, speed, eta, elapsed
+        ))
+        if job['status'] == '변환 중':
+            self.jobs_tree.see(folder_name)
+        
+        running = sum(1 for j in self.engine.jobs.values() if j['status'] == '변환 중')
+        self.current_label.config(text=f"변환 중: {running}개 폴더")
+    
+    def show_overall_progress(self, current, total, images_done, elapsed):
+        """전체 진행률 + 처리량 표시 (메인 쓰레드)"""
+        throughput = ""
+        if elapsed > 0:
+            throughput = f" | {current / elapsed * 60:.1f} 폴더/분, {images_done / elapsed:.1f} 이미지/초"
+        self.overall_label.config(text=f"전체 진행률: {current}/{total} 폴더{throughput}")
+        self.overall_progress['value'] = (current / total) * 100
+    
+    def on_conversion_finished(self, report):
+        """변환 종료 처리 (메인 쓰레드)"""
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.current_progress.stop()
         
-        if self.current_folder > 0:
-            self.log(f"\n========== 변환 작업 완료 ==========")
-            self.log(f"성공: {success_count}개, 실패: {fail_count}개")
-            messagebox.showinfo("완료", f"변환이 완료되었습니다!\n성공: {success_count}개, 실패: {fail_count}개")
+        if report['completed'] > 0:
+            messagebox.showinfo("완료", f"변환이 완료되었습니다!\n성공: {report['success']}개, 실패: {report['failed']}개")
     
-    def convert_folder_to_video(self, folder_path, folder_name):
-        """개별 폴더를 동영상으로 변환"""
-        self.current_label.config(text=f"처리 중: {folder_name}")
-        self.current_progress.start()
-        
-        try:
-            # 이미지 파일 찾기
-            image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.gif']
-            images = []
-            
-            for file in os.listdir(folder_path):
-                if any(file.lower().endswith(ext) for ext in image_extensions):
-                    images.append(file)
-            
-            if not images:
-                self.log(f"⚠ {folder_name}: 이미지 파일이 없습니다.")
-                return False
-            
-            images.sort()  # 파일명 순서대로 정렬
-            self.log(f"📁 {folder_name}: {len(images)}개 이미지 발견")
-            
-            # 첫 번째 이미지 정보 확인
-            first_image_path = os.path.join(folder_path, images[0])
-            self.log(f"  첫 번째 이미지: {images[0]}")
-            
-            # 출력 파일명 (원본 폴더에 저장)
-            output_file = os.path.join(folder_path, f"{folder_name}.mp4")
-            
-            # 기존 파일이 있는지 확인
-            if os.path.exists(output_file):
-                self.log(f"  기존 파일 덮어쓰기: {folder_name}.mp4")
-            
-            # 출력 파일명 (원본 폴더에 저장)
-            output_file = os.path.join(folder_path, f"{folder_name}.mp4")
-            
-            # 기존 파일이 있는지 확인
-            if os.path.exists(output_file):
-                self.log(f"  기존 파일 덮어쓰기: {folder_name}.mp4")
-            
-            # 임시 파일 리스트 생성 (원본 폴더에 생성)
-            temp_file = os.path.join(folder_path, f"{folder_name}_filelist.txt")
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                for img in images:
-                    img_path = os.path.join(folder_path, img).replace('\\', '/')
-                    f.write(f"file '{img_path}'\n")
-                    f.write(f"duration {self.duration.get()}\n")
-                # 마지막 이미지 추가 (FFmpeg 요구사항)
-                if images:
-                    last_img = os.path.join(folder_path, images[-1]).replace('\\', '/')
-                    f.write(f"file '{last_img}'\n")
-            
-            # FFmpeg 명령어 구성
-            quality_params = self.get_quality_params()
-            cmd = [
-                'ffmpeg',
-                '-y',  # 기존 파일 덮어쓰기
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', temp_file,
-                '-vf', f'scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,fps={self.fps.get()}',
-                '-pix_fmt', 'yuv420p',  # 호환성을 위해
-                *quality_params.split(),
-                output_file
-            ]
-            
-            # FFmpeg 실행
-            process = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-            
-            # 임시 파일 삭제
-            try:
-                os.remove(temp_file)
-            except:
-                pass
-            
-            if process.returncode == 0:
-                self.log(f"✓ {folder_name}: 변환 완료! → {output_filename}")
-                return True
-            else:
-                self.log(f"✗ {folder_name}: 변환 실패")
-                error_msg = process.stderr if process.stderr else process.stdout
-                if error_msg:
-                    # 긴 오류 메시지는 주요 부분만 표시
-                    error_lines = error_msg.strip().split('\n')
-                    for line in error_lines[-5:]:  # 마지막 5줄만 표시
-                        if line.strip():
-                            self.log(f"  오류: {line.strip()}")
-                else:
-                    self.log(f"  오류: 알 수 없는 오류 (이미지 크기가 다르거나 파일명에 특수문자가 있을 수 있습니다)")
-                return False
-                
-        except Exception as e:
-            self.log(f"✗ {folder_name}: 오류 발생 - {str(e)}")
-            return False
-        finally:
-            self.current_progress.stop()
-
 def main():
     root = tk.Tk()
     app = ImageToVideoConverter(root)
@@ -0,0 +1,1587 @@
+"""
+이미지 → 동영상 변환 엔진 (화면 없이 동작)
+- Image_to_video.py(GUI)와 명령줄 일괄 변환이 같은 엔진 사용
+- 폴더 스캔/헤더 검사 캐시, 크기 조정 이미지 캐시, 변경 없는 폴더 건너뛰기
+- 여러 폴더 동시 변환 + 큰 폴더 구간 분할 인코딩
+- 입력: 임시 폴더의 concat 목록 파일, 또는 목록 없이 stdin 파이프로 프레임 전달
+- 폴더의 slides.txt로 이미지별 표시 시간 지정, 크로스페이드/줌 전환 효과를 필터 그래프 하나로 처리
+- 같은 ffmpeg 실행에서 동영상과 함께 포스터(첫 장면)/콘택트 시트(썸네일 격자) JPEG 저장
+- 명령줄 실행 시 진행 상황을 JSON 한 줄씩(JSON Lines) 출력하고 최종 리포트 저장
+
+사용법:
+    python Image_to_video_engine.py <원본폴더> [--duration 1.0] [--fps 30] [--quality high] [--jobs 4]
+    python Image_to_video_engine.py --job 작업.json [--report 리포트.json]
+
+작업 파일 예 (명령줄 옵션이 있으면 명령줄 값 우선):
+    {"source": "D:/사진/정리완료", "folders": ["강남점", "홍대점"],
+     "duration": 1.0, "fps": 30, "quality": "high", "jobs": 4, "threads": 2}
+"""
+
+import io
+import os
+import sys
+import subprocess
+import threading
+import time
+import re
+import json
+import hashlib
+import shutil
+import struct
+import tempfile
+import argparse
+from datetime import datetime
+from fractions import Fraction
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+# 이미지 처리 라이브러리 (선택: 없으면 ffmpeg로 크기 조정)
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+
+# 출력 영상 크기
+VIDEO_WIDTH = 1920
+VIDEO_HEIGHT = 1080
+
+# 폴더별 변환 기록 (입력/설정이 같으면 다시 변환하지 않음)
+MANIFEST_FILENAME = ".video_manifest.json"
+MANIFEST_VERSION = 1
+# 결과 영상에 영향을 주는 설정 (동시 작업 수/스레드 수는 제외)
+OUTPUT_SETTING_KEYS = ('duration', 'fps', 'quality_params', 'slideshow', 'scaled_cache',
+                       'transition', 'transition_duration', 'poster', 'contact_sheet')
+
+# 크기 조정된 중간 이미지 캐시 폴더 (설정 파일과 같은 위치 기준)
+SCALED_CACHE_DIR = "scaled_cache"
+
+# 변환 대상 이미지 확장자
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+
+# 폴더/이미지 헤더 스캔 캐시 (설정 파일과 같은 위치 기준)
+SCAN_CACHE_FILE = "image_scan_cache.json"
+SCAN_CACHE_VERSION = 4  # 2: APP1이 여러 개인 회전 JPEG 재검사, 3: 포스터/시트 제외, 4: EOI 뒤 데이터가 있는 JPEG 재검사
+
+# 이미지별 표시 시간 파일 (폴더 안, "<파일명> <초>" 한 줄씩)
+SLIDE_TIMING_FILENAME = "slides.txt"
+
+# 전환 효과: none(없음) / fade(크로스페이드) / zoom(천천히 확대) / fade_zoom(둘 다)
+TRANSITIONS = ('none', 'fade', 'zoom', 'fade_zoom')
+ZOOM_AMOUNT = 0.1  # 줌 효과: 슬라이드 동안 10% 확대
+
+# 포스터/콘택트 시트 (동영상 디코딩 결과를 분기해 같은 실행에서 저장, 동영상 옆에 생성)
+POSTER_SUFFIX = "_poster.jpg"
+CONTACT_SHEET_SUFFIX = "_sheet.jpg"
+CONTACT_SHEET_COLUMNS = 5
+CONTACT_SHEET_MAX = 30  # 최대 칸 수 (이미지가 더 많으면 전체에서 고르게 선택)
+THUMB_WIDTH = 384
+THUMB_HEIGHT = 216
+
+# 구간 분할 인코딩: 구간당 최소 이미지 수 (작은 폴더는 나누지 않음)
+SEGMENT_MIN_IMAGES = 100
+
+# 파이프 입력: 미리 준비해 두는 프레임 수 (메모리 상한 = 이 수 × 프레임 크기)
+PIPE_PREFETCH = 8
+# 파이프 입력(Pillow 없이 파일 그대로 전달)에 쓰는 ffmpeg 입력 형식
+PIPE_DEMUXERS = {
+    '.jpg': 'jpeg_pipe',
+    '.jpeg': 'jpeg_pipe',
+    '.png': 'png_pipe',
+    '.bmp': 'bmp_pipe',
+    '.gif': 'gif_pipe'
+}
+
+
+def build_video_manifest(folder_path, images, settings, durations=None):
+    """
+    폴더 입력 요약: 정렬된 이미지 목록 + 크기/수정시각 해시, 출력 설정
+    durations: slides.txt로 정한 이미지별 표시 시간 (없으면 None)
+    """
+    digest = hashlib.sha256()
+    for image in images:
+        stat = os.stat(os.path.join(folder_path, image))
+        digest.update(f"{image}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode('utf-8'))
+    
+    durations_hash = None
+    if durations is not None:
+        durations_hash = hashlib.sha256(','.join(f"{d:g}" for d in durations).encode('utf-8')).hexdigest()
+    
+    return {
+        'version': MANIFEST_VERSION,
+        'images_hash': digest.hexdigest(),
+        'image_count': len(images),
+        'durations_hash': durations_hash,
+        'scale': f"{VIDEO_WIDTH}x{VIDEO_HEIGHT}",
+        'settings': {key: settings[key] for key in OUTPUT_SETTING_KEYS}
+    }
+
+
+def manifest_matches(folder_path, output_file, manifest):
+    """저장된 기록과 입력/설정이 같고 결과 파일도 그대로인지 확인"""
+    try:
+        with open(os.path.join(folder_path, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        output_stat = os.stat(output_file)
+    except (OSError, ValueError):
+        return False
+    
+    if any(saved.get(key) != value for key, value in manifest.items()):
+        return False
+    # 결과 파일이 바뀌거나 중간에 끊긴 경우 다시 변환
+    return saved.get('output_size') == output_stat.st_size and saved.get('output_mtime_ns') == output_stat.st_mtime_ns
+
+
+def save_manifest(folder_path, output_file, manifest):
+    """변환 성공 후 기록 저장 (임시 파일에 쓴 뒤 교체)"""
+    output_stat = os.stat(output_file)
+    data = dict(manifest,
+                output=os.path.basename(output_file),
+                output_size=output_stat.st_size,
+                output_mtime_ns=output_stat.st_mtime_ns,
+                created=time.strftime("%Y-%m-%d %H:%M:%S"))
+    
+    manifest_path = os.path.join(folder_path, MANIFEST_FILENAME)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+def _exif_orientation(data):
+    """APP1(Exif) 세그먼트에서 방향(0x0112) 값 추출. 없으면 1"""
+    if not data.startswith(b'Exif\x00\x00'):
+        return 1
+    tiff = data[6:]
+    byte_order = {b'II': '<', b'MM': '>'}.get(tiff[:2])
+    if byte_order is None:
+        return 1
+    
+    try:
+        ifd_offset = struct.unpack(byte_order + 'I', tiff[4:8])[0]
+        entry_count = struct.unpack(byte_order + 'H', tiff[ifd_offset:ifd_offset + 2])[0]
+        for i in range(entry_count):
+            entry = tiff[ifd_offset + 2 + i * 12:ifd_offset + 14 + i * 12]
+            if len(entry) < 12:
+                break
+            tag, _, _ = struct.unpack(byte_order + 'HHI', entry[:8])
+            if tag == 0x0112:
+                return struct.unpack(byte_order + 'H', entry[8:10])[0]
+    except struct.error:
+        pass  # Exif가 깨져도 이미지 자체는 사용 가능
+    return 1
+
+
+def _probe_jpeg(f):
+    """
+    JPEG: SOF 세그먼트의 크기 + Exif 방향 (이미지 데이터는 읽지 않음)
+    끝 표식(EOI)은 확인하지 않음 - 모션 포토처럼 EOI 뒤에 동영상 등을 붙인 정상 파일이 있고,
+    실제로 잘린 파일은 FFmpeg 디코딩 단계에서 오류로 드러남
+    """
+    if f.read(2) != b'\xff\xd8':
+        raise ValueError("JPEG 시작 표식 없음")
+    
+    orientation = 1
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise ValueError("JPEG 구조 손상")
+        code = marker[1]
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue  # 길이 없는 표식
+        
+        length = struct.unpack('>H', f.read(2))[0]
+        if code == 0xE1:
+            # APP1은 Exif 뒤에 XMP 등이 더 올 수 있으므로 항상 끝까지 읽고, 방향은 처음 찾은 값만 사용
+            payload = f.read(length - 2)
+            if orientation == 1:
+                orientation = _exif_orientation(payload)
+            continue
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>xHH', f.read(5))
+            break
+        if code == 0xDA:
+            raise ValueError("JPEG 크기 정보 없음")
+        f.seek(length - 2, os.SEEK_CUR)
+    
+    return width, height, orientation
+
+
+def probe_image_header(path):
+    """
+    이미지 헤더만 읽어 (가로, 세로, Exif 방향) 반환
+    손상/잘림/지원하지 않는 형식이면 ValueError
+    """
+    file_size = os.path.getsize(path)
+    if file_size == 0:
+        raise ValueError("빈 파일")
+    
+    with open(path, 'rb') as f:
+        head = f.read(32)
+        f.seek(0)
+        
+        if head.startswith(b'\xff\xd8'):
+            return _probe_jpeg(f)
+        
+        if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+            width, height = struct.unpack('>II', head[16:24])
+            f.seek(max(0, file_size - 12))
+            if b'IEND' not in f.read():
+                raise ValueError("PNG 끝 표식 없음 (파일 잘림)")
+            return width, height, 1
+        
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            width, height = struct.unpack('<HH', head[6:10])
+            return width, height, 1
+        
+        if head.startswith(b'BM'):
+            header_size = struct.unpack('<I', head[14:18])[0]
+            if header_size == 12:
+                width, height = struct.unpack('<HH', head[18:22])
+            else:
+                width, height = struct.unpack('<ii', head[18:26])
+            return width, abs(height), 1
+    
+    raise ValueError("이미지 형식을 알 수 없음 (확장자와 내용이 다름)")
+
+
+class ImageFolderScanner:
+    """
+    원본 폴더 스캐너 (os.scandir + 스레드 풀)
+    - 폴더별 이미지 목록: 폴더 수정시각이 같으면 디렉터리를 다시 읽지 않음
+    - 이미지 헤더 정보(크기/방향/손상 여부): 파일 크기+수정시각이 같으면 다시 읽지 않음
+    - 캐시는 JSON 파일로 저장되어 다음 실행에서도 재사용
+    """
+    
+    def __init__(self, cache_file=SCAN_CACHE_FILE, workers=None):
+        self.cache_file = cache_file
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)  # 디스크 I/O 위주
+        self.lock = threading.Lock()
+        self.folders = {}  # 폴더 경로 → {'mtime_ns', 'images'}
+        self.images = {}  # 이미지 경로 → {'size', 'mtime_ns', 'width', 'height', 'orientation', 'error'}
+        self.dirty = False
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == SCAN_CACHE_VERSION:
+                self.folders = data.get('folders', {})
+                self.images = data.get('images', {})
+        except (OSError, ValueError):
+            pass
+    
+    def list_images(self, folder_path):
+        """폴더의 이미지 파일명 목록 (파일명 순)"""
+        folder_path = os.path.abspath(folder_path)
+        mtime_ns = os.stat(folder_path).st_mtime_ns
+        with self.lock:
+            cached = self.folders.get(folder_path)
+        if cached and cached['mtime_ns'] == mtime_ns:
+            return list(cached['images'])
+        
+        # 이 폴더에 함께 저장하는 포스터/콘택트 시트는 원본 이미지가 아님 (다시 슬라이드로 넣지 않음)
+        folder_name = os.path.basename(folder_path)
+        generated = {(folder_name + POSTER_SUFFIX).lower(), (folder_name + CONTACT_SHEET_SUFFIX).lower()}
+        
+        images = []
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith(IMAGE_EXTENSIONS) and name not in generated and entry.is_file():
+                    images.append(entry.name)
+        images.sort()
+        
+        with self.lock:
+            self.folders[folder_path] = {'mtime_ns': mtime_ns, 'images': images}
+            self.dirty = True
+        return list(images)
+    
+    def scan_tree(self, source):
+        """원본 폴더의 하위 폴더별 이미지 목록 {폴더명: [파일명, ...]} (이미지 없는 폴더 제외)"""
+        with os.scandir(source) as entries:
+            subfolders = [entry.name for entry in entries if entry.is_dir()]
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(lambda name: self.list_images(os.path.join(source, name)), subfolders)
+            return {name: images for name, images in zip(subfolders, results) if images}
+    
+    def probe(self, path):
+        """이미지 하나의 헤더 정보 (캐시 우선)"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self.lock:
+            cached = self.images.get(path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached
+        
+        info = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                'width': 0, 'height': 0, 'orientation': 1, 'error': ''}
+        try:
+            info['width'], info['height'], info['orientation'] = probe_image_header(path)
+        except (OSError, ValueError, struct.error) as e:
+            info['error'] = str(e) or type(e).__name__
+        
+        with self.lock:
+            self.images[path] = info
+            self.dirty = True
+        return info
+    
+    def probe_folder(self, folder_path, images):
+        """폴더 이미지 헤더 검사 (스레드 풀). 반환: 파일명 → 헤더 정보"""
+        paths = [os.path.join(folder_path, name) for name in images]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return dict(zip(images, executor.map(self.probe, paths)))
+    
+    def save(self):
+        """변경된 캐시 저장"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {'version': SCAN_CACHE_VERSION, 'folders': dict(self.folders), 'images': dict(self.images)}
+            self.dirty = False
+        
+        temp_path = self.cache_file + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.cache_file)
+
+
+def describe_image_issues(infos):
+    """
+    헤더 검사 결과 요약
+    반환: (손상 이미지 [(파일명, 사유)], 회전 정보가 있는 이미지 수, 이미지 크기 종류 수)
+    """
+    broken = [(name, info['error']) for name, info in infos.items() if info['error']]
+    rotated = sum(1 for info in infos.values() if not info['error'] and info['orientation'] not in (0, 1))
+    sizes = {(info['width'], info['height']) for info in infos.values() if not info['error']}
+    return broken, rotated, len(sizes)
+
+
+def letterbox_image(source_path, width, height):
+    """
+    원본 이미지 → width×height 검은 여백 포함 RGB 이미지 (Pillow)
+    ffmpeg의 scale=...:force_original_aspect_ratio=decrease,pad=... 와 같은 배치
+    """
+    with Image.open(source_path) as image:
+        image = image.convert('RGB')
+        scale = min(width / image.width, height / image.height)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        resized = image.resize(size, Image.LANCZOS)
+    
+    canvas = Image.new('RGB', (width, height))
+    canvas.paste(resized, ((width - size[0]) // 2, (height - size[1]) // 2))
+    return canvas
+
+
+def build_scaled_image(source_path, output_path, width, height, use_pil):
+    """원본 이미지 → width×height 검은 여백 포함 JPEG (프로세스 풀에서 실행)"""
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    
+    if use_pil:
+        letterbox_image(source_path, width, height).save(temp_path, 'JPEG', quality=95)
+    else:
+        subprocess.run([
+            'ffmpeg', '-y', '-v', 'error',
+            '-i', source_path,
+            '-vf', (f'scale={width}:{height}:force_original_aspect_ratio=decrease,'
+                    f'pad={width}:{height}:(ow-iw)/2:(oh-ih)/2'),
+            '-frames:v', '1', '-q:v', '2',
+            '-f', 'image2', '-c:v', 'mjpeg',
+            temp_path
+        ], check=True, capture_output=True)
+    
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+class ScaledImageCache:
+    """
+    영상 크기로 맞춘 중간 이미지 캐시 (원본 파일 내용 해시 기준)
+    - 같은 사진이 여러 폴더/영상에 들어가도 디코딩/크기 조정은 한 번만
+    - 사진이 다른 폴더로 옮겨져도 내용이 같으면 재사용
+    - 해시는 (경로, 크기, 수정시각) 인덱스에 저장해 다음 실행에서 다시 읽지 않음
+    """
+    INDEX_FILENAME = "index.json"
+    
+    def __init__(self, cache_dir, width=VIDEO_WIDTH, height=VIDEO_HEIGHT, workers=None):
+        self.cache_dir = cache_dir
+        self.width = width
+        self.height = height
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        self.lock = threading.Lock()
+        self.in_flight = {}  # 결과 경로 → 진행 중인 Future (여러 작업이 같은 사진을 요청할 때)
+        self.executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILENAME)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.hash_index = json.load(f)
+        except (OSError, ValueError):
+            self.hash_index = {}
+    
+    def content_hash(self, path):
+        """원본 파일 내용 SHA-256 (변경 없는 파일은 인덱스 재사용)"""
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        with self.lock:
+            cached = self.hash_index.get(key)
+        if cached:
+            return cached
+        
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        
+        with self.lock:
+            self.hash_index[key] = digest.hexdigest()
+        return digest.hexdigest()
+    
+    def get_many(self, source_paths):
+        """
+        원본 경로 목록 → 캐시 이미지 경로 목록 (없는 것만 새로 생성)
+        반환: (캐시 경로 목록, 새로 만든 개수)
+        """
+        results = []
+        waits = []
+        built = 0
+        
+        for source_path in source_paths:
+            content_hash = self.content_hash(source_path)
+            output_dir = os.path.join(self.cache_dir, content_hash[:2])
+            output_path = os.path.join(output_dir, f"{content_hash}_{self.width}x{self.height}.jpg")
+            results.append(output_path)
+            
+            with self.lock:
+                if output_path in self.in_flight:
+                    waits.append(self.in_flight[output_path])
+                    continue
+                if os.path.exists(output_path):
+                    continue
+                
+                os.makedirs(output_dir, exist_ok=True)
+                future = self.executor.submit(build_scaled_image, source_path, output_path,
+                                              self.width, self.height, HAS_PIL)
+                self.in_flight[output_path] = future
+                waits.append(future)
+                built += 1
+        
+        try:
+            for future in waits:
+                future.result()
+        finally:
+            with self.lock:
+                for output_path in results:
+                    future = self.in_flight.get(output_path)
+                    if future is not None and future.done():
+                        del self.in_flight[output_path]
+        
+        return results, built
+    
+    def close(self):
+        """프로세스 풀 종료 + 해시 인덱스 저장"""
+        self.executor.shutdown(wait=True)
+        with self.lock:
+            data = dict(self.hash_index)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.index_path)
+
+
+class FFmpegProgressReader:
+    """
+    ffmpeg -progress pipe:1 출력(key=value 블록) 파서
+    블록 끝(progress=continue/end)마다 진행률/인코딩 fps/속도/남은 시간 반환
+    """
+    
+    def __init__(self, total_frames, total_seconds):
+        self.total_frames = max(1, total_frames)
+        self.total_seconds = max(0.001, total_seconds)
+        self.values = {}
+    
+    @staticmethod
+    def _number(value):
+        try:
+            return float(value.rstrip('x'))
+        except (AttributeError, ValueError):
+            return 0.0  # "N/A" 등
+    
+    def feed(self, line):
+        """한 줄 처리. 블록이 끝나면 진행 상태 딕셔너리, 아니면 None"""
+        key, sep, value = line.strip().partition('=')
+        if not sep:
+            return None
+        self.values[key] = value.strip()
+        if key != 'progress':
+            return None
+        
+        frame = int(self._number(self.values.get('frame')))
+        out_seconds = self._number(self.values.get('out_time_us')) / 1_000_000
+        encode_fps = self._number(self.values.get('fps'))
+        speed = self._number(self.values.get('speed'))
+        
+        # 프레임 수와 출력 시간 중 더 앞선 쪽 기준 (코덱 지연으로 frame이 늦게 올라오는 경우)
+        percent = min(100.0, max(frame / self.total_frames, out_seconds / self.total_seconds) * 100)
+        
+        if speed > 0:
+            eta = max(0.0, self.total_seconds - out_seconds) / speed
+        elif encode_fps > 0:
+            eta = max(0, self.total_frames - frame) / encode_fps
+        else:
+            eta = None
+        
+        done = self.values['progress'] == 'end'
+        return {
+            'frame': frame,
+            'percent': 100.0 if done else percent,
+            'fps': encode_fps,
+            'speed': speed,
+            'eta': 0.0 if done else eta,
+            'done': done
+        }
+
+
+def combine_progress(parts, weights):
+    """구간별 진행 상태 → 폴더 전체 진행 상태 (weights: 구간별 길이, 구간은 동시에 진행)"""
+    started = [part for part in parts if part]
+    if not started:
+        return None
+    
+    percent = sum(part['percent'] * weight for part, weight in zip(parts, weights) if part) / sum(weights)
+    etas = [part['eta'] for part in started if part['eta'] is not None]
+    done = len(started) == len(parts) and all(part['done'] for part in started)
+    return {
+        'frame': sum(part['frame'] for part in started),
+        'percent': 100.0 if done else percent,
+        'fps': sum(part['fps'] for part in started),
+        'speed': sum(part['speed'] for part in started),
+        'eta': max(etas) if etas else None,
+        'done': done
+    }
+
+
+def _concat_quote(path):
+    """concat 목록용 경로 인용 (목록 파일 위치와 무관하게 절대 경로, 작은따옴표는 '\\'' 로 이스케이프)"""
+    return "'" + os.path.abspath(path).replace('\\', '/').replace("'", "'\\''") + "'"
+
+
+def write_concat_list(list_file, input_paths, durations):
+    """concat demuxer 입력 목록 (이미지마다 표시 시간)"""
+    with open(list_file, 'w', encoding='utf-8') as f:
+        for input_path, duration in zip(input_paths, durations):
+            f.write(f"file {_concat_quote(input_path)}\n")
+            f.write(f"duration {duration:g}\n")
+        # 마지막 이미지 추가 (FFmpeg 요구사항)
+        if input_paths:
+            f.write(f"file {_concat_quote(input_paths[-1])}\n")
+
+
+def load_pipe_frame(path, raw):
+    """파이프 입력 프레임 한 장: raw면 디코딩/크기 조정한 RGB 바이트 (Pillow), 아니면 파일 내용 그대로"""
+    if raw:
+        return letterbox_image(path, VIDEO_WIDTH, VIDEO_HEIGHT).tobytes()
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def feed_frames(stdin, input_paths, raw, workers):
+    """
+    이미지를 작업 쓰레드에서 읽어 순서대로 ffmpeg stdin에 씀
+    미리 준비하는 프레임은 PIPE_PREFETCH장까지만 (메모리 일정)
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        paths = iter(input_paths)
+        pending = deque(executor.submit(load_pipe_frame, path, raw) for path in islice(paths, PIPE_PREFETCH))
+        try:
+            while pending:
+                frame = pending.popleft().result()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append(executor.submit(load_pipe_frame, next_path, raw))
+                stdin.write(frame)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg가 먼저 종료됨 (중지 등) → 종료 코드로 판단
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def load_slide_durations(folder_path, images, default_duration):
+    """
+    이미지별 표시 시간 (폴더에 slides.txt가 있으면 그 값, 적히지 않은 이미지는 기본값)
+    slides.txt 한 줄: "<파일명> <초>"  (# 뒤는 주석, 파일명에 공백 허용)
+    반환: (표시 시간 목록, slides.txt 사용 여부, 무시한 줄 목록)
+    """
+    durations = [float(default_duration)] * len(images)
+    sidecar_path = os.path.join(folder_path, SLIDE_TIMING_FILENAME)
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8-sig') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return durations, False, []
+    
+    positions = {name: index for index, name in enumerate(images)}
+    ignored = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        name, _, value = line.rpartition(' ')
+        name = name.strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            seconds = 0.0
+        if name not in positions or seconds <= 0:
+            ignored.append(f"{line_number}행: {line}")
+            continue
+        durations[positions[name]] = seconds
+    
+    return durations, True, ignored
+
+
+def _filter_path(path):
+    """필터 그래프 안의 파일 경로 이스케이프 (옵션 값 → 그래프, 두 단계)"""
+    value = re.sub(r"([\\':])", r"\\\1", os.path.abspath(path).replace('\\', '/'))
+    return re.sub(r"([\\'\[\],;])", r"\\\1", value)
+
+
+def clamp_fade_seconds(durations, transition, fade_seconds):
+    """실제 크로스페이드 시간 (가장 짧은 슬라이드의 절반 이하, 페이드가 없으면 0)"""
+    if transition not in ('fade', 'fade_zoom') or len(durations) < 2:
+        return 0.0
+    return min(fade_seconds, min(durations) / 2)
+
+
+def build_transition_graph(input_paths, durations, fps, transition, fade_seconds,
+                           width=VIDEO_WIDTH, height=VIDEO_HEIGHT):
+    """
+    전환 효과 필터 그래프 (출력 라벨 [out])
+    - 이미지마다 movie 소스 → 여백 맞춤 → zoompan으로 표시 시간만큼 프레임 생성 (줌 효과 포함)
+    - 크로스페이드: 이웃 슬라이드를 xfade로 겹침
+      겹치는 시간만큼 앞 슬라이드를 늘려서 슬라이드별 표시 시간과 전체 길이는 그대로
+    """
+    count = len(input_paths)
+    fade_seconds = clamp_fade_seconds(durations, transition, fade_seconds)
+    fade = fade_seconds > 0
+    zoom = transition in ('zoom', 'fade_zoom')
+    
+    # zoompan은 정수 좌표로 움직여 떨림이 생기므로 줌은 2배 크기에서 계산
+    source_width, source_height = (width * 2, height * 2) if zoom else (width, height)
+    zoom_to = 1 + ZOOM_AMOUNT
+    
+    chains = []
+    for index, (path, duration) in enumerate(zip(input_paths, durations)):
+        length = duration + (fade_seconds if fade and index < count - 1 else 0)
+        frames = max(1, round(length * float(fps)))
+        zoom_expr = f"'min(1+{ZOOM_AMOUNT}*on/{frames},{zoom_to})'" if zoom else "1"
+        chains.append(
+            f"movie=filename={_filter_path(path)},"
+            f"scale={source_width}:{source_height}:force_original_aspect_ratio=decrease,"
+            f"pad={source_width}:{source_height}:(ow-iw)/2:(oh-ih)/2,setsar=1,"
+            f"zoompan=z={zoom_expr}:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":d={frames}:s={width}x{height}:fps={fps},"
+            f"format=yuv420p[v{index}]"
+        )
+    
+    if fade:
+        # 슬라이드 k의 전환 시작 = 앞 슬라이드들의 표시 시간 합
+        previous = "v0"
+        offset = 0.0
+        for index in range(1, count):
+            offset += durations[index - 1]
+            label = "out" if index == count - 1 else f"x{index}"
+            chains.append(f"[{previous}][v{index}]xfade=transition=fade"
+                          f":duration={fade_seconds:.3f}:offset={offset:.3f}[{label}]")
+            previous = label
+    elif count > 1:
+        chains.append(''.join(f"[v{index}]" for index in range(count)) + f"concat=n={count}:v=1:a=0[out]")
+    else:
+        chains.append("[v0]null[out]")
+    
+    return ';\n'.join(chains) + '\n'
+
+
+def contact_sheet_picks(count, max_tiles=CONTACT_SHEET_MAX):
+    """콘택트 시트에 넣을 이미지 번호 (처음과 마지막 포함, 전체에서 고르게 최대 max_tiles개)"""
+    if count <= max_tiles:
+        return list(range(count))
+    return sorted({round(index * (count - 1) / (max_tiles - 1)) for index in range(max_tiles)})
+
+
+def transition_sheet_frames(durations, picks, fps, fade_seconds):
+    """
+    전환 효과 영상(고정 FPS)에서 각 선택 슬라이드가 온전히 보이는 구간 가운데의 프레임 번호
+    슬라이드 k는 앞 슬라이드들의 합 + 페이드 시간부터 다음 전환 시작까지 단독으로 보임
+    """
+    starts = [0.0]
+    for duration in durations[:-1]:
+        starts.append(starts[-1] + duration)
+    
+    frames = []
+    for index in picks:
+        fade_in = fade_seconds if index > 0 else 0.0
+        middle = starts[index] + (durations[index] + fade_in) / 2
+        frames.append(int(middle * float(fps)))
+    return frames
+
+
+def build_asset_graph(input_label, video_filter, poster, sheet_frames, tile=True):
+    """
+    동영상 출력 옆에 포스터/콘택트 시트 출력을 붙이는 필터 (디코딩/크기 조정은 한 번만)
+    - [input_label] → video_filter → [vout]
+    - 첫 프레임 → [poster]
+    - sheet_frames 번호의 프레임 → 썸네일 → 격자 한 장 → [sheet] (tile=False면 썸네일 그대로)
+    """
+    branches = ['vsplit']
+    if poster:
+        branches.append('psplit')
+    if sheet_frames:
+        branches.append('ssplit')
+    
+    chains = [f"[{input_label}]split={len(branches)}" + ''.join(f"[{label}]" for label in branches),
+              f"[vsplit]{video_filter}[vout]"]
+    if poster:
+        chains.append("[psplit]select='eq(n,0)'[poster]")
+    if sheet_frames:
+        select_expr = '+'.join(f"eq(n,{frame})" for frame in sheet_frames)
+        sheet_chain = f"[ssplit]select='{select_expr}',scale={THUMB_WIDTH}:{THUMB_HEIGHT}"
+        if tile:
+            sheet_chain += f",{tile_filter(len(sheet_frames))}"
+        chains.append(sheet_chain + "[sheet]")
+    return ';'.join(chains)
+
+
+def tile_filter(count, columns=CONTACT_SHEET_COLUMNS):
+    """썸네일 count장을 격자 한 장으로 (마지막 줄이 덜 차면 검은 칸)"""
+    columns = max(1, min(columns, count))
+    rows = -(-count // columns)
+    return f"tile={columns}x{rows}:padding=4:margin=4"
+
+
+def asset_output_args(assets):
+    """포스터/콘택트 시트 출력 옵션 (필터 라벨 [poster]/[sheet] → JPEG 한 장씩)"""
+    args = []
+    for label in ('poster', 'sheet'):
+        if assets.get(label):
+            args += ['-map', f'[{label}]', '-frames:v', '1', '-update', '1', '-q:v', '2', assets[label]]
+    return args
+
+
+def frame_rate_for(duration):
+    """이미지당 표시 시간 → 입력 프레임레이트 분수 문자열 (예: 0.5초 → '2/1')"""
+    rate = 1 / Fraction(str(duration)).limit_denominator(1000)
+    return f"{rate.numerator}/{rate.denominator}"
+
+# 품질 → ffmpeg 인코딩 옵션
+QUALITY_PRESETS = {
+    "low": "-crf 28 -preset fast",
+    "medium": "-crf 23 -preset medium",
+    "high": "-crf 18 -preset slow",
+    "very_high": "-crf 15 -preset veryslow"
+}
+DEFAULT_QUALITY = "high"
+
+
+def make_job_settings(source, duration="1.0", fps="30", quality=DEFAULT_QUALITY, threads=2, jobs=None,
+                      segments=1, incremental=True, slideshow=True, scaled_cache=True, pipe_input=False,
+                      transition='none', transition_duration="0.5", poster=False, contact_sheet=False,
+                      vfr_option='-fps_mode'):
+    """
+    변환 시작 시점의 설정 (작업 쓰레드는 이 값만 읽음)
+    숫자 설정이 잘못되면 ValueError
+    """
+    cpu_count = os.cpu_count() or 1
+    float(duration), float(fps), float(transition_duration)  # 숫자인지 확인
+    if transition not in TRANSITIONS:
+        raise ValueError(f"알 수 없는 전환 효과: {transition}")
+    threads = max(1, int(threads))
+    jobs = max(1, int(jobs)) if jobs else max(1, cpu_count // 2)
+    segments = max(1, int(segments))
+    
+    # 전체 스레드가 CPU 수를 넘지 않도록 제한
+    jobs = min(jobs, max(1, cpu_count // threads))
+    segments = min(segments, max(1, cpu_count // threads))
+    
+    return {
+        'source': source,
+        'duration': str(duration),
+        'fps': str(fps),
+        'quality_params': QUALITY_PRESETS.get(quality, QUALITY_PRESETS[DEFAULT_QUALITY]),
+        'threads': threads,
+        'jobs': jobs,
+        'segments': segments,
+        'incremental': bool(incremental),
+        'slideshow': bool(slideshow),
+        'scaled_cache': bool(scaled_cache),
+        'pipe_input': bool(pipe_input),
+        'transition': transition,
+        'transition_duration': str(transition_duration),
+        'poster': bool(poster),
+        'contact_sheet': bool(contact_sheet),
+        'vfr_option': vfr_option
+    }
+
+
+def detect_vfr_option():
+    """
+    설치된 ffmpeg에 맞는 가변 프레임 옵션
+    5.1 미만은 -fps_mode 대신 -vsync 사용 (개발 빌드 "N-..."는 최신으로 간주)
+    ffmpeg가 없으면 OSError / subprocess.CalledProcessError
+    """
+    result = subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True,
+                            text=True, encoding='utf-8', errors='replace')
+    match = re.search(r'ffmpeg version n?(\d+)\.(\d+)', result.stdout)
+    if match and (int(match.group(1)), int(match.group(2))) < (5, 1):
+        return '-vsync'
+    return '-fps_mode'
+
+
+def image_issue_lines(folder_name, broken, rotated, size_count):
+    """헤더 검사 결과 중 주의할 점 → 로그 줄 목록"""
+    lines = []
+    if broken:
+        lines.append(f"⚠ {folder_name}: 손상/읽을 수 없는 이미지 {len(broken)}개 (변환 시 제외)")
+        for name, reason in broken[:5]:
+            lines.append(f"    {name}: {reason}")
+    if rotated:
+        lines.append(f"  {folder_name}: 회전 정보(Exif)가 있는 이미지 {rotated}개 - 회전 없이 인코딩됩니다")
+    if size_count > 1:
+        lines.append(f"  {folder_name}: 이미지 크기 {size_count}종류 - 여백을 넣어 {VIDEO_WIDTH}x{VIDEO_HEIGHT}로 맞춥니다")
+    return lines
+
+
+class VideoConversionEngine:
+    """
+    폴더별 이미지 → 동영상 변환 (화면 없이 동작, 작업 쓰레드에서 실행)
+    진행 상황은 콜백으로 전달:
+    - on_log(message)
+    - on_job(folder_name, job)  작업 상태(status/images/progress/elapsed) 변경
+    - on_overall(current, total, images_done, elapsed)  폴더 하나가 끝날 때마다
+    """
+    
+    def __init__(self, settings, scanner=None, scaled_cache_dir=SCALED_CACHE_DIR,
+                 on_log=None, on_job=None, on_overall=None):
+        self.settings = settings
+        self.scanner = scanner or ImageFolderScanner()
+        self.scaled_cache_dir = scaled_cache_dir
+        self.on_log = on_log or print
+        self.on_job = on_job
+        self.on_overall = on_overall
+        
+        self.is_running = True  # stop() 이후에는 대기 중인 폴더를 시작하지 않음 (엔진 하나 = 실행 한 번)
+        self.jobs = {}  # 폴더명 → 작업 상태
+        self.active_processes = {}  # 작업 키 → 실행 중인 ffmpeg 프로세스
+        self.process_lock = threading.Lock()
+        self.image_cache = None
+    
+    def log(self, message):
+        self.on_log(message)
+    
+    def notify_job(self, folder_name):
+        if self.on_job:
+            self.on_job(folder_name, self.jobs[folder_name])
+    
+    def set_job_status(self, folder_name, status):
+        """폴더별 작업 상태 변경"""
+        self.jobs[folder_name]['status'] = status
+        self.notify_job(folder_name)
+    
+    def log_image_issues(self, folder_name, broken, rotated, size_count):
+        for line in image_issue_lines(folder_name, broken, rotated, size_count):
+            self.log(line)
+    
+    def stop(self):
+        """변환 중지 (실행 중인 ffmpeg 프로세스 종료, 대기 중인 폴더는 취소)"""
+        self.is_running = False
+        with self.process_lock:
+            for process in self.active_processes.values():
+                try:
+                    process.terminate()
+                except OSError:
+                    pass
+    
+    def run(self, folder_names):
+        """
+        폴더 목록 변환 (여러 폴더를 동시에 변환, 끝날 때까지 대기)
+        반환: 리포트 딕셔너리 (폴더별 상태 + 합계)
+        """
+        settings = self.settings
+        source = settings['source']
+        folder_names = list(folder_names)
+        total = len(folder_names)
+        
+        self.jobs = {
+            name: {'status': '대기', 'images': 0, 'elapsed': None, 'progress': None, 'skipped': False, 'error': ''}
+            for name in folder_names
+        }
+        
+        self.log(f"\n========== 변환 작업 시작 ==========")
+        self.log(f"총 {total}개 폴더를 처리합니다. "
+                 f"(동시 {settings['jobs']}개 × 스레드 {settings['threads']}개)")
+        self.log(f"선택된 폴더: {', '.join(folder_names[:5])}" + 
+                 (f" 외 {len(folder_names)-5}개" if len(folder_names) > 5 else ""))
+        
+        completed = 0
+        success_count = 0
+        fail_count = 0
+        skipped_count = 0
+        images_done = 0
+        started_at = datetime.now()
+        start_time = time.monotonic()
+        
+        # 크기 조정 캐시 (이번 실행 동안 모든 폴더 작업이 같은 프로세스 풀 공유)
+        self.image_cache = ScaledImageCache(self.scaled_cache_dir) if settings['scaled_cache'] else None
+        
+        try:
+            with ThreadPoolExecutor(max_workers=settings['jobs']) as executor:
+                futures = [
+                    executor.submit(self.run_folder_job, os.path.join(source, folder_name), folder_name)
+                    for folder_name in folder_names
+                ]
+                
+                for future in as_completed(futures):
+                    folder_name, result = future.result()
+                    if result is None:
+                        continue  # 중지로 건너뜀
+                    
+                    completed += 1
+                    if result and self.jobs[folder_name]['skipped']:
+                        skipped_count += 1
+                    elif result:
+                        success_count += 1
+                        images_done += self.jobs[folder_name]['images']
+                    else:
+                        fail_count += 1
+                    
+                    # 진행률 + 처리량
+                    if self.on_overall:
+                        self.on_overall(completed, total, images_done, time.monotonic() - start_time)
+        
+        finally:
+            if self.image_cache:
+                self.image_cache.close()
+                self.image_cache = None
+            try:
+                self.scanner.save()
+            except OSError:
+                pass
+        
+        # 완료
+        stopped = not self.is_running
+        self.is_running = False
+        elapsed = max(time.monotonic() - start_time, 0.001)
+        
+        if completed > 0:
+            self.log(f"\n========== 변환 작업 완료 ==========")
+            self.log(f"성공: {success_count}개, 실패: {fail_count}개, 변경 없음(건너뜀): {skipped_count}개")
+            self.log(f"처리량: {completed / elapsed * 60:.1f} 폴더/분, "
+                     f"{images_done / elapsed:.1f} 이미지/초 (총 {elapsed:.0f}초)")
+        
+        return {
+            'source': source,
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'elapsed': round(elapsed, 1),
+            'stopped': stopped,
+            'total': total,
+            'completed': completed,
+            'success': success_count,
+            'failed': fail_count,
+            'skipped': skipped_count,
+            'images': images_done,
+            'folders': [
+                {
+                    'folder': name,
+                    'status': job['status'],
+                    'images': job['images'],
+                    'elapsed': round(job['elapsed'], 1) if job['elapsed'] is not None else None,
+                    'output': (os.path.join(source, name, f"{name}.mp4")
+                               if job['status'] in ('완료', '변경 없음') else None),
+                    'poster': (os.path.join(source, name, name + POSTER_SUFFIX)
+                               if settings['poster'] and job['status'] in ('완료', '변경 없음') else None),
+                    'contact_sheet': (os.path.join(source, name, name + CONTACT_SHEET_SUFFIX)
+                                      if settings['contact_sheet'] and job['status'] in ('완료', '변경 없음') else None),
+                    'error': job['error']
+                }
+                for name, job in self.jobs.items()
+            ]
+        }
+    
+    def run_folder_job(self, folder_path, folder_name):
+        """작업 하나 실행 (작업 쓰레드). 반환: (폴더명, 성공 여부 또는 중지 시 None)"""
+        if not self.is_running:
+            self.set_job_status(folder_name, '취소')
+            return folder_name, None
+        
+        self.set_job_status(folder_name, '변환 중')
+        job_start = time.monotonic()
+        result = self.convert_folder_to_video(folder_path, folder_name)
+        
+        self.jobs[folder_name]['elapsed'] = time.monotonic() - job_start
+        if result:
+            self.set_job_status(folder_name, '변경 없음' if self.jobs[folder_name]['skipped'] else '완료')
+        else:
+            self.set_job_status(folder_name, '실패' if self.is_running else '중지')
+        return folder_name, result
+    
+    def run_ffmpeg(self, process_key, cmd, progress_reader=None, on_progress=None, feeder=None):
+        """
+        ffmpeg 실행 (작업 쓰레드). stop()으로 종료할 수 있도록 프로세스 등록
+        feeder가 있으면 별도 쓰레드에서 feeder(stdin)으로 입력 프레임 공급
+        반환: (종료 코드, stderr 마지막 줄들)
+        """
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE if feeder else subprocess.DEVNULL,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        with self.process_lock:
+            self.active_processes[process_key] = process
+        if not self.is_running:
+            process.terminate()
+        
+        # stderr는 오류 표시용으로 마지막 몇 줄만 보관 (긴 인코딩에서도 메모리 일정)
+        stderr_tail = deque(maxlen=50)
+        stderr_lines = io.TextIOWrapper(process.stderr, encoding='utf-8', errors='replace')
+        stderr_thread = threading.Thread(target=stderr_tail.extend, args=(stderr_lines,), daemon=True)
+        stderr_thread.start()
+        
+        feed_errors = []
+        if feeder:
+            def feed():
+                try:
+                    feeder(process.stdin)
+                except Exception as e:
+                    # 일부 프레임만 들어간 영상이 성공으로 남지 않도록 ffmpeg 종료
+                    feed_errors.append(f"입력 이미지 처리 실패: {e}\n")
+                    try:
+                        process.kill()
+                    except OSError:
+                        pass
+                finally:
+                    try:
+                        process.stdin.close()
+                    except OSError:
+                        pass
+            
+            feed_thread = threading.Thread(target=feed, daemon=True)
+            feed_thread.start()
+        
+        try:
+            for line in io.TextIOWrapper(process.stdout, encoding='utf-8', errors='replace'):
+                progress = progress_reader.feed(line) if progress_reader else None
+                if progress and on_progress:
+                    on_progress(progress)
+            process.wait()
+            stderr_thread.join()
+            if feeder:
+                feed_thread.join()
+        finally:
+            with self.process_lock:
+                self.active_processes.pop(process_key, None)
+        
+        if feed_errors:
+            stderr_tail.extend(feed_errors)
+            return process.returncode or 1, stderr_tail
+        return process.returncode, stderr_tail
+    
+    def pipe_mode(self, input_paths, durations, cached):
+        """
+        파이프 입력 방식 결정
+        - 'raw': Pillow로 디코딩/크기 조정한 RGB 프레임 (원본 이미지)
+        - 'jpeg_pipe' 등: 파일 내용 그대로 (크기 조정 캐시 이미지, 또는 Pillow 없이 한 가지 형식)
+        - None: 목록 파일(concat) 사용
+        """
+        if not self.settings['pipe_input']:
+            return None
+        if len(set(durations)) > 1:
+            self.log("  이미지별 표시 시간이 달라 목록 파일로 입력합니다")
+            return None
+        if HAS_PIL and not cached:
+            return 'raw'
+        
+        demuxers = {PIPE_DEMUXERS.get(os.path.splitext(path)[1].lower()) for path in input_paths}
+        if len(demuxers) == 1 and None not in demuxers:
+            return demuxers.pop()
+        self.log("  이미지 형식이 섞여 있어 목록 파일로 입력합니다 (Pillow 설치 시 파이프 입력 가능)")
+        return None
+    
+    def build_input(self, input_paths, durations, pipe_mode, work_dir, name):
+        """
+        ffmpeg 입력 옵션 + stdin 공급 함수
+        파이프 입력은 이미지당 프레임 1장 (프레임레이트 = 1 / 표시 시간), 목록 파일은 임시 폴더에 생성
+        반환: (입력 옵션 목록, 공급 함수 또는 None)
+        """
+        settings = self.settings
+        if pipe_mode:
+            rate = frame_rate_for(durations[0])
+            raw = pipe_mode == 'raw'
+            if raw:
+                input_args = ['-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{VIDEO_WIDTH}x{VIDEO_HEIGHT}']
+            else:
+                input_args = ['-f', pipe_mode]
+            feeder = lambda stdin: feed_frames(stdin, input_paths, raw, settings['threads'])
+            return [*input_args, '-framerate', rate, '-i', '-'], feeder
+        
+        list_file = os.path.join(work_dir, f"{name}.txt")
+        write_concat_list(list_file, input_paths, durations)
+        return ['-f', 'concat', '-safe', '0', '-i', list_file], None
+    
+    def update_job_progress(self, folder_name, progress):
+        self.jobs[folder_name]['progress'] = progress
+        self.notify_job(folder_name)
+    
+    def filter_args(self, poster, sheet_frames, tile=True):
+        """
+        동영상 필터 옵션 (크기 조정은 이미지 한 장당 한 번)
+        포스터/콘택트 시트가 있으면 크기 조정 결과를 분기하는 필터 그래프 ([poster]/[sheet] 라벨)
+        """
+        settings = self.settings
+        scale_filter = (f'scale={VIDEO_WIDTH}:{VIDEO_HEIGHT}:force_original_aspect_ratio=decrease,'
+                        f'pad={VIDEO_WIDTH}:{VIDEO_HEIGHT}:(ow-iw)/2:(oh-ih)/2')
+        # 슬라이드쇼가 아니면 출력 FPS로 프레임 복제 (분기 뒤에 적용 → 썸네일 프레임 번호 = 이미지 번호)
+        rate_filter = None if settings['slideshow'] else f'fps={settings["fps"]}'
+        
+        if not poster and not sheet_frames:
+            return ['-vf', f'{scale_filter},{rate_filter}' if rate_filter else scale_filter]
+        
+        graph = f"[0:v]{scale_filter}[main];" + build_asset_graph('main', rate_filter or 'null', poster,
+                                                                  sheet_frames, tile)
+        return ['-filter_complex', graph, '-map', '[vout]']
+    
+    def encode_folder(self, folder_name, input_paths, durations, pipe_mode, work_dir, encode_args, output_file,
+                      assets):
+        """
+        폴더 하나 인코딩 (전환 효과는 필터 그래프로, 큰 폴더는 구간별로 동시에)
+        assets: 함께 저장할 포스터/콘택트 시트 경로 ({'poster': 경로 또는 None, 'sheet': 경로 또는 None})
+        반환: (종료 코드, stderr 마지막 줄들)
+        """
+        settings = self.settings
+        picks = contact_sheet_picks(len(input_paths)) if assets['sheet'] else []
+        if settings['transition'] != 'none':
+            return self.encode_with_transitions(folder_name, input_paths, durations, work_dir, output_file,
+                                                assets, picks)
+        
+        segment_count = min(settings['segments'], len(input_paths) // SEGMENT_MIN_IMAGES)
+        if segment_count > 1:
+            return self.encode_segments(folder_name, input_paths, durations, pipe_mode, work_dir, encode_args,
+                                        output_file, segment_count, assets, picks)
+        
+        input_args, feeder = self.build_input(input_paths, durations, pipe_mode, work_dir, "input")
+        cmd = [
+            'ffmpeg',
+            '-y',  # 기존 파일 덮어쓰기
+            *input_args,
+            *self.filter_args(assets['poster'], picks),
+            *encode_args,
+            '-progress', 'pipe:1',  # 진행 상태를 stdout으로 (key=value)
+            '-nostats',
+            output_file,
+            *asset_output_args(assets)  # 포스터/콘택트 시트도 같은 디코딩 결과에서
+        ]
+        
+        # 예상 길이: 이미지 수 × 표시 시간 (슬라이드쇼 모드는 이미지당 1프레임)
+        total_seconds = sum(durations)
+        total_frames = len(input_paths) if settings['slideshow'] else round(total_seconds * float(settings['fps']))
+        progress_reader = FFmpegProgressReader(total_frames, total_seconds)
+        
+        return self.run_ffmpeg(folder_name, cmd, progress_reader,
+                               lambda progress: self.update_job_progress(folder_name, progress), feeder)
+    
+    def encode_with_transitions(self, folder_name, input_paths, durations, work_dir, output_file, assets, picks):
+        """
+        전환 효과(크로스페이드/줌)를 필터 그래프 하나로 처리해 한 번에 인코딩 (고정 FPS)
+        그래프는 명령줄 길이 제한을 피하려고 임시 폴더의 스크립트 파일로 전달
+        """
+        settings = self.settings
+        fade_seconds = float(settings['transition_duration'])
+        graph = build_transition_graph(input_paths, durations, settings['fps'], settings['transition'], fade_seconds)
+        output_label = 'out'
+        if assets['poster'] or picks:
+            fade_seconds = clamp_fade_seconds(durations, settings['transition'], fade_seconds)
+            sheet_frames = transition_sheet_frames(durations, picks, settings['fps'], fade_seconds)
+            graph = graph.rstrip('\n') + ';\n' + build_asset_graph('out', 'null', assets['poster'], sheet_frames) + '\n'
+            output_label = 'vout'
+        
+        graph_file = os.path.join(work_dir, "filter_graph.txt")
+        with open(graph_file, 'w', encoding='utf-8') as f:
+            f.write(graph)
+        
+        cmd = [
+            'ffmpeg', '-y',
+            '-filter_complex_script', graph_file,
+            '-map', f'[{output_label}]',
+            '-pix_fmt', 'yuv420p',
+            *settings['quality_params'].split(),
+            '-threads', str(settings['threads']),
+            '-progress', 'pipe:1', '-nostats',
+            output_file,
+            *asset_output_args(assets)
+        ]
+        
+        total_seconds = sum(durations)
+        progress_reader = FFmpegProgressReader(round(total_seconds * float(settings['fps'])), total_seconds)
+        return self.run_ffmpeg(folder_name, cmd, progress_reader,
+                               lambda progress: self.update_job_progress(folder_name, progress))
+    
+    def encode_segments(self, folder_name, input_paths, durations, pipe_mode, work_dir, encode_args, output_file,
+                        segment_count, assets, picks):
+        """
+        큰 폴더: 이미지 목록을 구간으로 나눠 동시에 인코딩한 뒤 concat 스트림 복사로 연결
+        포스터는 첫 구간에서, 콘택트 시트 썸네일은 각 구간에서 저장한 뒤 연결할 때 격자로 합침
+        반환: (종료 코드, stderr 마지막 줄들)
+        """
+        settings = self.settings
+        
+        # 구간 경계는 이미지 단위 (구간 길이 = 구간 이미지들의 표시 시간 합)
+        size, extra = divmod(len(input_paths), segment_count)
+        chunks = []
+        chunk_starts = []
+        start = 0
+        for index in range(segment_count):
+            end = start + size + (1 if index < extra else 0)
+            chunks.append((input_paths[start:end], durations[start:end]))
+            chunk_starts.append(start)
+            start = end
+        thumb_pattern = os.path.join(work_dir, "thumb_%03d.jpg")
+        
+        chunk_seconds = [sum(chunk_durations) for _, chunk_durations in chunks]
+        parts = [None] * segment_count  # 구간별 최근 진행 상태
+        self.log(f"  {segment_count}개 구간으로 나눠 동시 인코딩 (구간당 약 {size}개 이미지)")
+        
+        def encode_chunk(index):
+            chunk_paths, chunk_durations = chunks[index]
+            input_args, feeder = self.build_input(chunk_paths, chunk_durations, pipe_mode, work_dir,
+                                                  f"part_{index:03d}")
+            
+            seconds = chunk_seconds[index]
+            frames = len(chunk_paths) if settings['slideshow'] else round(seconds * float(settings['fps']))
+            
+            def on_progress(progress):
+                parts[index] = progress
+                self.jobs[folder_name]['progress'] = combine_progress(parts, chunk_seconds)
+                self.notify_job(folder_name)
+            
+            # 이 구간에 들어가는 콘택트 시트 이미지 (썸네일 파일 번호 = 전체 선택 목록에서의 순서)
+            chunk_start = chunk_starts[index]
+            chunk_picks = [(number, pick - chunk_start) for number, pick in enumerate(picks)
+                           if chunk_start <= pick < chunk_start + len(chunk_paths)]
+            poster = assets['poster'] if index == 0 else None
+            
+            asset_args = asset_output_args({'poster': poster})
+            if chunk_picks:
+                asset_args += ['-map', '[sheet]', '-q:v', '2', '-start_number', str(chunk_picks[0][0]),
+                               thumb_pattern]
+            
+            cmd = [
+                'ffmpeg', '-y',
+                *input_args,
+                *self.filter_args(poster, [frame for _, frame in chunk_picks], tile=False),
+                *encode_args,
+                '-t', f'{seconds:.6f}',  # 끝에 반복한 마지막 이미지는 제외 → 구간 길이 고정
+                '-progress', 'pipe:1', '-nostats',
+                os.path.join(work_dir, f"part_{index:03d}.mp4"),
+                *asset_args
+            ]
+            return self.run_ffmpeg((folder_name, index), cmd, FFmpegProgressReader(frames, seconds), on_progress,
+                                   feeder)
+        
+        with ThreadPoolExecutor(max_workers=segment_count) as executor:
+            results = list(executor.map(encode_chunk, range(segment_count)))
+        
+        for returncode, stderr_tail in results:
+            if returncode != 0:
+                return returncode, stderr_tail
+        
+        # 구간 연결: 각 구간 길이를 명시해 다음 구간 시작 시각이 정확히 이어지도록 함
+        join_file = os.path.join(work_dir, "join.txt")
+        with open(join_file, 'w', encoding='utf-8') as f:
+            for index, seconds in enumerate(chunk_seconds):
+                f.write(f"file 'part_{index:03d}.mp4'\n")
+                f.write(f"duration {seconds:.6f}\n")
+        
+        cmd = [
+            'ffmpeg', '-y',
+            '-f', 'concat', '-safe', '0',
+            '-i', join_file
+        ]
+        if picks:
+            # 구간별 썸네일(작은 JPEG)만 다시 읽어 격자 한 장으로
+            cmd += ['-framerate', '1', '-i', thumb_pattern,
+                    '-filter_complex', f"[1:v]{tile_filter(len(picks))}[sheet]"]
+        cmd += [
+            '-map', '0:v',
+            '-c', 'copy',  # 재인코딩 없이 이어붙임
+            output_file,
+            *asset_output_args({'sheet': assets['sheet']})
+        ]
+        return self.run_ffmpeg((folder_name, 'join'), cmd)
+    
+    def convert_folder_to_video(self, folder_path, folder_name):
+        """개별 폴더를 동영상으로 변환 (작업 쓰레드에서 실행)"""
+        settings = self.settings
+        
+        try:
+            # 이미지 파일 찾기 (파일명 순서대로 정렬, 폴더가 그대로면 캐시 사용)
+            images = self.scanner.list_images(folder_path)
+            
+            # 손상된 이미지는 ffmpeg 실패 전에 제외
+            broken, rotated, size_count = describe_image_issues(self.scanner.probe_folder(folder_path, images))
+            if broken:
+                broken_names = {name for name, _ in broken}
+                images = [name for name in images if name not in broken_names]
+            self.log_image_issues(folder_name, broken, rotated, size_count)
+            
+            if not images:
+                self.jobs[folder_name]['error'] = "이미지 파일 없음"
+                self.log(f"⚠ {folder_name}: 이미지 파일이 없습니다.")
+                return False
+            
+            self.jobs[folder_name]['images'] = len(images)
+            self.log(f"📁 {folder_name}: {len(images)}개 이미지 발견")
+            
+            # 첫 번째 이미지 정보 확인
+            first_image_path = os.path.join(folder_path, images[0])
+            self.log(f"  첫 번째 이미지: {images[0]}")
+            
+            # 출력 파일명 (원본 폴더에 저장)
+            output_filename = f"{folder_name}.mp4"
+            output_file = os.path.join(folder_path, output_filename)
+            
+            # 이미지별 표시 시간 (slides.txt)
+            durations, has_timing, ignored = load_slide_durations(folder_path, images, settings['duration'])
+            if has_timing:
+                self.log(f"  {SLIDE_TIMING_FILENAME}: 이미지별 표시 시간 적용 (총 {sum(durations):.1f}초)")
+            for line in ignored[:5]:
+                self.log(f"  {SLIDE_TIMING_FILENAME} 무시: {line}")
+            
+            # 함께 저장할 포스터/콘택트 시트 (동영상 옆)
+            assets = {
+                'poster': os.path.join(folder_path, folder_name + POSTER_SUFFIX) if settings['poster'] else None,
+                'sheet': (os.path.join(folder_path, folder_name + CONTACT_SHEET_SUFFIX)
+                          if settings['contact_sheet'] else None)
+            }
+            
+            # 이미지/설정이 지난번 변환과 같고 결과 파일이 모두 있으면 건너뜀
+            manifest = build_video_manifest(folder_path, images, settings, durations if has_timing else None)
+            if (settings['incremental'] and manifest_matches(folder_path, output_file, manifest)
+                    and all(os.path.exists(path) for path in assets.values() if path)):
+                self.jobs[folder_name]['skipped'] = True
+                self.log(f"⏭ {folder_name}: 변경 없음, 기존 동영상 유지")
+                return True
+            
+            # 기존 파일이 있는지 확인
+            if os.path.exists(output_file):
+                self.log(f"  기존 파일 덮어쓰기: {folder_name}.mp4")
+            
+            # 입력 이미지: 크기 조정 캐시 사용 시 캐시 이미지 (실패하면 원본 사용)
+            input_paths = [os.path.join(folder_path, img) for img in images]
+            cached = False
+            if self.image_cache:
+                try:
+                    input_paths, built = self.image_cache.get_many(input_paths)
+                    cached = True
+                    self.log(f"  크기 조정 캐시: {len(images) - built}개 재사용, {built}개 새로 생성")
+                except Exception as e:
+                    self.log(f"  크기 조정 캐시 실패, 원본 이미지 사용: {str(e)}")
+            
+            # FFmpeg 인코딩 옵션 (구간 분할 시 모든 구간이 같은 옵션이어야 스트림 복사로 이어붙일 수 있음)
+            # 필터(크기 조정/포스터·시트 분기)는 filter_args에서
+            quality_params = settings['quality_params']
+            if settings['slideshow']:
+                # 이미지 한 장 = 프레임 한 장 (크기 조정도 이미지당 한 번), 표시 시간은 컨테이너 타임스탬프로 유지
+                # 슬라이드마다 키프레임을 넣어 탐색이 정확하고, 정지 화면용 튜닝 사용
+                video_args = [
+                    settings['vfr_option'], 'vfr',
+                    '-tune', 'stillimage',
+                    '-force_key_frames', 'expr:1'
+                ]
+            else:
+                video_args = []
+            
+            encode_args = [
+                *video_args,
+                '-pix_fmt', 'yuv420p',  # 호환성을 위해
+                *quality_params.split(),
+                '-threads', str(settings['threads'])
+            ]
+            
+            # 목록 파일/구간 영상은 원본 폴더가 아닌 임시 폴더에 (중간에 종료돼도 사진 폴더에 남지 않음)
+            pipe_mode = self.pipe_mode(input_paths, durations, cached)
+            work_dir = tempfile.mkdtemp(prefix="image_to_video_")
+            try:
+                returncode, stderr_tail = self.encode_folder(
+                    folder_name, input_paths, durations, pipe_mode, work_dir, encode_args, output_file, assets)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            
+            if returncode != 0 and not self.is_running:
+                self.log(f"■ {folder_name}: 변환 중지됨")
+                return False
+            
+            if returncode == 0:
+                save_manifest(folder_path, output_file, manifest)
+                self.log(f"✓ {folder_name}: 변환 완료! → {output_filename}")
+                return True
+            else:
+                self.log(f"✗ {folder_name}: 변환 실패")
+                error_msg = ''.join(stderr_tail)
+                self.jobs[folder_name]['error'] = error_msg.strip().split('\n')[-1] if error_msg.strip() else "알 수 없는 오류"
+                if error_msg.strip():
+                    # 긴 오류 메시지는 주요 부분만 표시
+                    error_lines = error_msg.strip().split('\n')
+                    for line in error_lines[-5:]:  # 마지막 5줄만 표시
+                        if line.strip():
+                            self.log(f"  오류: {line.strip()}")
+                else:
+                    self.log(f"  오류: 알 수 없는 오류 (이미지 크기가 다르거나 파일명에 특수문자가 있을 수 있습니다)")
+                return False
+                
+        except Exception as e:
+            self.jobs[folder_name]['error'] = str(e)
+            self.log(f"✗ {folder_name}: 오류 발생 - {str(e)}")
+            return False
+
+
+# ===== 명령줄 실행 (화면 없이 일괄 변환) =====
+class JsonLinesReporter:
+    """진행 상황을 JSON 한 줄씩 출력 (다른 프로그램/로그 수집기에서 읽기 쉽게)"""
+    
+    def __init__(self, stream=None, progress_interval=1.0):
+        self.stream = stream or sys.stdout
+        self.progress_interval = progress_interval  # 같은 폴더 진행률은 이 간격(초)마다만 출력
+        self.lock = threading.Lock()
+        self.last_job_event = {}  # 폴더명 → (상태, 출력 시각)
+    
+    def emit(self, event, **fields):
+        line = json.dumps({'event': event, 'time': datetime.now().isoformat(timespec='seconds'), **fields},
+                          ensure_ascii=False)
+        with self.lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+    
+    def on_log(self, message):
+        for line in str(message).split('\n'):
+            if line.strip():
+                self.emit('log', message=line)
+    
+    def on_job(self, folder_name, job):
+        now = time.monotonic()
+        last = self.last_job_event.get(folder_name)
+        if last and last[0] == job['status'] and now - last[1] < self.progress_interval:
+            return
+        self.last_job_event[folder_name] = (job['status'], now)
+        
+        progress = job['progress'] or {}
+        self.emit('job', folder=folder_name, status=job['status'], images=job['images'],
+                  percent=round(progress.get('percent', 0.0), 1), fps=progress.get('fps'),
+                  speed=progress.get('speed'), eta=progress.get('eta'),
+                  elapsed=round(job['elapsed'], 1) if job['elapsed'] is not None else None)
+    
+    def on_overall(self, current, total, images_done, elapsed):
+        self.emit('overall', completed=current, total=total, images=images_done, elapsed=round(elapsed, 1))
+
+
+def load_job_file(path):
+    """작업 파일(JSON) 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+    if not isinstance(job, dict):
+        raise ValueError("작업 파일은 JSON 객체여야 합니다")
+    return job
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 폴더 → 동영상 일괄 변환 (화면 없이 실행)")
+    parser.add_argument('source', nargs='?', help="원본 폴더 (하위 폴더마다 동영상 하나)")
+    parser.add_argument('--job', help="작업 파일 (JSON: source, folders, duration, fps, quality, jobs, ...)")
+    parser.add_argument('--folders', nargs='+', help="변환할 하위 폴더명 (기본값: 이미지가 있는 모든 폴더)")
+    parser.add_argument('--duration', help="이미지당 표시 시간(초) (기본값: 1.0)")
+    parser.add_argument('--fps', help="FPS (기본값: 30)")
+    parser.add_argument('--quality', choices=sorted(QUALITY_PRESETS), help="동영상 품질 (기본값: high)")
+    parser.add_argument('--jobs', type=int, help="동시 변환 폴더 수 (기본값: CPU 수 / 2)")
+    parser.add_argument('--threads', type=int, help="작업당 스레드 수 (기본값: 2)")
+    parser.add_argument('--segments', type=int, help="큰 폴더 분할 구간 수 (기본값: 1)")
+    parser.add_argument('--incremental', action=argparse.BooleanOptionalAction, default=None,
+                        help="변경 없는 폴더 건너뛰기 (기본값: 사용)")
+    parser.add_argument('--slideshow', action=argparse.BooleanOptionalAction, default=None,
+                        help="정지 이미지 최적화 인코딩 (기본값: 사용)")
+    parser.add_argument('--scaled-cache', action=argparse.BooleanOptionalAction, default=None,
+                        help="크기 조정 이미지 캐시 (기본값: 사용)")
+    parser.add_argument('--transition', choices=TRANSITIONS, help="전환 효과 (기본값: none)")
+    parser.add_argument('--transition-duration', help="크로스페이드 시간(초) (기본값: 0.5)")
+    parser.add_argument('--poster', action=argparse.BooleanOptionalAction, default=None,
+                        help=f"첫 장면을 <폴더명>{POSTER_SUFFIX}로 함께 저장 (기본값: 사용 안 함)")
+    parser.add_argument('--contact-sheet', action=argparse.BooleanOptionalAction, default=None,
+                        help=f"썸네일 격자를 <폴더명>{CONTACT_SHEET_SUFFIX}로 함께 저장 (기본값: 사용 안 함)")
+    parser.add_argument('--pipe-input', action=argparse.BooleanOptionalAction, default=None,
+                        help="목록 파일 없이 stdin으로 프레임 전달 (기본값: 사용 안 함)")
+    parser.add_argument('--cache-dir', default=".", help="스캔/크기 조정 캐시 위치 (기본값: 현재 폴더)")
+    parser.add_argument('--report', help="최종 리포트 저장 경로 (JSON)")
+    args = parser.parse_args()
+    
+    # 기본값 < 작업 파일 < 명령줄 옵션
+    options = {'duration': "1.0", 'fps': "30", 'quality': DEFAULT_QUALITY, 'threads': 2, 'jobs': None,
+               'segments': 1, 'incremental': True, 'slideshow': True, 'scaled_cache': True, 'pipe_input': False,
+               'transition': 'none', 'transition_duration': "0.5", 'poster': False, 'contact_sheet': False}
+    job = {}
+    if args.job:
+        try:
+            job = load_job_file(args.job)
+        except (OSError, ValueError) as e:
+            parser.error(f"작업 파일을 읽을 수 없습니다: {e}")
+        options.update({key: value for key, value in job.items() if key in options})
+    options.update({key: value for key, value in vars(args).items() if key in options and value is not None})
+    
+    source = args.source or job.get('source')
+    if not source or not os.path.isdir(source):
+        parser.error(f"원본 폴더가 없습니다: {source}")
+    
+    reporter = JsonLinesReporter()
+    try:
+        vfr_option = detect_vfr_option()
+    except (OSError, subprocess.CalledProcessError):
+        reporter.emit('error', message="FFmpeg가 설치되어 있지 않습니다.")
+        return 2
+    
+    try:
+        settings = make_job_settings(source, vfr_option=vfr_option, **options)
+    except (TypeError, ValueError) as e:
+        parser.error(f"설정 값이 잘못되었습니다: {e}")
+    
+    scanner = ImageFolderScanner(os.path.join(args.cache_dir, SCAN_CACHE_FILE))
+    folder_names = args.folders or job.get('folders') or sorted(scanner.scan_tree(source))
+    
+    engine = VideoConversionEngine(
+        settings, scanner=scanner, scaled_cache_dir=os.path.join(args.cache_dir, SCALED_CACHE_DIR),
+        on_log=reporter.on_log, on_job=reporter.on_job, on_overall=reporter.on_overall
+    )
+    
+    # 변환은 별도 쓰레드에서 실행 (Ctrl+C → 실행 중인 ffmpeg 종료 후 리포트 출력)
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(report=engine.run(folder_names)), daemon=True)
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(0.5)
+    except KeyboardInterrupt:
+        engine.stop()
+        reporter.emit('log', message="중지 요청: 실행 중인 변환을 종료합니다.")
+        worker.join()
+    
+    report = result.get('report')
+    if report is None:
+        reporter.emit('error', message="변환 중 오류가 발생했습니다.")
+        return 1
+    
+    reporter.emit('report', **report)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    return 1 if report['failed'] or report['stopped'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,645 @@
+"""
+사진 분배 엔진 (화면 없이 동작, Photo_mover_v2.py에서 사용)
+- 소스 폴더 사진 목록/타겟 폴더 파일명 목록을 실행마다 한 번만 스캔
+- 실제 이동 전에 전체 이동 계획(소스 → 대상 경로)을 메모리에서 계산 (미리보기, 부족 수량/이름 충돌 보고)
+- 계획을 실행하면서 한 줄씩 추가만 하는 작업 기록(JSON Lines) 저장
+  → 중간에 종료돼도 이어서 실행, 기록을 거꾸로 따라가며 되돌리기
+- 이동은 쓰레드 풀에서 동시에: 같은 드라이브는 os.rename, 다른 드라이브는 커널 복사(copy_file_range/sendfile) 후 원본 삭제
+
+작업 기록 한 줄 예:
+    {"event": "plan", "created": "...", "moves": [{"source": "...", "destination": "..."}, ...]}
+    {"event": "move", "index": 0}
+    {"event": "end"}
+    {"event": "undo", "index": 0}
+"""
+
+import os
+import json
+import errno
+import random
+import shutil
+from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
+
+
+# 지원할 사진 확장자 목록 (소문자 확장자로 한 번에 조회)
+PHOTO_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
+
+# 소스 폴더 동시 스캔 수 (네트워크 드라이브는 폴더마다 대기 시간이 길어 동시에 읽음)
+SCAN_WORKERS = 8
+
+
+class PhotoSourceIndex:
+    """
+    실행 한 번 동안 쓰는 소스 폴더별 남은 사진 목록
+    - 폴더마다 os.scandir 한 번 (여러 폴더는 동시에 스캔)
+    - 꺼낸 사진은 목록에서 바로 빠짐 (이동할 사진 = 이미 가져간 사진, 다시 스캔하지 않음)
+    - 꺼내기는 목록 끝에서 pop → 가져올 수량만큼만 작업
+    """
+
+    def __init__(self, selection_mode="sequential"):
+        self.selection_mode = selection_mode
+        self.remaining = {}  # 폴더 경로 → 남은 사진 경로 목록 (순서대로 모드는 역순 정렬, 끝이 다음 차례)
+        self.errors = {}  # 폴더 경로 → 스캔 오류
+
+    @staticmethod
+    def scan_folder(folder_path):
+        """폴더의 사진 파일 경로 목록 (하위 폴더 제외)"""
+        photos = []
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in PHOTO_EXTENSIONS and entry.is_file():
+                    photos.append(entry.path)
+        return photos
+
+    def _store(self, folder_path, photos):
+        if self.selection_mode == "random":
+            self.remaining[folder_path] = photos
+        else:  # sequential
+            photos.sort(reverse=True)
+            self.remaining[folder_path] = photos
+
+    def scan_all(self, folder_paths):
+        """아직 스캔하지 않은 폴더들을 동시에 스캔"""
+        pending = [path for path in dict.fromkeys(folder_paths)
+                   if path not in self.remaining and path not in self.errors]
+        if not pending:
+            return
+
+        def scan(folder_path):
+            try:
+                return folder_path, self.scan_folder(folder_path), None
+            except OSError as e:
+                return folder_path, None, e
+
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(pending))) as executor:
+            for folder_path, photos, error in executor.map(scan, pending):
+                if error is not None:
+                    self.errors[folder_path] = error
+                else:
+                    self._store(folder_path, photos)
+
+    def available(self, folder_path):
+        """남은 사진 수 (스캔 오류 시 OSError)"""
+        self.scan_all([folder_path])
+        if folder_path in self.errors:
+            raise self.errors[folder_path]
+        return len(self.remaining[folder_path])
+
+    def take(self, folder_path, count):
+        """사진 최대 count장을 꺼냄 (순서대로: 정렬 순, 무작위: 남은 사진 중 임의 선택)"""
+        self.available(folder_path)
+        photos = self.remaining[folder_path]
+        count = min(count, len(photos))
+
+        taken = []
+        if self.selection_mode == "random":
+            # 임의 위치를 끝 원소와 바꾼 뒤 pop (한 장당 O(1))
+            for _ in range(count):
+                index = random.randrange(len(photos))
+                photos[index], photos[-1] = photos[-1], photos[index]
+                taken.append(photos.pop())
+        else:  # sequential
+            for _ in range(count):
+                taken.append(photos.pop())
+        return taken
+
+
+class TargetNameRegistry:
+    """
+    타겟 폴더별 사용 중인 파일명 (폴더당 os.scandir 한 번) + 이름별 다음 번호
+    - 새 이름을 정하면 바로 등록 → 같은 실행 안에서 겹치지 않음
+    - 번호는 이름별로 이어서 증가 → 폴더를 채우는 동안 1부터 다시 확인하지 않음
+    - 대소문자를 구분하지 않는 파일 시스템(Windows)에 맞춰 os.path.normcase로 비교
+    """
+
+    def __init__(self):
+        self.names = {}  # 타겟 폴더 → 사용 중인 파일명 집합 (normcase)
+        self.next_numbers = {}  # (타겟 폴더, 이름, 확장자) → 다음에 확인할 번호
+
+    def _names(self, target_folder):
+        names = self.names.get(target_folder)
+        if names is None:
+            names = set()
+            try:
+                with os.scandir(target_folder) as entries:
+                    for entry in entries:
+                        names.add(os.path.normcase(entry.name))
+            except FileNotFoundError:
+                pass  # 아직 없는 폴더 (이동 전에 생성)
+            self.names[target_folder] = names
+        return names
+
+    def is_free(self, target_folder, filename):
+        return os.path.normcase(filename) not in self._names(target_folder)
+
+    def reserve(self, target_folder, filename):
+        self._names(target_folder).add(os.path.normcase(filename))
+        return filename
+
+    def numbered(self, target_folder, base, ext, separator=""):
+        """비어 있는 '<base><separator><번호><ext>' 이름 (번호는 1부터, 이름별로 이어서)"""
+        names = self._names(target_folder)
+        key = (target_folder, os.path.normcase(base + separator), os.path.normcase(ext))
+        number = self.next_numbers.get(key, 1)
+        filename = f"{base}{separator}{number}{ext}"
+        while os.path.normcase(filename) in names:
+            number += 1
+            filename = f"{base}{separator}{number}{ext}"
+        self.next_numbers[key] = number + 1
+        return self.reserve(target_folder, filename)
+
+    def unique(self, target_folder, filename):
+        """filename이 비어 있으면 그대로, 아니면 '<이름>_<번호><확장자>'"""
+        if self.is_free(target_folder, filename):
+            return self.reserve(target_folder, filename)
+        name_part, ext_part = os.path.splitext(filename)
+        return self.numbered(target_folder, name_part, ext_part, separator="_")
+
+
+# 작업 기록 폴더 (실행 위치와 상관없이 프로그램 폴더 기준 → 바로가기/다른 위치에서 실행해도 같은 기록 사용)
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "photo_mover_journal")
+JOURNAL_PREFIX = "move_"
+JOURNAL_SUFFIX = ".jsonl"
+
+# 파일 이동: 동시 이동 수 (다른 드라이브/네트워크 복사는 대기 시간이 길어 여러 개를 동시에)
+MOVE_WORKERS = 4
+COPY_BUFFER_SIZE = 8 * 1024 * 1024  # 커널 복사를 못 쓸 때 읽기/쓰기 버퍼
+KERNEL_COPY_CHUNK = 64 * 1024 * 1024  # copy_file_range/sendfile 한 번에 요청할 크기
+KERNEL_COPY_UNSUPPORTED = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP,
+                           errno.EBADF, errno.ENOTSOCK, errno.EPERM}
+PARTIAL_SUFFIX = ".part"  # 다른 드라이브로 복사 중인 임시 파일
+
+# 파일 이름 처리 방식
+FILENAME_OPTIONS = ('category_prefix', 'original_number', 'category_sequential')
+
+
+def make_target_name(registry: TargetNameRegistry, original_filepath: str, category_name: str,
+                     target_folder: str, option: str) -> Tuple[str, bool]:
+    """
+    타겟 폴더에서 겹치지 않는 새 파일명 (정한 이름은 바로 사용 중으로 등록)
+    반환: (파일명, 원하던 이름이 이미 있어 번호를 붙였는지)
+    """
+    original_filename = os.path.basename(original_filepath)
+    ext_part = os.path.splitext(original_filename)[1]
+
+    if option == "category_sequential":
+        return registry.numbered(target_folder, category_name, ext_part), False
+
+    if option == "category_prefix":
+        # 다른 소스에 같은 파일명이 있어도 덮어쓰지 않도록 겹치면 번호 추가
+        preferred = f"{category_name}_{original_filename}"
+    else:  # original_number
+        preferred = original_filename
+    renamed = not registry.is_free(target_folder, preferred)
+    return registry.unique(target_folder, preferred), renamed
+
+
+# ===== 이동 계획 =====
+@dataclass
+class PlannedMove:
+    """파일 하나 이동 (source → destination)"""
+    source: str
+    destination: str
+
+    @property
+    def target(self) -> str:
+        return os.path.dirname(self.destination)
+
+
+@dataclass
+class MovePlan:
+    """전체 이동 계획 + 실행 전에 알려줄 문제"""
+    moves: List[PlannedMove] = field(default_factory=list)
+    shortfalls: List[str] = field(default_factory=list)  # 요청 수량보다 사진이 적은 경우
+    conflicts: List[str] = field(default_factory=list)  # 이름이 겹쳐 번호를 붙인 경우, 소스와 같은 타겟 등
+    errors: List[str] = field(default_factory=list)  # 읽을 수 없는 소스 폴더 등
+
+    @property
+    def has_issues(self) -> bool:
+        return bool(self.shortfalls or self.conflicts or self.errors)
+
+    def target_counts(self) -> Dict[str, int]:
+        counts = {}
+        for move in self.moves:
+            counts[move.target] = counts.get(move.target, 0) + 1
+        return counts
+
+    def summary_lines(self, limit: int = 20) -> List[str]:
+        """미리보기/확인 창에 보여줄 요약 (항목별 최대 limit줄)"""
+        counts = self.target_counts()
+        lines = [f"이동 예정: {len(self.moves)}개 파일 → 타겟 폴더 {len(counts)}개"]
+        for title, items in (("오류", self.errors), ("수량 부족", self.shortfalls), ("충돌", self.conflicts)):
+            if not items:
+                continue
+            lines.append(f"\n[{title}] {len(items)}건")
+            lines.extend(f"  {item}" for item in items[:limit])
+            if len(items) > limit:
+                lines.append(f"  ... 외 {len(items) - limit}건")
+        return lines
+
+
+def build_move_plan(sources: List[Dict], targets: List[str], filename_option: str,
+                    selection_mode: str = "sequential") -> MovePlan:
+    """
+    파일을 옮기지 않고 전체 이동 계획 계산 (타겟 순서대로, 타겟마다 소스별 수량만큼)
+    sources: [{'path': 소스 폴더, 'count': 타겟당 가져올 수량}, ...]
+    """
+    plan = MovePlan()
+    source_index = PhotoSourceIndex(selection_mode)
+    source_index.scan_all(source['path'] for source in sources)
+    registry = TargetNameRegistry()
+
+    for folder_path, error in source_index.errors.items():
+        plan.errors.append(f"소스 폴더를 읽을 수 없습니다: {folder_path} ({error})")
+
+    source_keys = {os.path.normcase(os.path.abspath(source['path'])) for source in sources}
+    renamed_counts = {}
+
+    for target_path in targets:
+        if os.path.exists(target_path) and not os.path.isdir(target_path):
+            plan.errors.append(f"타겟 경로가 폴더가 아닙니다: {target_path}")
+            continue
+        if os.path.normcase(os.path.abspath(target_path)) in source_keys:
+            plan.conflicts.append(f"타겟 폴더가 소스 폴더와 같습니다: {target_path}")
+
+        for source in sources:
+            folder_path = source['path']
+            if folder_path in source_index.errors:
+                continue
+
+            count = source['count']
+            available = source_index.available(folder_path)
+            if available < count:
+                plan.shortfalls.append(f"{os.path.basename(target_path)} ← {os.path.basename(folder_path)}: "
+                                       f"요청 {count}장, 남은 사진 {available}장")
+
+            category_name = os.path.basename(folder_path)
+            for photo_path in source_index.take(folder_path, count):
+                new_filename, renamed = make_target_name(registry, photo_path, category_name, target_path,
+                                                         filename_option)
+                if renamed:
+                    renamed_counts[target_path] = renamed_counts.get(target_path, 0) + 1
+                plan.moves.append(PlannedMove(photo_path, os.path.join(target_path, new_filename)))
+
+    for target_path, renamed in renamed_counts.items():
+        plan.conflicts.append(f"{os.path.basename(target_path)}: 같은 이름이 있어 번호를 붙일 파일 {renamed}개")
+
+    return plan
+
+
+# ===== 작업 기록 (한 줄씩 추가만 함) =====
+class MoveJournal:
+    """
+    이동 작업 기록 파일 (JSON Lines, 추가만 함)
+    - 첫 줄에 전체 계획 → 중간에 종료돼도 같은 계획으로 이어서 실행
+    - 파일을 옮긴 뒤에 'move' 기록 (기록 전에 종료된 이동은 이어서 실행할 때 파일 위치로 확인)
+    - 되돌리기는 'move' 기록을 거꾸로 따라가며 'undo' 기록
+    - 이어서 실행하지 않기로 한 기록은 'abandoned' (다시 묻지 않음, 되돌리기는 가능)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.moves: List[PlannedMove] = []
+        self.done = set()  # 이동 완료 번호
+        self.undone = set()  # 되돌린 번호
+        self.finished = False  # 계획 끝까지 실행했는지
+        self.abandoned = False  # 이어서 실행하지 않기로 했는지
+        self.created = ""
+
+    @classmethod
+    def create(cls, plan: MovePlan, journal_dir: str = JOURNAL_DIR) -> 'MoveJournal':
+        """새 작업 기록 (계획 기록까지 디스크에 반영)"""
+        os.makedirs(journal_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        number = 0
+        while True:
+            suffix = f"_{number}" if number else ""
+            path = os.path.join(journal_dir, f"{JOURNAL_PREFIX}{stamp}{suffix}{JOURNAL_SUFFIX}")
+            try:
+                with open(path, 'x', encoding='utf-8'):
+                    pass
+                break
+            except FileExistsError:
+                number += 1
+
+        journal = cls(path)
+        # 실행 위치가 바뀌어도 이어서 실행/되돌리기가 되도록 절대 경로로 기록
+        journal.moves = [PlannedMove(os.path.abspath(move.source), os.path.abspath(move.destination))
+                         for move in plan.moves]
+        journal.created = datetime.now().isoformat(timespec='seconds')
+        journal.append('plan', created=journal.created,
+                       moves=[{'source': move.source, 'destination': move.destination} for move in journal.moves],
+                       sync=True)
+        return journal
+
+    @classmethod
+    def load(cls, path: str) -> 'MoveJournal':
+        """작업 기록 읽기 (마지막 줄이 중간에 끊겼으면 그 줄은 무시). 형식이 잘못되면 ValueError"""
+        journal = cls(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 기록 중 종료된 마지막 줄
+
+                event = record.get('event')
+                if event == 'plan':
+                    journal.created = record.get('created', "")
+                    journal.moves = [PlannedMove(move['source'], move['destination'])
+                                     for move in record.get('moves', [])]
+                elif event == 'move':
+                    journal.done.add(record['index'])
+                elif event == 'undo':
+                    journal.undone.add(record['index'])
+                elif event == 'end':
+                    journal.finished = True
+                elif event == 'abandoned':
+                    journal.abandoned = True
+
+        if not journal.created:
+            raise ValueError(f"계획이 없는 작업 기록입니다: {path}")
+        return journal
+
+    def append(self, event: str, sync: bool = False, **fields):
+        """기록 한 줄 추가 (sync=True면 디스크까지 반영)"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'event': event, **fields}, ensure_ascii=False) + '\n')
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+
+    def abandon(self):
+        """남은 이동을 포기 (다음 실행부터 이어서 실행 대상에서 제외)"""
+        self.append('abandoned', sync=True)
+        self.abandoned = True
+
+    def pending(self) -> List[int]:
+        """아직 실행하지 않은 이동 번호"""
+        return [index for index in range(len(self.moves)) if index not in self.done]
+
+    def undoable(self) -> List[int]:
+        """되돌릴 이동 번호 (나중에 옮긴 것부터)"""
+        return sorted(self.done - self.undone, reverse=True)
+
+
+def list_journals(journal_dir: str = JOURNAL_DIR) -> List[str]:
+    """작업 기록 파일 경로 (오래된 것부터)"""
+    try:
+        with os.scandir(journal_dir) as entries:
+            paths = [entry.path for entry in entries
+                     if entry.name.startswith(JOURNAL_PREFIX) and entry.name.endswith(JOURNAL_SUFFIX)]
+    except FileNotFoundError:
+        return []
+    return sorted(paths)
+
+
+def find_unfinished_journal(journal_dir: str = JOURNAL_DIR) -> Optional[MoveJournal]:
+    """끝나지 않은(중간에 종료된) 가장 최근 작업 기록"""
+    for path in reversed(list_journals(journal_dir)):
+        try:
+            journal = MoveJournal.load(path)
+        except (OSError, ValueError):
+            continue
+        if not journal.finished and not journal.abandoned and not journal.undone and journal.pending():
+            return journal
+    return None
+
+
+def find_last_journal(journal_dir: str = JOURNAL_DIR) -> Optional[MoveJournal]:
+    """되돌릴 이동이 남아 있는 가장 최근 작업 기록"""
+    for path in reversed(list_journals(journal_dir)):
+        try:
+            journal = MoveJournal.load(path)
+        except (OSError, ValueError):
+            continue
+        if journal.undoable():
+            return journal
+    return None
+
+
+# ===== 파일 이동 =====
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    운영체제 안에서 복사 (copy_file_range → sendfile 순, 사용자 메모리로 읽어 오지 않음)
+    둘 다 없거나 이 파일 시스템에서 지원하지 않으면 False (이때는 아무것도 쓰지 않은 상태)
+    중간에 더 복사되지 않으면 OSError (덜 복사된 파일을 완성된 것으로 보지 않음)
+    """
+    for method in ('copy_file_range', 'sendfile'):
+        if not hasattr(os, method):
+            continue
+
+        offset = 0
+        try:
+            while offset < size:
+                count = min(size - offset, KERNEL_COPY_CHUNK)
+                if method == 'copy_file_range':
+                    copied = os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+                else:
+                    copied = os.sendfile(dst_fd, src_fd, offset, count)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError as e:
+            if offset == 0 and e.errno in KERNEL_COPY_UNSUPPORTED:
+                continue  # 이 조합에서는 지원 안 함 → 다음 방식
+            raise
+
+        if offset == 0:
+            continue  # 처음부터 0바이트 (지원하지 않는 파일 시스템) → 다음 방식
+        if offset < size:
+            raise OSError(errno.EIO, f"복사가 중간에 멈췄습니다 ({offset}/{size}바이트)")
+        return True
+    return False
+
+
+def copy_file_contents(source: str, destination: str):
+    """파일 내용 복사 (커널 복사가 안 되면 큰 버퍼로 읽고 쓰기)"""
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size and _kernel_copy(src.fileno(), dst.fileno(), size):
+            return
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def move_file_fast(source: str, destination: str) -> str:
+    """
+    파일 이동 (대상 파일이 없다고 확인된 상태에서 호출)
+    - 같은 드라이브: os.rename (이름만 바꿈)
+    - 다른 드라이브/네트워크: 임시 파일로 복사 → 완성되면 이름 변경 → 원본 삭제
+      (중간에 종료돼도 대상 경로에 덜 복사된 파일이 남지 않음)
+    반환: 'rename' 또는 'copy'
+    """
+    try:
+        os.rename(source, destination)
+        return 'rename'
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    temp_path = destination + PARTIAL_SUFFIX
+    try:
+        copy_file_contents(source, temp_path)
+        # 끝까지 복사된 것을 확인한 뒤에만 대상 파일로 만들고 원본 삭제
+        source_size = os.path.getsize(source)
+        copied_size = os.path.getsize(temp_path)
+        if copied_size != source_size:
+            raise OSError(errno.EIO, f"복사한 파일 크기가 다릅니다 ({copied_size}/{source_size}바이트): {source}")
+        try:
+            shutil.copystat(source, temp_path)  # 수정 시각 유지 (네트워크 드라이브는 권한 문제로 실패할 수 있음)
+        except OSError:
+            pass
+        os.replace(temp_path, destination)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    os.remove(source)
+    return 'copy'
+
+
+def _run_move(move: PlannedMove, move_file) -> str:
+    """이동 하나 실행 (작업 쓰레드). 반환: 'moved' / 'recovered' / 'missing' / 'exists'"""
+    source_exists = os.path.exists(move.source)
+    destination_exists = os.path.exists(move.destination)
+    if not source_exists:
+        # 이동 후 기록 전에 종료된 경우 → 이미 옮겨진 것
+        return 'recovered' if destination_exists else 'missing'
+    if destination_exists:
+        return 'exists'
+    move_file(move.source, move.destination)
+    return 'moved'
+
+
+# ===== 실행 / 되돌리기 =====
+def execute_journal(journal: MoveJournal, on_progress=None, move_file=move_file_fast,
+                    workers: int = MOVE_WORKERS, stop_event=None) -> Dict:
+    """
+    작업 기록의 남은 이동 실행 (처음 실행과 이어서 실행 모두)
+    - 파일 이동은 크기가 정해진 쓰레드 풀에서 동시에 (다른 드라이브 간 복사도 여러 개 동시에)
+    - 작업 기록/진행 알림은 이 함수를 호출한 쓰레드에서만 (기록 파일에 한 줄씩 순서대로)
+    on_progress(done, total, message): 파일 하나 처리할 때마다
+    stop_event가 설정되면 새 이동은 시작하지 않음 (기록이 끝나지 않은 상태 → 나중에 이어서 실행)
+    반환: {'moved': 수, 'recovered': 수, 'failed': [메시지, ...], 'stopped': 중지 여부}
+    """
+    result = {'moved': 0, 'recovered': 0, 'failed': [], 'stopped': False}
+    workers = max(1, workers)
+    pending = journal.pending()
+    total = len(journal.moves)
+    done_count = total - len(pending)
+
+    # 타겟 폴더는 미리 한 번씩 생성 (작업 쓰레드끼리 같은 폴더를 만들지 않도록)
+    failed_targets = {}
+    for target in dict.fromkeys(journal.moves[index].target for index in pending):
+        try:
+            os.makedirs(target, exist_ok=True)
+        except OSError as e:
+            failed_targets[target] = e
+
+    def handle(index, outcome, error):
+        move = journal.moves[index]
+        if error is not None:
+            message = f"이동 실패: {move.source} -> {move.destination} ({error})"
+            result['failed'].append(message)
+            journal.append('failed', index=index, error=str(error))
+        elif outcome == 'missing':
+            message = f"경고: 이동하려던 파일 '{os.path.basename(move.source)}'을(를) 찾을 수 없습니다. 건너뜁니다."
+            result['failed'].append(message)
+            journal.append('failed', index=index, error="source missing")
+        elif outcome == 'exists':
+            message = f"경고: 대상 파일이 이미 있습니다: {move.destination}. 건너뜁니다."
+            result['failed'].append(message)
+            journal.append('failed', index=index, error="destination exists")
+        else:
+            journal.append('move', index=index, **({'recovered': True} if outcome == 'recovered' else {}))
+            journal.done.add(index)
+            result[outcome] += 1
+            message = (f"이동: {os.path.basename(move.source)} -> "
+                       f"{os.path.join(os.path.basename(move.target), os.path.basename(move.destination))}")
+        return message
+
+    queue = deque(pending)
+    running = {}  # future → 이동 번호
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while queue or running:
+            # 동시에 실행 중인 이동은 쓰레드 수의 몇 배까지만 (중지 요청이 빨리 반영되도록)
+            while queue and len(running) < workers * 2 and not (stop_event and stop_event.is_set()):
+                index = queue.popleft()
+                target = journal.moves[index].target
+                if target in failed_targets:
+                    done_count += 1
+                    message = handle(index, None, failed_targets[target])
+                    if on_progress:
+                        on_progress(done_count, total, message)
+                    continue
+                running[executor.submit(_run_move, journal.moves[index], move_file)] = index
+
+            if stop_event and stop_event.is_set():
+                queue.clear()
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = running.pop(future)
+                try:
+                    message = handle(index, future.result(), None)
+                except Exception as e:
+                    message = handle(index, None, e)
+                done_count += 1
+                if on_progress:
+                    on_progress(done_count, total, message)
+
+    if stop_event and stop_event.is_set() and journal.pending():
+        result['stopped'] = True
+        return result
+
+    journal.append('end', sync=True)
+    journal.finished = True
+    return result
+
+
+def rollback_journal(journal: MoveJournal, on_progress=None, move_file=move_file_fast) -> Dict:
+    """
+    작업 기록을 거꾸로 따라가며 옮긴 파일을 원래 위치로 (중간에 멈춰도 다시 실행하면 이어서)
+    반환: {'restored': 수, 'skipped': [메시지, ...]}
+    """
+    result = {'restored': 0, 'skipped': []}
+    undoable = journal.undoable()
+
+    for position, index in enumerate(undoable, 1):
+        move = journal.moves[index]
+        if not os.path.exists(move.destination):
+            message = f"되돌리기 건너뜀 (이동된 파일 없음): {move.destination}"
+            result['skipped'].append(message)
+        elif os.path.exists(move.source):
+            message = f"되돌리기 건너뜀 (원래 위치에 같은 이름 파일 있음): {move.source}"
+            result['skipped'].append(message)
+        else:
+            try:
+                os.makedirs(os.path.dirname(move.source), exist_ok=True)
+                move_file(move.destination, move.source)
+            except OSError as e:
+                message = f"되돌리기 실패: {move.destination} -> {move.source} ({e})"
+                result['skipped'].append(message)
+            else:
+                journal.append('undo', index=index)
+                journal.undone.add(index)
+                result['restored'] += 1
+                message = f"되돌림: {os.path.basename(move.destination)} -> {move.source}"
+
+        if on_progress:
+            on_progress(position, len(undoable), message)
+
+    journal.append('rollback_end', sync=True)
+    return result
@@ -1,13 +1,18 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, messagebox, ttk, scrolledtext
 import os
-import shutil
-import random
 import json
+import threading
+
+from Photo_mover_engine import (
+    MoveJournal, build_move_plan, execute_journal, find_last_journal, find_unfinished_journal, rollback_journal
+)
+from Gui_update_channel import UIUpdateChannel
 # import datetime # 필요시 타임스탬프 파일명 제안에 사용 가능
 
-# 지원할 사진 확장자 목록
-PHOTO_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']
+# 미리보기 창에 보여줄 최대 이동 수
+PREVIEW_MAX_MOVES = 500
+
 
 class PhotoOrganizerApp:
     def __init__(self, root):
@@ -19,6 +24,8 @@ class PhotoOrganizerApp:
         self.targets = []
         self.filename_option = tk.StringVar(value="category_prefix")
         self.selection_mode_option = tk.StringVar(value="sequential")
+        self.is_processing = False  # 계획/이동/되돌리기 작업 쓰레드 실행 중
+        self.stop_event = threading.Event()  # 이동 중지 요청
 
         # --- 스타일 설정 ---
         style = ttk.Style()
@@ -94,8 +101,14 @@ class PhotoOrganizerApp:
         ttk.Radiobutton(selection_mode_frame, text="무작위(랜덤)로 추출",
                 variable=self.selection_mode_option, value="random").pack(anchor="w")
 
-        # 실행 버튼
-        ttk.Button(root, text="✨ 실행 ✨", command=self.execute_processing, style="Accent.TButton").pack(pady=15, ipady=5)
+        # 실행 버튼 (미리보기: 이동 계획만 확인, 되돌리기: 마지막 작업 기록을 역순으로)
+        run_button_frame = ttk.Frame(root)
+        run_button_frame.pack(pady=15)
+        ttk.Button(run_button_frame, text="계획 미리보기", command=self.preview_plan).pack(side=tk.LEFT, padx=5)
+        ttk.Button(run_button_frame, text="✨ 실행 ✨", command=self.execute_processing,
+                   style="Accent.TButton").pack(side=tk.LEFT, padx=5, ipady=5)
+        ttk.Button(run_button_frame, text="중지", command=self.stop_processing).pack(side=tk.LEFT, padx=5)
+        ttk.Button(run_button_frame, text="마지막 실행 되돌리기", command=self.rollback_last_run).pack(side=tk.LEFT, padx=5)
         style.configure("Accent.TButton", font=('Helvetica', 12, 'bold'))
 
         # 전체 설정 저장/불러오기 버튼
@@ -107,6 +120,11 @@ class PhotoOrganizerApp:
         # 상태 표시
         self.status_label = ttk.Label(root, text="준비 완료. 설정을 불러오거나 새로 만드세요.", relief=tk.SUNKEN, anchor="w", padding=5)
         self.status_label.pack(side=tk.BOTTOM, fill="x")
+        self.progress_bar = ttk.Progressbar(root, mode='determinate')
+        self.progress_bar.pack(side=tk.BOTTOM, fill="x", padx=10, pady=(0, 5))
+
+        # 상태 표시 채널: 파일마다 다시 그리지 않고 주기적으로 마지막 메시지만 반영
+        self.ui = UIUpdateChannel(self.root)
 
     def browse_source_folder(self):
         path = filedialog.askdirectory()
@@ -190,126 +208,177 @@ class PhotoOrganizerApp:
         self.update_status(f"타겟 폴더 삭제됨: {os.path.basename(path_to_remove)}")
 
     def update_status(self, message):
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
-        
-    def get_available_photos(self, folder_path, count):
-        photos_in_folder = []
-        try:
-            all_files = os.listdir(folder_path)
-            for filename in all_files:
-                if any(filename.lower().endswith(ext) for ext in PHOTO_EXTENSIONS):
-                    photos_in_folder.append(os.path.join(folder_path, filename))
-        except FileNotFoundError:
-            self.update_status(f"오류: 소스 폴더를 찾을 수 없습니다 - {folder_path}")
-            return []
-        except Exception as e:
-            self.update_status(f"오류: {folder_path} 파일 읽기 중 오류 - {e}")
-            return []
-
-        if not photos_in_folder:
-            return []
-
-        current_selection_mode = self.selection_mode_option.get()
-
-        if len(photos_in_folder) < count:
-            self.update_status(f"경고: {os.path.basename(folder_path)} 폴더에 사진이 {len(photos_in_folder)}장만 있어 요청된 {count}장보다 적습니다. 있는 사진만 가져옵니다.")
-            if current_selection_mode == "random":
-                random.shuffle(photos_in_folder)
-            else: # sequential
-                photos_in_folder.sort()
-            return photos_in_folder
-
-        if current_selection_mode == "random":
-            return random.sample(photos_in_folder, count)
-        else: # sequential
-            photos_in_folder.sort()
-            return photos_in_folder[:count]
-
-    def generate_new_filename(self, original_filepath, category_name, target_folder):
-        original_filename = os.path.basename(original_filepath)
-        name_part, ext_part = os.path.splitext(original_filename)
-        
-        option = self.filename_option.get()
-        new_filename = original_filename 
-
-        if option == "category_prefix":
-            new_filename = f"{category_name}_{original_filename}"
-        elif option == "original_number":
-            counter = 1
-            if not os.path.exists(os.path.join(target_folder, original_filename)):
-                new_filename = original_filename
-            else:
-                new_filename = f"{name_part}_{counter}{ext_part}"
-                while os.path.exists(os.path.join(target_folder, new_filename)):
-                    counter += 1
-                    new_filename = f"{name_part}_{counter}{ext_part}"
-        elif option == "category_sequential":
-            number = 1
-            new_filename_base = category_name
-            new_filename = f"{new_filename_base}{number}{ext_part}"
-            while os.path.exists(os.path.join(target_folder, new_filename)):
-                number += 1
-                new_filename = f"{new_filename_base}{number}{ext_part}"
-        return new_filename
-        
-    def execute_processing(self):
+        # 어느 쓰레드에서나 호출 가능 (메인 쓰레드가 주기마다 마지막 메시지만 반영)
+        self.ui.post_latest('status', self.status_label.config, text=message)
+
+    def update_progress(self, done, total, message):
+        """작업 쓰레드의 파일별 진행 알림 → 진행 막대/상태 표시 (마지막 값만 반영)"""
+        self.ui.post_latest('progress', self.progress_bar.config, maximum=max(total, 1), value=done)
+        self.update_status(f"({done}/{total}) {message}")
+
+    def run_in_background(self, work, on_done):
+        """
+        work()를 작업 쓰레드에서 실행하고 결과를 메인 쓰레드의 on_done(result)로 전달
+        (실행 중에는 다른 작업을 시작하지 않음)
+        """
+        if self.is_processing:
+            messagebox.showwarning("작업 중", "이미 작업이 진행 중입니다. 끝난 뒤 다시 시도해주세요.")
+            return
+        self.is_processing = True
+        self.stop_event.clear()
+
+        def worker():
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self.ui.post(self.finish_background, on_done, result, error)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def finish_background(self, on_done, result, error):
+        self.is_processing = False
+        if error is not None:
+            messagebox.showerror("오류", f"작업 중 오류 발생: {error}")
+            self.update_status(f"오류: {error}")
+            return
+        on_done(result)
+
+    def stop_processing(self):
+        """진행 중인 이동 중지 (실행 중인 파일은 마저 옮기고, 남은 파일은 나중에 이어서 실행)"""
+        if self.is_processing:
+            self.stop_event.set()
+            self.update_status("중지 요청: 진행 중인 파일까지만 옮기고 멈춥니다...")
+
+    def plan_task(self):
+        """현재 설정으로 이동 계획을 계산하는 작업 (설정 값은 메인 쓰레드에서 미리 읽어 둠)"""
+        sources = [source.copy() for source in self.sources]
+        targets = list(self.targets)
+        filename_option = self.filename_option.get()
+        selection_mode = self.selection_mode_option.get()
+        self.update_status("이동 계획 계산 중...")
+        return lambda: build_move_plan(sources, targets, filename_option, selection_mode)
+
+    def check_inputs(self):
         if not self.sources:
             messagebox.showerror("오류", "소스 폴더가 하나 이상 필요합니다.")
-            return
+            return False
         if not self.targets:
             messagebox.showerror("오류", "타겟 폴더가 하나 이상 필요합니다.")
+            return False
+        return True
+
+    def preview_plan(self):
+        """실행하지 않고 이동 계획만 보여줌 (미리보기)"""
+        if not self.check_inputs():
+            return
+        self.run_in_background(self.plan_task(), self.show_plan)
+
+    def show_plan(self, plan):
+        window = tk.Toplevel(self.root)
+        window.title("이동 계획 미리보기")
+        window.geometry("760x520")
+        text = scrolledtext.ScrolledText(window, wrap=tk.NONE, font=('Consolas', 9))
+        text.pack(fill="both", expand=True, padx=10, pady=10)
+
+        lines = plan.summary_lines()
+        lines.append("\n[타겟별 파일 수]")
+        lines.extend(f"  {os.path.basename(target)}: {count}개" for target, count in plan.target_counts().items())
+        lines.append(f"\n[이동 목록] (최대 {PREVIEW_MAX_MOVES}개 표시)")
+        lines.extend(f"  {move.source} -> {move.destination}" for move in plan.moves[:PREVIEW_MAX_MOVES])
+        text.insert(tk.END, '\n'.join(lines))
+        text.config(state=tk.DISABLED)
+        ttk.Button(window, text="닫기", command=window.destroy).pack(pady=(0, 10))
+
+        self.update_status(f"미리보기: {len(plan.moves)}개 파일 이동 예정")
+
+    def execute_processing(self):
+        """이동 계획 계산 → 확인 → 작업 기록을 남기며 실행 (중단된 작업이 있으면 이어서 실행)"""
+        if self.is_processing:
+            messagebox.showwarning("작업 중", "이미 작업이 진행 중입니다. 끝난 뒤 다시 시도해주세요.")
+            return
+
+        journal = find_unfinished_journal()
+        if journal:
+            if messagebox.askyesno(
+                    "중단된 작업",
+                    f"끝나지 않은 작업이 있습니다 ({journal.created}, {len(journal.pending())}개 파일 남음).\n\n"
+                    f"이어서 실행하시겠습니까?\n(아니오: 새 계획으로 실행, 이 작업은 다시 묻지 않음)"):
+                self.run_journal(journal)
+                return
+            try:
+                journal.abandon()
+            except OSError as e:
+                messagebox.showwarning("작업 기록", f"작업 기록을 갱신하지 못했습니다: {e}")
+
+        if not self.check_inputs():
+            return
+        self.run_in_background(self.plan_task(), self.confirm_and_run)
+
+    def confirm_and_run(self, plan):
+        """계획 확인 (문제가 있으면 물어봄) 후 실행"""
+        if not plan.moves:
+            messagebox.showinfo("작업 없음", '\n'.join(plan.summary_lines()) + "\n\n옮길 사진이 없습니다.")
+            self.update_status("옮길 사진이 없습니다.")
+            return
+        if plan.has_issues and not messagebox.askyesno(
+                "계획 확인", '\n'.join(plan.summary_lines(limit=8)) + "\n\n이대로 실행하시겠습니까?"):
+            self.update_status("실행이 취소되었습니다.")
             return
 
+        try:
+            journal = MoveJournal.create(plan)
+        except OSError as e:
+            messagebox.showerror("오류", f"작업 기록 파일을 만들 수 없습니다: {e}")
+            return
+        self.run_journal(journal)
+
+    def run_journal(self, journal):
+        """작업 기록의 남은 이동을 작업 쓰레드에서 실행 (화면은 진행 알림만 받음)"""
         self.update_status("사진 정리 작업 시작...")
-        processed_targets = 0
-        total_files_moved = 0
+        self.run_in_background(
+            lambda: execute_journal(journal, on_progress=self.update_progress, stop_event=self.stop_event),
+            lambda result: self.show_run_result(journal, result)
+        )
 
-        for target_idx, target_path in enumerate(self.targets):
-            self.update_status(f"'{os.path.basename(target_path)}' 폴더 작업 중... ({target_idx + 1}/{len(self.targets)})")
-            if not os.path.exists(target_path):
-                try:
-                    os.makedirs(target_path, exist_ok=True)
-                except OSError as e:
-                    messagebox.showerror("오류", f"타겟 폴더 생성 실패: {target_path}\n{e}")
-                    continue
-
-            files_in_current_target = 0
-            current_sources_snapshot = [src.copy() for src in self.sources]
-
-            for source_info in current_sources_snapshot:
-                source_folder_path = source_info['path']
-                files_to_take = source_info['count']
-                category_name = os.path.basename(source_folder_path)
-
-                photos_to_move = self.get_available_photos(source_folder_path, files_to_take)
-
-                if not photos_to_move:
-                    self.update_status(f"정보: '{category_name}' 폴더에서 '{os.path.basename(target_path)}'로 가져올 사진이 없습니다.")
-                    continue
-
-                for photo_path in photos_to_move:
-                    try:
-                        new_filename = self.generate_new_filename(photo_path, category_name, target_path)
-                        destination_path = os.path.join(target_path, new_filename)
-                        
-                        shutil.move(photo_path, destination_path)
-                        total_files_moved += 1
-                        files_in_current_target +=1
-                        self.update_status(f"이동: {os.path.basename(photo_path)} -> {os.path.join(os.path.basename(target_path), new_filename)}")
-                    except FileNotFoundError:
-                        self.update_status(f"경고: 이동하려던 파일 '{os.path.basename(photo_path)}'을(를) 찾을 수 없습니다. 건너뜁니다.")
-                        continue
-                    except Exception as e:
-                        messagebox.showerror("이동 오류", f"파일 이동 중 오류 발생:\n{photo_path} -> {target_path}\n{e}")
-                        continue 
-            
-            self.update_status(f"'{os.path.basename(target_path)}' 폴더에 {files_in_current_target}개 파일 정리 완료.")
-            processed_targets += 1
-        
-        final_message = f"총 {processed_targets}개 타겟 폴더 작업 완료. 총 {total_files_moved}개 파일 이동됨."
-        self.update_status(final_message)
-        messagebox.showinfo("작업 완료", final_message)
+    def show_run_result(self, journal, result):
+        moved = result['moved'] + result['recovered']
+        if result['stopped']:
+            final_message = (f"작업이 중지되었습니다. {moved}개 파일 이동됨, {len(journal.pending())}개 남음.\n"
+                             f"다시 실행하면 이어서 진행할 수 있습니다.")
+        else:
+            targets = {journal.moves[index].target for index in journal.done}
+            final_message = f"총 {len(targets)}개 타겟 폴더 작업 완료. 총 {moved}개 파일 이동됨."
+        if result['failed']:
+            final_message += f"\n\n건너뛴 파일 {len(result['failed'])}개:\n" + '\n'.join(result['failed'][:10])
+        final_message += f"\n\n작업 기록: {journal.path}"
+        self.update_status(final_message.split('\n')[0])
+        messagebox.showinfo("작업 중지" if result['stopped'] else "작업 완료", final_message)
+
+    def rollback_last_run(self):
+        """가장 최근 작업을 기록의 역순으로 되돌림 (작업 쓰레드에서)"""
+        if self.is_processing:
+            messagebox.showwarning("작업 중", "이미 작업이 진행 중입니다. 끝난 뒤 다시 시도해주세요.")
+            return
+
+        journal = find_last_journal()
+        if journal is None:
+            messagebox.showinfo("되돌리기", "되돌릴 작업 기록이 없습니다.")
+            return
+        if not messagebox.askyesno(
+                "되돌리기", f"{journal.created} 작업에서 옮긴 파일 {len(journal.undoable())}개를 "
+                           f"원래 위치로 되돌리시겠습니까?"):
+            return
+
+        self.run_in_background(lambda: rollback_journal(journal, on_progress=self.update_progress),
+                               self.show_rollback_result)
+
+    def show_rollback_result(self, result):
+        final_message = f"{result['restored']}개 파일을 원래 위치로 되돌렸습니다."
+        if result['skipped']:
+            final_message += f"\n\n건너뛴 파일 {len(result['skipped'])}개:\n" + '\n'.join(result['skipped'][:10])
+        self.update_status(final_message.split('\n')[0])
+        messagebox.showinfo("되돌리기 완료", final_message)
 
     def save_settings(self):
         filepath = filedialog.asksaveasfilename(